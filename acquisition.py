@@ -37,44 +37,29 @@ import time
 from colorama import Fore, Style
 import datetime
 from platformdirs import user_config_dir
-from utils import ASCII_ART, clear_and_print_ascii, get_skip_dirs_from_config
+from utils import ASCII_ART, clear_and_print_ascii, get_skip_dirs_from_config, get_config, write_config_text, update_config_values, walk_library, list_library_folder
+import pipeline
+import runlog
+import metrics
+import profiling
+import decisions
 SNAPSHOT_DIR = Path(__file__).parent.resolve()
 BANNER_LINE = f"                   {Style.BRIGHT}{Fore.RED}[Phase 3/4]{Style.RESET_ALL} Subtitle Acquisition"
 CONFIG_PATH = SNAPSHOT_DIR / '.config'
-run_counter = 1
-if CONFIG_PATH.exists():
-    with CONFIG_PATH.open(encoding='utf-8') as f:
-        for line in f:
-            if line.strip().lower().startswith('run_counter') and '=' in line:
-                try:
-                    run_counter = int(line.split('=', 1)[1].strip())
-                except Exception:
-                    run_counter = 1
-                break
-LOGS_DIR = SNAPSHOT_DIR / 'logs' / f'Subservient-run-{run_counter}'
-LOGS_DIR.mkdir(exist_ok=True)
-existing_log = None
-for fname in LOGS_DIR.iterdir():
-    if fname.name.startswith('acquisition_log') and fname.name.endswith('.txt'):
-        existing_log = fname
-        break
-if existing_log:
-    LOG_FILE = existing_log
-    with LOG_FILE.open('r+', encoding='utf-8') as f:
-        content = f.read()
-        part_count = content.count('Acquisition - part') + 1
-        if f.tell() > 0:
-            f.write('\n')
-        f.write(f'Acquisition - part {part_count}\n')
-else:
-    log_time = datetime.datetime.now().strftime('%d-%m-%Y_%H.%M.%S')
-    LOG_FILE = LOGS_DIR / f"acquisition_log_{log_time}.txt"
-    with LOG_FILE.open('a', encoding='utf-8') as f:
-        f.write(f'Acquisition - part 1\n')
-ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m|\033\[[0-9;]*m')
-def strip_ansi(text):
-    """Remove ANSI color codes from text."""
-    return ANSI_ESCAPE.sub('', text)
+def open_run_log():
+    """Open this run's acquisition log and start collecting metrics into the same logs folder."""
+    global RUN_LOG
+    try:
+        run_counter = int(get_config(CONFIG_PATH).get('run_counter', 1))
+    except ValueError:
+        run_counter = 1
+    LOGS_DIR = SNAPSHOT_DIR / 'logs' / f'Subservient-run-{run_counter}'
+    LOGS_DIR.mkdir(exist_ok=True)
+    RUN_LOG = runlog.open_phase_log(LOGS_DIR, "acquisition", structured=get_config(CONFIG_PATH).get_bool('json_log'))
+    metrics.configure(LOGS_DIR, get_config(CONFIG_PATH).get('prometheus_textfile_dir', ''))
+    RUN_LOG.write(ASCII_ART + '\n')
+    banner = BANNER_LINE.replace('[Phase 3/4]', f'{Style.BRIGHT}{Fore.RED}[Phase 3/4]{Style.RESET_ALL}{Style.BRIGHT}')
+    RUN_LOG.write(banner + '\n\n')
 
 def acq_tag():
     """Return formatted acquisition tag for console output."""
@@ -82,29 +67,24 @@ def acq_tag():
 
 def exit_with_prompt(message="Press any key to exit..."):
     """Display message and wait for user input before exiting."""
+    if decisions.headless():
+        print(f"{acq_tag()} Exiting.")
+        sys.exit(1)
     try:
         input(f"{acq_tag()} {message}")
     except EOFError:
         os.system("pause")
     sys.exit(1)
 
-with LOG_FILE.open('a+', encoding='utf-8') as f:
-    f.write(strip_ansi(ASCII_ART) + '\n')
-    banner = BANNER_LINE.replace('[Phase 3/4]', f'{Style.BRIGHT}{Fore.RED}[Phase 3/4]{Style.RESET_ALL}{Style.BRIGHT}')
-    f.write(strip_ansi(banner) + '\n\n')
-
-def print_and_log(msg, end='\n'):
+def print_and_log(msg, end='\n', **fields):
     """Print message to console and write to log file."""
     print(msg, end=end)
-    with LOG_FILE.open('a', encoding='utf-8') as f:
-        f.write(strip_ansi(msg) + ('' if end == '' else end))
+    RUN_LOG.event(msg, end=end, **fields)
 
-def print_and_log_colored(msg, color=Fore.WHITE, end='\n'):
+def print_and_log_colored(msg, color=Fore.WHITE, end='\n', **fields):
     """Print colored message to console and log plain text to file."""
     print(f"{color}{msg}{Style.RESET_ALL}", end=end)
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        f.write(strip_ansi(msg) + ('' if end == '' else end))
-clear_and_print_ascii(BANNER_LINE)
+    RUN_LOG.event(msg, end=end, **fields)
 def get_subservient_anchor():
     """Get the Subservient anchor directory from pathfiles config."""
     config_dir = Path(user_config_dir()) / "Subservient"
@@ -120,11 +100,6 @@ def get_subservient_anchor():
     clear_and_print_ascii(BANNER_LINE)
     print_and_log(f"\033[1;31m[ERROR]\033[0m subservient_anchor not found in Subservient_pathfiles. Please run subordinate.py again.")
     exit_with_prompt()
-clear_and_print_ascii(BANNER_LINE)
-anchor_dir = get_subservient_anchor()
-os.chdir(anchor_dir)
-__file__ = str((anchor_dir / Path(__file__).name).resolve())
-CONFIG_PATH = SNAPSHOT_DIR / '.config'
 missing_queries = []
 REQUIRED_SETUP_KEYS = [
     'api_url',
@@ -145,20 +120,7 @@ def read_setup_from_config():
         clear_and_print_ascii(BANNER_LINE)
         print_and_log(f"\033[1;31m[ERROR]\033[0m .config not found!\n\nCreate a valid config or reset it via subordinate.py.")
         exit_with_prompt()
-    lines = CONFIG_PATH.read_text(encoding='utf-8').splitlines()
-    setup = {}
-    in_setup = False
-    for line in lines:
-        if line.strip().lower() == '[setup]':
-            in_setup = True
-            continue
-        if in_setup:
-            if line.strip().startswith('[') and line.strip().lower() != '[setup]':
-                break
-            if line.strip() and not line.strip().startswith('#'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    setup[key.strip()] = value.strip().strip('"')
+    setup = dict(get_config(CONFIG_PATH).setup)
     missing = [k for k in REQUIRED_SETUP_KEYS if k not in setup or not setup[k]]
     if missing:
         clear_and_print_ascii(BANNER_LINE)
@@ -169,17 +131,22 @@ def read_setup_from_config():
         exit_with_prompt()
     setup['series_mode'] = parse_bool(setup['series_mode'])
     return setup
-setup = read_setup_from_config()
-PAUSE_SECONDS = float(setup.get("pause_seconds", 3))
-API_URL = setup['api_url']
-API_KEY = setup['api_key']
-USERNAME = setup['username']
-PASSWORD = setup['password']
-LANGUAGES = [lang.strip() for lang in setup['languages'].split(',') if lang.strip()]
-MAX_SEARCH_RESULTS = int(setup.get('max_search_results', 50))
-TOP_DOWNLOADS = int(setup['top_downloads'])
-DOWNLOAD_RETRY_503 = int(setup.get('download_retry_503', 6))
-SERIES_MODE = setup['series_mode']
+def load_setup():
+    """Read the [SETUP] settings acquisition uses; exits with a prompt when required ones are missing."""
+    global API_KEY, API_URL, DOWNLOAD_RETRY_503, LANGUAGES, MAX_SEARCH_RESULTS, PASSWORD
+    global PAUSE_SECONDS, SERIES_MODE, TOP_DOWNLOADS, UNWANTED_TERMS, USERNAME, setup
+    setup = read_setup_from_config()
+    PAUSE_SECONDS = float(setup.get("pause_seconds", 3))
+    API_URL = setup['api_url']
+    API_KEY = setup['api_key']
+    USERNAME = setup['username']
+    PASSWORD = setup['password']
+    LANGUAGES = [lang.strip() for lang in setup['languages'].split(',') if lang.strip()]
+    MAX_SEARCH_RESULTS = int(setup.get('max_search_results', 50))
+    TOP_DOWNLOADS = int(setup['top_downloads'])
+    DOWNLOAD_RETRY_503 = int(setup.get('download_retry_503', 6))
+    SERIES_MODE = setup['series_mode']
+    UNWANTED_TERMS = get_unwanted_terms_from_config()
 
 def write_runtime_blocks_to_config(token=None, skipped_entries=None):
     """Write runtime configuration blocks to config file."""
@@ -189,10 +156,7 @@ def write_runtime_blocks_to_config(token=None, skipped_entries=None):
     SKIPPED_COMMENT = 'List of movies that were skipped manually. Remove an entry below in order to make it appear again.'
     SKIPPED_TAG = '[skipped_movies]'
     RUNTIME_TAG = '[RUNTIME]'
-    if not CONFIG_PATH.exists():
-        lines = []
-    else:
-        lines = CONFIG_PATH.read_text(encoding='utf-8').splitlines()
+    lines = get_config(CONFIG_PATH).lines
     out = []
     for line in lines:
         if line.strip().lower() == RUNTIME_TAG.lower():
@@ -231,31 +195,14 @@ def write_runtime_blocks_to_config(token=None, skipped_entries=None):
         out.append('')
     out.extend(runtime_blocks)
     out.append('')
-    CONFIG_PATH.write_text('\n'.join(out), encoding='utf-8')
+    write_config_text(CONFIG_PATH, '\n'.join(out))
 def set_token_in_config(token):
     """Store JWT token in config file."""
     write_runtime_blocks_to_config(token=token)
 
 def get_token_from_config():
     """Retrieve JWT token from config file."""
-    if not CONFIG_PATH.exists():
-        return None
-    lines = CONFIG_PATH.read_text(encoding='utf-8').splitlines()
-    for i, line in enumerate(lines):
-        if line.strip() == '[token]':
-            j = i + 1
-            while j < len(lines):
-                value = lines[j].strip()
-                if value and not value.startswith('[') and not value.startswith('--') and not value.startswith('#'):
-                    return value
-                elif value.startswith('[') or value.startswith('--'):
-                    break
-                j += 1
-        elif line.strip().startswith('token ='):
-            parts = line.split('=', 1)
-            if len(parts) == 2:
-                return parts[1].strip()
-    return None
+    return get_config(CONFIG_PATH).token
 
 def get_jwt_token():
     """Obtain JWT token through API authentication."""
@@ -273,8 +220,10 @@ def get_jwt_token():
         "username": USERNAME,
         "password": PASSWORD
     }
-    response = requests.post(
+    response = metrics.request(
+        "POST",
         login_url,
+        "api_login",
         headers=login_headers,
         json=login_payload
     )
@@ -305,24 +254,14 @@ def get_jwt_token():
 
 def get_unwanted_terms_from_config():
     """Read unwanted_terms setting from config file."""
-    if not CONFIG_PATH.exists():
-        return []
-    lines = CONFIG_PATH.read_text(encoding='utf-8').splitlines()
-    for line in lines:
-        if line.strip().lower().startswith('unwanted_terms') and '=' in line:
-            _, value = line.split('=', 1)
-            return [term.strip().strip('"') for term in value.split(',') if term.strip()]
-    return []
-UNWANTED_TERMS = get_unwanted_terms_from_config()
+    return list(get_config(CONFIG_PATH).unwanted_terms)
 
 def clean_title(raw_title: str) -> str:
     """Clean and normalize video title for subtitle searching."""
-    UNWANTED_TERMS = get_unwanted_terms_from_config()
     UNWANTED_CHARS = r"[\[\]\(\)\{\}_\+\.-]"
     WHITELIST = {"a", "i", "z", "o", "u"}
     cleaned = raw_title.replace('.', ' ')
-    pattern = r"\\b(" + "|".join(re.escape(term) for term in UNWANTED_TERMS) + r")\\b"
-    cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+    cleaned = get_config(CONFIG_PATH).unwanted_terms_regex.sub("", cleaned)
     cleaned = re.sub(r"[\[\(\{][^\]\)\}]*[\]\)\}]", "", cleaned)
     cleaned = re.sub(r"\\b(?!(?:19|20)\\d{2})\\d+\\b", "", cleaned)
     cleaned = re.sub(UNWANTED_CHARS, " ", cleaned)
@@ -403,7 +342,7 @@ def download_top_subtitles(subs, lang, dest_folder, jwt_token, mkv_path=None, ca
             
             for attempt in range(1, max_retries_503 + 1):
                 try:
-                    resp = requests.post(url, headers=headers, json={"file_id": file_id})
+                    resp = metrics.request("POST", url, "api_download", retries=attempt - 1, headers=headers, json={"file_id": file_id})
                 except Exception as e:
                     print_and_log_colored(f"{acq_tag()} {Fore.RED}HTTP POST error: {e}{Style.RESET_ALL}", Fore.RED)
                     resp = None
@@ -431,7 +370,7 @@ def download_top_subtitles(subs, lang, dest_folder, jwt_token, mkv_path=None, ca
                     if download_link:
                         for srt_attempt in range(1, max_retries_503 + 1):
                             try:
-                                srt_resp = requests.get(download_link)
+                                srt_resp = metrics.request("GET", download_link, "srt_download", retries=srt_attempt - 1)
                             except Exception as e:
                                 print_and_log_colored(f"{acq_tag()} {Fore.RED}HTTP GET error: {e}{Style.RESET_ALL}", Fore.RED)
                                 srt_resp = None
@@ -459,7 +398,7 @@ def download_top_subtitles(subs, lang, dest_folder, jwt_token, mkv_path=None, ca
                                 dest_path = dest_folder / file_name
                                 with open(dest_path, 'wb') as f:
                                     f.write(srt_data)
-                                print_and_log_colored(f"Stored as: {os.path.basename(dest_path)}", Fore.GREEN)
+                                print_and_log_colored(f"Stored as: {os.path.basename(dest_path)}", Fore.GREEN, language=lang, candidate=file_name)
                                 for failed_file in get_subtitle_files_by_pattern(dest_folder, lang, ".FAILED"):
                                     drift_file = failed_file.with_name(failed_file.name.replace(".FAILED.srt", ".DRIFT.srt"))
                                     failed_file.rename(drift_file)
@@ -647,7 +586,7 @@ def search_subtitles(movie_path: Path, jwt_token: str):
                 print_and_log_colored(f"{acq_tag()} {Fore.LIGHTYELLOW_EX}{search_term_msg}{Style.RESET_ALL}")
                 print_and_log(f"{acq_tag()} {search_term_msg}")
                 print_and_log(f"{acq_tag()} {Fore.YELLOW}Broader search: performing unfiltered search for {lang.upper()}!{Style.RESET_ALL}")
-                response_unfiltered = requests.get(f"{API_URL}/subtitles", headers=headers, params=params_unfiltered)
+                response_unfiltered = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params_unfiltered)
                 time.sleep(0.5)
                 if response_unfiltered.status_code == 200:
                     data_unfiltered = response_unfiltered.json()
@@ -782,7 +721,7 @@ def search_subtitles(movie_path: Path, jwt_token: str):
                 "User-Agent": "NexigenSubtitleBot v1.0",
                 "Api-Key": API_KEY
             }
-            response = requests.get(f"{API_URL}/subtitles", headers=headers, params=params)
+            response = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params)
             time.sleep(0.5)
             if response.status_code == 200:
                 data = response.json()
@@ -806,7 +745,7 @@ def search_subtitles(movie_path: Path, jwt_token: str):
                 print_and_log(f"{acq_tag()} No results without a filter, trying fallback search...")
                 fallback_query = clean_title(raw_title)
                 params["query"] = fallback_query
-                response = requests.get(f"{API_URL}/subtitles", headers=headers, params=params)
+                response = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params)
                 time.sleep(0.5)
                 if response.status_code == 200:
                     data = response.json()
@@ -849,7 +788,7 @@ def search_subtitles(movie_path: Path, jwt_token: str):
             "User-Agent": "NexigenSubtitleBot v1.0",
             "Api-Key": API_KEY
         }
-        response = requests.get(f"{API_URL}/subtitles", headers=headers, params=params)
+        response = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params)
         time.sleep(0.5)
         if response.status_code == 200:
             data = response.json()
@@ -894,7 +833,7 @@ def search_subtitles(movie_path: Path, jwt_token: str):
             fallback_query = clean_title(raw_title)
             params_fallback = dict(params)
             params_fallback["query"] = fallback_query
-            response_fallback = requests.get(f"{API_URL}/subtitles", headers=headers, params=params_fallback)
+            response_fallback = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params_fallback)
             time.sleep(0.5)
             if response_fallback.status_code == 200:
                 data_fallback = response_fallback.json()
@@ -934,7 +873,7 @@ def search_subtitles(movie_path: Path, jwt_token: str):
         params["query"] = fallback_query
         max_retries = 3
         for attempt in range(1, max_retries + 1):
-            response = requests.get(f"{API_URL}/subtitles", headers=headers, params=params)
+            response = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params)
             time.sleep(0.5)
             if response.status_code == 200:
                 break
@@ -990,37 +929,10 @@ def mark_drift_as_failed(folder: Path, lang: str):
             )
 
 def get_skipped_movies_from_config():
-    if not CONFIG_PATH.exists():
-        return {}
-    lines = CONFIG_PATH.read_text(encoding='utf-8').splitlines()
-    in_skipped = False
-    skipped = {}
-    for line in lines:
-        if line.strip() == '[skipped_movies]':
-            in_skipped = True
-            continue
-        if in_skipped:
-            if line.strip().startswith('['):
-                break
-            if line.strip():
-                entry = line.strip()
-                if '[' in entry and entry.endswith(']'):
-                    parts = entry.rsplit(' [', 1)
-                    if len(parts) == 2:
-                        movie_path = parts[0]
-                        lang_part = parts[1][:-1]
-                        languages = {lang.strip().lower() for lang in lang_part.split(',') if lang.strip()}
-                        skipped[movie_path] = languages
-    return skipped
+    return {path: set(languages) for path, languages in get_config(CONFIG_PATH).skipped_movies.items()}
 
 def is_movie_language_skipped(mkv_path: Path, language: str) -> bool:
-    skipped_movies = get_skipped_movies_from_config()
-    movie_key = str(mkv_path.resolve())
-    
-    if movie_key in skipped_movies:
-        skipped_langs = skipped_movies[movie_key]
-        return language.lower() in skipped_langs
-    return False
+    return get_config(CONFIG_PATH).is_movie_language_skipped(str(mkv_path.resolve()), language)
 
 def add_skipped_movie_language_to_config(movie_path: Path, language: str):
     skipped_movies = get_skipped_movies_from_config()
@@ -1045,7 +957,7 @@ def handle_missing_queries():
         time.sleep(PAUSE_SECONDS)
         sync_script_path = SNAPSHOT_DIR / "synchronisation.py"
         if sync_script_path.exists():
-            os.system(f'python "{sync_script_path}"')
+            pipeline.hand_off("synchronisation")
             print_and_log(f"{acq_tag()} {Fore.GREEN}*{Style.RESET_ALL} acquisition.py will now close.")
             sys.exit(0)
         return
@@ -1085,7 +997,11 @@ def handle_missing_queries():
         print_and_log(f"  {Fore.YELLOW}4{Style.RESET_ALL} = Skip")
         print_and_log(f"  {Fore.MAGENTA}5{Style.RESET_ALL} = Skip {search_lang.upper()} language and do not show again")
         print_and_log(f"\n{Fore.LIGHTYELLOW_EX}Tip:{Style.RESET_ALL} When many subtitles are found but all fail, some may still match the audio, but are actually rejected false positives. Try testing a few failed subtitles manually, as there could be a good sync among them. Consider lowering reject_offset_threshold in the .config when you get this more often. If problems persist, then the video encoding may be incompatible. Using a different source might yield better results. More info can be found in the readme file.\n")
-        choice = input_and_log(f"Choose [{Fore.LIGHTBLUE_EX}1{Style.RESET_ALL}/{Fore.RED}2{Style.RESET_ALL}/{Fore.LIGHTYELLOW_EX}3{Style.RESET_ALL}/{Fore.YELLOW}4{Style.RESET_ALL}/{Fore.MAGENTA}5{Style.RESET_ALL}]: ").strip()
+        choices = {'2': 'Delete the video', '4': 'Skip it for now', '5': f'Skip {search_lang.upper()} for this video and do not show it again'}
+        choice = ask_or_defer('missing_subtitles', mkv_path, f"No subtitles were found for '{query}'.", choices, '4', search_lang)
+        decided = choice is not None
+        if not decided:
+            choice = input_and_log(f"Choose [{Fore.LIGHTBLUE_EX}1{Style.RESET_ALL}/{Fore.RED}2{Style.RESET_ALL}/{Fore.LIGHTYELLOW_EX}3{Style.RESET_ALL}/{Fore.YELLOW}4{Style.RESET_ALL}/{Fore.MAGENTA}5{Style.RESET_ALL}]: ").strip()
         if choice == "1":
             print_and_log("[ACTION] User chose to type a manual search term.")
             download_successful = False
@@ -1111,7 +1027,7 @@ def handle_missing_queries():
                     "languages": search_lang
                 }
                 print_and_log(f"{acq_tag()} {Fore.YELLOW}*{Style.RESET_ALL} Searching: '{Style.BRIGHT}{new_query}{Style.RESET_ALL}' (LANGUAGE: {search_lang.upper()})")
-                response = requests.get(f"{API_URL}/subtitles", headers=headers, params=params)
+                response = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params)
                 time.sleep(0.5)
                 if response.status_code == 200:
                     results = response.json().get("data", [])
@@ -1251,7 +1167,7 @@ def handle_missing_queries():
                                 time.sleep(PAUSE_SECONDS)
                                 sync_script_path = SNAPSHOT_DIR / "synchronisation.py"
                                 if sync_script_path.exists():
-                                    os.system(f'python "{sync_script_path}"')
+                                    pipeline.hand_off("synchronisation")
                                     print_and_log(f"{acq_tag()} {Fore.GREEN}*{Style.RESET_ALL} acquisition.py will now close.")
                                     sys.exit(0)
                                 else:
@@ -1283,7 +1199,7 @@ def handle_missing_queries():
             print_and_log(f"{acq_tag()} {Fore.MAGENTA}*{Style.RESET_ALL} Other languages for this movie will still be processed.")
             print_and_log(f"{acq_tag()} {Fore.MAGENTA}*{Style.RESET_ALL} To show it again, edit the .config file and remove {search_lang.upper()} from [skipped_movies].")
             print_and_log(f"\nAre you sure? ({Fore.GREEN}y{Style.RESET_ALL}/{Fore.RED}n{Style.RESET_ALL})")
-            confirm = input_and_log("").strip().lower()
+            confirm = 'y' if decided else input_and_log("").strip().lower()
             if confirm != 'y':
                 print_and_log(f"{acq_tag()} {Fore.YELLOW}*{Style.RESET_ALL} Cancelled skip. Returning to menu.")
                 continue
@@ -1304,13 +1220,33 @@ def handle_missing_queries():
 
 def input_and_log(prompt):
     print_and_log(prompt, end='')
+    if decisions.headless():
+        print_and_log('')
+        return ''
     answer = input('')
-    with LOG_FILE.open('a', encoding='utf-8') as f:
-        f.write(f'[USER INPUT] {strip_ansi(answer)}\n')
+    RUN_LOG.user_input(answer)
     return answer
 
-def get_video_files_for_folder(folder: Path) -> list[Path]:
-    video_files = [*folder.glob('*.mkv'), *folder.glob('*.mp4')]
+def ask_or_defer(kind, video, question, choices, default, language=''):
+    """Return the answer given to a question in the review queue, or in headless mode defer the question and return its default.
+    
+    Returns None when the question has to be asked now.
+    """
+    choice = decisions.take_answer(kind, video, language)
+    if choice is not None:
+        print_and_log(f"{acq_tag()} {Fore.CYAN}Answer from the review queue:{Style.RESET_ALL} {choices.get(choice, choice)}", kind='decision')
+    elif decisions.headless():
+        choice = decisions.defer("acquisition", kind, video, question, choices, default, language)
+        print_and_log(f"{acq_tag()} {Fore.YELLOW}Deferred to the review queue:{Style.RESET_ALL} {question} Using: {choices[default]}", kind='decision')
+    return choice
+
+def get_video_files_for_folder(folder: Path, filenames=None) -> list[Path]:
+    """Get the videos of a folder from the library index, or from the names a walk already listed; only the videos
+    themselves are stat'ed, to pick the largest."""
+    if filenames is None:
+        listing = list_library_folder(str(folder))
+        filenames = listing[1] if listing else []
+    video_files = [folder / name for name in filenames if name.lower().endswith(('.mkv', '.mp4'))]
     if SERIES_MODE:
         return sorted(video_files)
     return [max(video_files, key=lambda f: f.stat().st_size)] if video_files else []
@@ -1318,8 +1254,9 @@ def print_video_header(video_name, idx, total):
     bar = f"{Fore.CYAN}[{idx}/{total}]{Style.RESET_ALL}  {Fore.LIGHTYELLOW_EX}{video_name.upper()}{Style.RESET_ALL}"
     print(bar.ljust(79), end='\n', flush=True)
 
-def process_folder(folder: Path, scanned_folders: set, jwt_token: str, skipped_movies: set, idx_offset=0, total_videos=None, video_idx_start=1):
-    video_files = get_video_files_for_folder(folder)
+def process_folder(folder: Path, scanned_folders: set, jwt_token: str, skipped_movies: set, idx_offset=0, total_videos=None, video_idx_start=1, video_files=None):
+    if video_files is None:
+        video_files = get_video_files_for_folder(folder)
     processed = 0
     if not video_files:
         return processed
@@ -1347,8 +1284,12 @@ def process_folder(folder: Path, scanned_folders: set, jwt_token: str, skipped_m
             print_and_log(f"{acq_tag()} * All subtitles present or in sync. Skipping {video_file.name}.")
             continue
         scanned_folders.add(folder)
+        RUN_LOG.set_context(video=video_file.name)
+        metrics.set_context(video=video_file.name)
         print_and_log(f"{acq_tag()} -> Video found: {video_file.name}")
         search_subtitles(video_file, jwt_token)
+        for lang in LANGUAGES:
+            pipeline.presync(video_file, lang)
         print_and_log(f"---\n")
         processed += 1
     return processed
@@ -1381,7 +1322,6 @@ def ensure_initial_setup():
               f"{Fore.CYAN}3.{Style.RESET_ALL} After setup, you can move subordinate.py to the movie(s) you want to process and run it again.\n\n"
               f"{Fore.YELLOW}If you need help, see the README file for more details.{Style.RESET_ALL}\n")
         exit_with_prompt("Press Enter to exit...")
-ensure_initial_setup()
 
 def get_next_sub_index(folder: Path, lang: str) -> int:
     pattern = f"*.{lang}.number*.srt"
@@ -1406,7 +1346,7 @@ def get_total_available_candidates(movie_path: Path, lang: str, jwt_token: str)
         unique_candidates = set()
         
         params = {"query": query, "languages": lang}
-        response = requests.get(f"{API_URL}/subtitles", headers=headers, params=params)
+        response = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params)
         time.sleep(0.5)
         
         if response.status_code == 200:
@@ -1426,7 +1366,7 @@ def get_total_available_candidates(movie_path: Path, lang: str, jwt_token: str)
                 if not results:
                     fallback_query = clean_title(raw_title)
                     params_fallback = {"query": fallback_query, "languages": lang}
-                    response_fallback = requests.get(f"{API_URL}/subtitles", headers=headers, params=params_fallback)
+                    response_fallback = metrics.request("GET", f"{API_URL}/subtitles", "api_search", headers=headers, params=params_fallback)
                     time.sleep(0.5)
                     if response_fallback.status_code == 200:
                         fallback_data = response_fallback.json()
@@ -1441,6 +1381,12 @@ def get_total_available_candidates(movie_path: Path, lang: str, jwt_token: str)
         return 0
 
 def main():
+    """Search and download subtitles for every flagged video, then hand over to synchronisation."""
+    open_run_log()
+    clear_and_print_ascii(BANNER_LINE)
+    os.chdir(get_subservient_anchor())
+    load_setup()
+    ensure_initial_setup()
     clear_and_print_ascii(BANNER_LINE)
     print_and_log(f"{acq_tag()} -> Getting JWT token...")
     jwt_token = get_jwt_token()
@@ -1453,27 +1399,38 @@ def main():
         exit_with_prompt("JWT token error. Press any key to exit...")
         return
     skipped_movies = get_skipped_movies_from_config()
-    current_folder = Path(__file__).resolve().parent
+    current_folder = Path.cwd()
     scanned_folders = set()
     extras_folder_name = setup.get('extras_folder_name', 'extras')
     all_folders = []
     skip_dirs = get_skip_dirs_from_config()
     if extras_folder_name:
         skip_dirs.add(extras_folder_name.lower())
-    anchor_videos = get_video_files_for_folder(current_folder)
-    if anchor_videos:
+    flagged_videos = pipeline.take("acquisition")
+    anchor_videos = get_video_files_for_folder(current_folder) if flagged_videos is None else []
+    if flagged_videos is not None:
+        flagged_folders = {}
+        for video in map(Path, flagged_videos):
+            flagged_folders.setdefault(video.parent, []).append(video)
+        all_folders = list(flagged_folders.items())
+    elif anchor_videos:
         all_folders = [(current_folder, anchor_videos)]
     else:
-        for dirpath, dirnames, _ in os.walk(current_folder):
+        for dirpath, dirnames, filenames in walk_library(current_folder):
             dirnames[:] = [d for d in dirnames if d.lower() not in skip_dirs]
+            if not any(f.lower().endswith(('.mkv', '.mp4')) for f in filenames):
+                continue
             folder = Path(dirpath)
-            video_files = get_video_files_for_folder(folder)
+            video_files = get_video_files_for_folder(folder, filenames)
             if video_files:
                 all_folders.append((folder, video_files))
+    for folder, video_files in all_folders:
+        for video_file in video_files:
+            pipeline.queue("synchronisation", video_file)
     total_videos = sum(len(v) for _, v in all_folders) or 1
     idx = 1
     for folder, video_files in all_folders:
-        processed = process_folder(folder, scanned_folders, jwt_token, skipped_movies, idx_offset=idx-1, total_videos=total_videos)
+        processed = process_folder(folder, scanned_folders, jwt_token, skipped_movies, idx_offset=idx-1, total_videos=total_videos, video_files=video_files)
         idx += len(video_files)
     handle_missing_queries()
     if SERIES_MODE and unknown_sxxexx_files:
@@ -1483,13 +1440,18 @@ def main():
         for f in unknown_sxxexx_files:
             print_and_log(f"   - {f}")
         print_and_log(f"\n{Fore.YELLOW}Before the synchronisation phase can commence, you must manually rename these files.\nUsually you can make a good guess based on the other subtitles that were categorized correctly.{Style.RESET_ALL}\n")
+        if decisions.headless():
+            for f in unknown_sxxexx_files:
+                decisions.defer("acquisition", 'unknown_episode', f, "Rename this subtitle to the season and episode it belongs to.",
+                                {'1': 'Renamed or checked'}, '1')
+            print_and_log(f"{acq_tag()} {Fore.YELLOW}Deferred to the review queue:{Style.RESET_ALL} {len(unknown_sxxexx_files)} subtitle(s) to rename.", kind='decision')
         input_and_log(f"\nPress Enter after you have checked/renamed these files (or to continue)...")
     sync_script_path = SNAPSHOT_DIR / "synchronisation.py"
     if not missing_queries and sync_script_path.exists():
         print_and_log(f"\n{acq_tag()} {Fore.GREEN}*{Style.RESET_ALL} All movies processed. Opening synchronisation.py in {int(PAUSE_SECONDS)} seconds...")
         time.sleep(PAUSE_SECONDS)
         print_and_log(f"\n{acq_tag()} {Fore.GREEN}*{Style.RESET_ALL} Opening synchronisation.py...")
-        os.system(f'python "{sync_script_path}"')
+        pipeline.hand_off("synchronisation")
         print_and_log(f"{acq_tag()} {Fore.GREEN}*{Style.RESET_ALL} acquisition.py will now close.")
         sys.exit(0)
     elif not sync_script_path.exists():
@@ -1502,19 +1464,7 @@ def update_max_search_results_in_config(new_limit):
         return False
     
     try:
-        lines = CONFIG_PATH.read_text(encoding='utf-8').splitlines()
-        updated_lines = []
-        updated = False
-        
-        for line in lines:
-            if line.strip().startswith('max_search_results='):
-                updated_lines.append(f'max_search_results= {new_limit}')
-                updated = True
-            else:
-                updated_lines.append(line)
-        
-        if updated:
-            CONFIG_PATH.write_text('\n'.join(updated_lines) + '\n', encoding='utf-8')
+        if update_config_values({'max_search_results': new_limit}, CONFIG_PATH):
             print_and_log(f"{acq_tag()} {Fore.GREEN}*{Style.RESET_ALL} Config updated: max_search_results set to {new_limit}")
             return True
         else:
@@ -1540,4 +1490,4 @@ def reset_failed_to_drift(folder: Path, lang: str):
         print_and_log(f"{acq_tag()} {Fore.GREEN}*{Style.RESET_ALL} Reset {reset_count} FAILED file(s) back to DRIFT for retry.")
     return reset_count
 if __name__ == "__main__":
-    main()
+    profiling.run_phase("acquisition", main)
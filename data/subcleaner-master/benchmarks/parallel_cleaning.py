@@ -0,0 +1,55 @@
+"""
+Benchmark of library cleaning spread over 1, 2, 4, ... worker processes.
+
+Files are cleaned in dry run mode, so the corpus is left untouched. Run from the subcleaner
+directory against a directory of a few thousand .srt files:
+
+    python3 -m benchmarks.parallel_cleaning /path/to/library --language en
+"""
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+
+from libs.subcleaner import main as subcleaner
+from libs.subcleaner.settings import args
+
+
+def process_counts(maximum: int):
+    processes = 1
+    while processes < maximum:
+        yield processes
+        processes *= 2
+    yield maximum
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time cleaning a corpus of .srt files with more and more processes.")
+    parser.add_argument("corpus", type=Path, help="Directory searched recursively for .srt files.")
+    parser.add_argument("--language", "-l", default="en", help="Language of the subtitles. Default: en")
+    parser.add_argument("--processes", "-p", type=int, default=os.cpu_count() or 1,
+                        help="Largest number of processes to time. Default: number of CPUs.")
+    options = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    args.language = options.language
+    args.dry_run = True
+    files = sorted(options.corpus.resolve().rglob("*.srt"))
+    print(f"{len(files)} files, {os.cpu_count()} CPUs")
+
+    baseline = None
+    for processes in process_counts(options.processes):
+        subcleaner.files_handled.clear()
+        subcleaner.files_failed.clear()
+        start = time.perf_counter()
+        subcleaner.clean_files(files, processes)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{processes:>3} processes: {elapsed:7.2f}s  {len(files) / elapsed:7.1f} files/s  "
+              f"speedup {baseline / elapsed:4.2f}x  ({len(subcleaner.files_handled)} cleaned, "
+              f"{len(subcleaner.files_failed)} failed)")
+
+
+if __name__ == '__main__':
+    main()
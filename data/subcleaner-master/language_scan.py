@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from libs.langdetect.batch import detect_files_langs, read_subtitle_text
+from libs.subcleaner import languages
+
+MIN_CONTENT_LENGTH = 500
+
+
+def label_language(file: Path) -> Optional[str]:
+    for suffix in reversed(file.suffixes[max(-3, -len(file.suffixes)): -1]):
+        parsed_lang = suffix.replace(":", "-").replace("_", "-").split("-")[0][1:].lower()
+        if parsed_lang in ("hi", "sdh", "forced"):
+            continue
+        if languages.is_language(parsed_lang):
+            return languages.get_2letter_code(parsed_lang)
+    return None
+
+
+def find_subtitles(libraries: List[str]) -> List[Tuple[Path, str]]:
+    labelled = []
+    for library in libraries:
+        for file in sorted(Path(library).resolve().rglob("*.srt")):
+            lang = label_language(file)
+            if lang:
+                labelled.append((file, lang))
+    return labelled
+
+
+def read_long_enough(file_path) -> str:
+    text = read_subtitle_text(file_path)
+    return text if len(text) >= MIN_CONTENT_LENGTH else ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scan libraries for .srt subtitles whose content does not match "
+                                                 "the language code in their file name.")
+    parser.add_argument("library", metavar="LIB", type=str, nargs="+",
+                        help="Directory to scan recursively for labelled .srt subtitles.")
+    parser.add_argument("--processes", "-p", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes. Default: number of CPUs.")
+    parser.add_argument("--min-probability", type=float, default=0.8, dest="min_probability",
+                        help="Only report a mislabel when the detected language has at least this probability. "
+                             "Default: 0.8")
+    args = parser.parse_args()
+
+    subtitles = find_subtitles(args.library)
+    results = detect_files_langs([file for file, _ in subtitles], processes=args.processes,
+                                 read_text=read_long_enough)
+
+    mislabelled = 0
+    for (file, lang), detected in zip(subtitles, results):
+        if not detected or detected[0].lang.split("-")[0] == lang or detected[0].prob < args.min_probability:
+            continue
+        mislabelled += 1
+        print(f"{file}: labelled '{lang}' but detected '{detected[0].lang}' ({detected[0].prob:.2f})")
+    print(f"scanned {len(subtitles)} labelled subtitles, found {mislabelled} possible mislabels.", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        exit(0)
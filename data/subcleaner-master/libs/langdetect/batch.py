@@ -0,0 +1,98 @@
+'''
+Batch language detection.
+
+detect()/detect_langs() build a new Detector for every call. The functions here
+keep one Detector per process on top of the shared, preloaded factory and reuse
+it for every text, optionally spreading the texts over a process pool.
+
+    from libs.langdetect.batch import detect_langs_batch, detect_files_langs
+
+    detect_langs_batch(['Hello world', 'Hallo Welt'])
+    detect_files_langs(paths, processes=4)
+'''
+from concurrent.futures import ProcessPoolExecutor
+import re
+
+from . import detector_factory
+from .lang_detect_exception import LangDetectException
+
+TIMESTAMP_RE = re.compile(r'^\s*\d+\s*$|-->')
+_worker = None
+
+
+class BatchDetector(object):
+    '''One Detector reused for many texts, all sharing the module level factory.'''
+
+    def __init__(self, factory=None):
+        if factory is None:
+            detector_factory.init_factory()
+            factory = detector_factory._factory
+        self.detector = factory.create()
+
+    def detect_langs(self, text):
+        '''Probabilities of text as sorted Languages, or an empty list when nothing can be detected.'''
+        detector = self.detector
+        detector.text = ''
+        detector.langprob = None
+        detector.append(text)
+        try:
+            return detector.get_probabilities()
+        except LangDetectException:
+            return []
+
+
+def read_subtitle_text(file_path):
+    '''Text of a subtitle file without block indexes and timestamps.'''
+    for encoding in ('utf-8-sig', 'cp1252'):
+        try:
+            with open(file_path, 'r', encoding=encoding) as f:
+                return '\n'.join(line for line in f.read().splitlines() if not TIMESTAMP_RE.search(line))
+        except UnicodeDecodeError:
+            continue
+    return ''
+
+
+def _init_worker():
+    global _worker
+    _worker = BatchDetector()
+
+
+def _detect_text(text):
+    return _worker.detect_langs(text)
+
+
+def _detect_file(args):
+    file_path, read_text = args
+    try:
+        return _worker.detect_langs(read_text(file_path))
+    except OSError:
+        return []
+
+
+def _run(function, items, processes, chunksize):
+    if not processes or processes <= 1 or len(items) <= chunksize:
+        _init_worker()
+        return [function(item) for item in items]
+    with ProcessPoolExecutor(processes, initializer=_init_worker) as executor:
+        return list(executor.map(function, items, chunksize=chunksize))
+
+
+def detect_langs_batch(texts, processes=None, chunksize=16):
+    '''
+    Detect the languages of many texts.
+
+    Returns one list of Languages per text, in the same order; an empty list
+    means the text had no detectable features. With processes > 1 the texts
+    are spread over a process pool, each worker loading the profiles once.
+    '''
+    return _run(_detect_text, list(texts), processes, chunksize)
+
+
+def detect_files_langs(file_paths, processes=None, chunksize=16, read_text=read_subtitle_text):
+    '''
+    Detect the languages of many subtitle files, reading each file in the worker that analyzes it.
+
+    read_text turns a path into the text to analyze and must be a module level
+    function when a process pool is used. Returns one list of Languages per path.
+    '''
+    return _run(_detect_file, [(file_path, read_text) for file_path in file_paths], processes, chunksize)
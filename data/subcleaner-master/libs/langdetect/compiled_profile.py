@@ -0,0 +1,172 @@
+'''
+Compact binary form of the language profiles.
+
+The JSON files in the profiles directory stay the source of truth. This module
+compiles them into a single file holding the language list, an n-gram table and
+a contiguous little-endian float32 matrix with one row of per-language
+probabilities per n-gram. Loading that file only needs a stat of the JSON
+profiles, a split of the n-gram table and an mmap of the matrix, instead of
+parsing 2.3 MB of JSON into Python lists.
+
+Build it ahead of time with:
+
+    python -m libs.langdetect.compiled_profile
+
+DetectorFactory.load_profile() also writes it after a JSON load when it is
+missing or stale, so the build step is optional.
+'''
+from array import array
+import hashlib
+import mmap
+import os
+from os import path
+import struct
+import sys
+import tempfile
+
+MAGIC = b'LDPROF'
+VERSION = 1
+# magic, version, languages, n-grams, byte length of the name/n-gram tables, source fingerprint
+HEADER = struct.Struct('<6sHIII16s')
+SEPARATOR = '\0'
+
+
+def compiled_path(profile_directory):
+    '''Location of the compiled file for a profile directory: "profiles" -> "profiles.bin".'''
+    return path.normpath(profile_directory) + '.bin'
+
+
+def source_fingerprint(profile_directory):
+    '''Fingerprint of the JSON profiles from their names, sizes and modification times.'''
+    digest = hashlib.md5()
+    for filename in sorted(os.listdir(profile_directory)):
+        if filename.startswith('.'):
+            continue
+        stat = os.stat(path.join(profile_directory, filename))
+        digest.update(('%s:%d:%d\n' % (filename, stat.st_size, stat.st_mtime_ns)).encode('utf-8'))
+    return digest.digest()
+
+
+class CompiledProbMap(object):
+    '''
+    Read-only n-gram -> per-language probabilities mapping backed by the compiled matrix.
+
+    Supports what the Detector needs from DetectorFactory.word_lang_prob_map:
+    membership tests and indexing a row by language position.
+    '''
+    __slots__ = ('_index', '_matrix', '_width', '_mmap')
+
+    def __init__(self, words, matrix, width, mapped=None):
+        self._index = dict((word, row) for row, word in enumerate(words))
+        self._matrix = matrix
+        self._width = width
+        self._mmap = mapped
+
+    def __contains__(self, word):
+        return word in self._index
+
+    def __getitem__(self, word):
+        start = self._index[word] * self._width
+        return self._matrix[start:start + self._width]
+
+    def get(self, word, default=None):
+        if word not in self._index:
+            return default
+        return self[word]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def keys(self):
+        return self._index.keys()
+
+    @property
+    def matrix(self):
+        '''Flat float32 buffer of all rows, one row of len(langlist) values per n-gram.'''
+        return self._matrix
+
+    def row_indices(self, words):
+        '''Row numbers of the given n-grams in the matrix.'''
+        return [self._index[word] for word in words]
+
+
+def write_compiled_profile(langlist, word_lang_prob_map, profile_directory, target=None):
+    '''Write the loaded profiles of a DetectorFactory to the compiled file, atomically.'''
+    target = target or compiled_path(profile_directory)
+    words = list(word_lang_prob_map)
+    tables = (SEPARATOR.join(langlist) + SEPARATOR + SEPARATOR.join(words)).encode('utf-8')
+    tables += b'\0' * (-(HEADER.size + len(tables)) % 4)
+    matrix = array('f')
+    for word in words:
+        matrix.extend(word_lang_prob_map[word])
+    if sys.byteorder != 'little':
+        matrix.byteswap()
+
+    fd, tmp_path = tempfile.mkstemp(prefix='.profiles-', dir=path.dirname(target) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(langlist), len(words), len(tables),
+                                source_fingerprint(profile_directory)))
+            f.write(tables)
+            f.write(matrix.tobytes())
+        os.replace(tmp_path, target)
+    except BaseException:
+        if path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return target
+
+
+def load_compiled_profile(profile_directory, source=None):
+    '''
+    Load the compiled file for a profile directory.
+
+    Returns (langlist, word_lang_prob_map), or None when the file is missing,
+    unreadable or older than the JSON profiles it was built from.
+    '''
+    source = source or compiled_path(profile_directory)
+    try:
+        with open(source, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, n_langs, n_words, tables_size, fingerprint = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != VERSION or fingerprint != source_fingerprint(profile_directory):
+            mapped.close()
+            return None
+        offset = HEADER.size + tables_size
+        names = mapped[HEADER.size:offset].rstrip(b'\0').decode('utf-8').split(SEPARATOR)
+        matrix_size = n_langs * n_words * 4
+        if len(names) != n_langs + n_words or len(mapped) != offset + matrix_size:
+            mapped.close()
+            return None
+    except (OSError, struct.error, UnicodeDecodeError):
+        mapped.close()
+        return None
+
+    if sys.byteorder == 'little':
+        matrix = memoryview(mapped)[offset:].cast('f')
+    else:
+        matrix = array('f', mapped[offset:])
+        matrix.byteswap()
+        mapped.close()
+        mapped = None
+    return names[:n_langs], CompiledProbMap(names[n_langs:], matrix, n_langs, mapped)
+
+
+def compile_profiles(profile_directory=None, target=None):
+    '''Compile a directory of JSON profiles into the binary format.'''
+    from .detector_factory import DetectorFactory, PROFILES_DIRECTORY
+    profile_directory = profile_directory or PROFILES_DIRECTORY
+    factory = DetectorFactory()
+    factory.load_json_profile_directory(profile_directory)
+    return write_compiled_profile(factory.langlist, factory.word_lang_prob_map, profile_directory, target)
+
+
+if __name__ == '__main__':
+    print('Compiled language profiles written to ' + compile_profiles(*sys.argv[1:3]))
@@ -1,3 +1,4 @@
+from collections import Counter
 import random
 import re
 
@@ -46,6 +47,7 @@ class Detector(object):
     PROB_THRESHOLD = 0.1
     CONV_THRESHOLD = 0.99999
     BASE_FREQ = 10000
+    SCRIPT_MIN_SHARE = 0.1
     UNKNOWN_LANG = 'unknown'
 
     URL_RE = re.compile(r'https?://[-_.?&~;+=/#0-9A-Za-z]{1,2076}')
@@ -54,6 +56,7 @@ class Detector(object):
     def __init__(self, factory):
         self.word_lang_prob_map = factory.word_lang_prob_map
         self.langlist = factory.langlist
+        self.script_languages = factory.get_script_languages()
         self.seed = factory.seed
         self.random = random.Random()
         self.text = ''
@@ -137,10 +140,38 @@ class Detector(object):
         return self.UNKNOWN_LANG
 
     def get_probabilities(self):
+        if self.langprob is None:
+            self.langprob = self._detect_by_script()
         if self.langprob is None:
             self._detect_block()
         return self._sort_probability(self.langprob)
 
+    def _detect_by_script(self):
+        '''Decide the language from the scripts in the text alone.
+        Every script holding at least SCRIPT_MIN_SHARE of the letters narrows the candidate
+        languages down to those written in it. Returns None unless exactly one candidate is left.
+        '''
+        histogram = Counter(map(unicode_block, filter(six.text_type.isalpha, self.text)))
+        letters = sum(histogram.values())
+        if not letters:
+            return None
+
+        if self.prior_map is None:
+            candidates = set(range(len(self.langlist)))
+        else:
+            candidates = set(i for i, p in enumerate(self.prior_map) if p > 0.0)
+        for block, count in histogram.items():
+            if count >= letters * self.SCRIPT_MIN_SHARE:
+                candidates &= self.script_languages.get(block, frozenset())
+                if not candidates:
+                    return None
+        if len(candidates) != 1:
+            return None
+
+        prob = [0.0] * len(self.langlist)
+        prob[candidates.pop()] = 1.0
+        return prob
+
     def _detect_block(self):
         self.cleaning_text()
         ngrams = self._extract_ngrams()
@@ -7,9 +7,16 @@ try:
 except ImportError:
     import json
 
+from .compiled_profile import load_compiled_profile, write_compiled_profile
 from .detector import Detector
 from .lang_detect_exception import ErrorCode, LangDetectException
 from .utils.lang_profile import LangProfile
+from .utils.unicode_block import unicode_block
+
+try:
+    from .numpy_detector import NumpyDetector
+except ImportError:
+    NumpyDetector = None
 
 
 class DetectorFactory(object):
@@ -27,12 +34,35 @@ class DetectorFactory(object):
     See also Detector's sample code.
     '''
     seed = None
+    detector_class = NumpyDetector or Detector
+    SCRIPT_PROFILE_MASS = 0.1
 
     def __init__(self):
         self.word_lang_prob_map = {}
         self.langlist = []
+        self.script_languages = None
 
     def load_profile(self, profile_directory):
+        '''
+        Load language profiles from a directory of JSON profiles.
+
+        Uses the compiled binary form next to the directory when it is up to date,
+        otherwise parses the JSON profiles and refreshes the compiled form.
+        '''
+        if not self.langlist:
+            compiled = load_compiled_profile(profile_directory)
+            if compiled is not None:
+                self.langlist, self.word_lang_prob_map = compiled
+                self.script_languages = None
+                return
+
+        self.load_json_profile_directory(profile_directory)
+        try:
+            write_compiled_profile(self.langlist, self.word_lang_prob_map, profile_directory)
+        except OSError:
+            pass
+
+    def load_json_profile_directory(self, profile_directory):
         list_files = os.listdir(profile_directory)
         if not list_files:
             raise LangDetectException(ErrorCode.NeedLoadProfileError, 'Not found profile: ' + profile_directory)
@@ -82,6 +112,7 @@ class DetectorFactory(object):
         if lang in self.langlist:
             raise LangDetectException(ErrorCode.DuplicateLangError, 'Duplicate the same language profile.')
         self.langlist.append(lang)
+        self.script_languages = None
 
         for word in profile.freq:
             if word not in self.word_lang_prob_map:
@@ -94,6 +125,27 @@ class DetectorFactory(object):
     def clear(self):
         self.langlist = []
         self.word_lang_prob_map = {}
+        self.script_languages = None
+
+    def get_script_languages(self):
+        '''
+        Map each Unicode block to the indexes of the languages written in it.
+
+        A language counts as written in a block when the unigram probabilities
+        of its profile put at least SCRIPT_PROFILE_MASS on letters of that block.
+        '''
+        if self.script_languages is None:
+            mass = {}
+            for word in self.word_lang_prob_map:
+                if len(word) != 1 or not word.isalpha():
+                    continue
+                totals = mass.setdefault(unicode_block(word), [0.0] * len(self.langlist))
+                for i, p in enumerate(self.word_lang_prob_map[word]):
+                    totals[i] += p
+            self.script_languages = dict(
+                (block, frozenset(i for i, p in enumerate(totals) if p >= self.SCRIPT_PROFILE_MASS))
+                for block, totals in mass.items())
+        return self.script_languages
 
     def create(self, alpha=None):
         '''Construct Detector instance with smoothing parameter.'''
@@ -105,7 +157,7 @@ class DetectorFactory(object):
     def _create_detector(self):
         if not self.langlist:
             raise LangDetectException(ErrorCode.NeedLoadProfileError, 'Need to load profiles.')
-        return Detector(self)
+        return self.detector_class(self)
 
     def set_seed(self, seed):
         self.seed = seed
@@ -130,8 +182,10 @@ def detect(text):
     return detector.detect()
 
 
-def detect_langs(text):
+def detect_langs(text, prior_map=None):
     init_factory()
     detector = _factory.create()
+    if prior_map:
+        detector.set_prior_map(prior_map)
     detector.append(text)
     return detector.get_probabilities()
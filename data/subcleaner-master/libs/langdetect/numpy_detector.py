@@ -0,0 +1,58 @@
+import numpy as np
+
+from .detector import Detector
+from .lang_detect_exception import ErrorCode, LangDetectException
+
+
+class NumpyDetector(Detector):
+    '''
+    Detector that runs the random trials on NumPy arrays.
+
+    The probabilities of the n-grams found in the text are gathered once into a
+    2-D array, so every trial step is a single vectorised multiply over all
+    languages instead of a Python loop. The random draws, the multiplication
+    order and the normalisation are the same as in Detector, so both classes
+    return identical results for the same seed.
+
+    DetectorFactory.create() returns this detector when NumPy is installed.
+    '''
+
+    def _detect_block(self):
+        if self.verbose:
+            return super(NumpyDetector, self)._detect_block()
+
+        self.cleaning_text()
+        ngrams = self._extract_ngrams()
+        if not ngrams:
+            raise LangDetectException(ErrorCode.CantDetectError, 'No features in text.')
+
+        rows = {}
+        positions = [rows.setdefault(w, len(rows)) for w in ngrams]
+        table = self._gather_rows(list(rows))
+
+        langprob = np.zeros(len(self.langlist))
+        self.random.seed(self.seed)
+        for t in range(self.n_trial):
+            prob = np.array(self._init_probability(), dtype=np.float64)
+            alpha = self.alpha + self.random.gauss(0.0, 1.0) * self.ALPHA_WIDTH
+            factors = table + alpha / self.BASE_FREQ
+
+            i = 0
+            while True:
+                prob *= factors[self.random.choice(positions)]
+                if i % 5 == 0:
+                    # sum() of a list keeps the rounding of Detector._normalize_prob
+                    prob /= sum(prob.tolist())
+                    if prob.max() > self.CONV_THRESHOLD or i >= self.ITERATION_LIMIT:
+                        break
+                i += 1
+            langprob += prob / self.n_trial
+        self.langprob = langprob.tolist()
+
+    def _gather_rows(self, words):
+        '''Per-language probabilities of the given n-grams as a float64 array.'''
+        prob_map = self.word_lang_prob_map
+        if hasattr(prob_map, 'row_indices'):
+            matrix = np.frombuffer(prob_map.matrix, dtype=np.float32).reshape(-1, len(self.langlist))
+            return matrix[prob_map.row_indices(words)].astype(np.float64)
+        return np.array([prob_map[w] for w in words], dtype=np.float64)
@@ -0,0 +1,51 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from libs.langdetect import detector_factory
+from libs.langdetect.batch import BatchDetector, detect_files_langs, detect_langs_batch, read_subtitle_text
+
+
+class BatchTest(unittest.TestCase):
+    TEXT_EN = 'Where were you last night? I was waiting for hours and nobody told me anything.'
+    TEXT_DE = 'Wo warst du gestern Abend? Ich habe stundenlang gewartet und niemand hat mir etwas gesagt.'
+
+    def setUp(self):
+        detector_factory.init_factory()
+        detector_factory._factory.set_seed(0)
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        detector_factory._factory.set_seed(None)
+        shutil.rmtree(self.tmp_dir)
+
+    def write_subtitle(self, name, text):
+        file_path = os.path.join(self.tmp_dir, name)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('1\n00:00:01,000 --> 00:00:02,000\n%s\n\n2\n00:00:03,000 --> 00:00:04,000\n%s\n' % (text, text))
+        return file_path
+
+    def test_batch_matches_detect_langs(self):
+        texts = [self.TEXT_EN, self.TEXT_DE, self.TEXT_EN]
+        expected = [[(l.lang, l.prob) for l in detector_factory.detect_langs(text)] for text in texts]
+        actual = [[(l.lang, l.prob) for l in langs] for langs in detect_langs_batch(texts)]
+        self.assertEqual(actual, expected)
+
+    def test_undetectable_text_gives_empty_list(self):
+        self.assertEqual(detect_langs_batch(['', '1234']), [[], []])
+
+    def test_detector_is_reused(self):
+        batch_detector = BatchDetector()
+        self.assertEqual(batch_detector.detect_langs(self.TEXT_DE)[0].lang, 'de')
+        self.assertEqual(batch_detector.detect_langs(self.TEXT_EN)[0].lang, 'en')
+
+    def test_read_subtitle_text_skips_indexes_and_timestamps(self):
+        text = read_subtitle_text(self.write_subtitle('movie.en.srt', self.TEXT_EN))
+        self.assertNotIn('-->', text)
+        self.assertEqual(text.split('\n')[0], self.TEXT_EN)
+
+    def test_files_with_process_pool(self):
+        files = [self.write_subtitle('movie%d.srt' % i, self.TEXT_EN if i % 2 else self.TEXT_DE) for i in range(6)]
+        results = detect_files_langs(files, processes=2, chunksize=1)
+        self.assertEqual([langs[0].lang for langs in results], ['de', 'en', 'de', 'en', 'de', 'en'])
@@ -0,0 +1,64 @@
+import os
+from os import path
+import shutil
+import tempfile
+import unittest
+
+from libs.langdetect.compiled_profile import compiled_path, load_compiled_profile
+from libs.langdetect.detector_factory import DetectorFactory
+
+
+class CompiledProfileTest(unittest.TestCase):
+    JSON_LANG1 = '{"freq":{"A":3,"B":6,"C":3,"AB":2,"BC":1,"ABC":2,"BBC":1,"CBA":1},"n_words":[12,3,4],"name":"lang1"}'
+    JSON_LANG2 = '{"freq":{"A":6,"B":3,"C":3,"AA":3,"AB":2,"ABC":1,"ABA":1,"CAA":1},"n_words":[12,5,3],"name":"lang2"}'
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.profile_directory = path.join(self.tmp_dir, 'profiles')
+        os.mkdir(self.profile_directory)
+        for name, data in (('lang1', self.JSON_LANG1), ('lang2', self.JSON_LANG2)):
+            with open(path.join(self.profile_directory, name), 'w') as f:
+                f.write(data)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_json_load_writes_compiled_profile(self):
+        factory = DetectorFactory()
+        factory.load_profile(self.profile_directory)
+        self.assertTrue(path.isfile(compiled_path(self.profile_directory)))
+        self.assertIsInstance(factory.word_lang_prob_map, dict)
+
+    def test_compiled_profile_matches_json(self):
+        json_factory = DetectorFactory()
+        json_factory.load_profile(self.profile_directory)
+        compiled_factory = DetectorFactory()
+        compiled_factory.load_profile(self.profile_directory)
+
+        self.assertNotIsInstance(compiled_factory.word_lang_prob_map, dict)
+        self.assertEqual(compiled_factory.get_lang_list(), json_factory.get_lang_list())
+        self.assertEqual(sorted(compiled_factory.word_lang_prob_map), sorted(json_factory.word_lang_prob_map))
+        for word, probs in json_factory.word_lang_prob_map.items():
+            self.assertIn(word, compiled_factory.word_lang_prob_map)
+            for expected, actual in zip(probs, compiled_factory.word_lang_prob_map[word]):
+                self.assertAlmostEqual(expected, actual, places=6)
+        self.assertNotIn('ZZZ', compiled_factory.word_lang_prob_map)
+
+    def test_stale_compiled_profile_is_ignored(self):
+        DetectorFactory().load_profile(self.profile_directory)
+        with open(path.join(self.profile_directory, 'lang2'), 'w') as f:
+            f.write(self.JSON_LANG2.replace('"AA":3', '"AA":30'))
+        self.assertIsNone(load_compiled_profile(self.profile_directory))
+
+        factory = DetectorFactory()
+        factory.load_profile(self.profile_directory)
+        self.assertIsInstance(factory.word_lang_prob_map, dict)
+        self.assertIsNotNone(load_compiled_profile(self.profile_directory))
+
+    def test_corrupt_compiled_profile_is_ignored(self):
+        with open(compiled_path(self.profile_directory), 'wb') as f:
+            f.write(b'not a profile')
+        self.assertIsNone(load_compiled_profile(self.profile_directory))
+        factory = DetectorFactory()
+        factory.load_profile(self.profile_directory)
+        self.assertEqual(len(factory.get_lang_list()), 2)
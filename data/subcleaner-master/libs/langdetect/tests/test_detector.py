@@ -3,6 +3,7 @@ import unittest
 import six
 
 from libs.langdetect.detector_factory import DetectorFactory
+from libs.langdetect.utils import unicode_block
 from libs.langdetect.utils.lang_profile import LangProfile
 
 
@@ -51,6 +52,31 @@ class DetectorTest(unittest.TestCase):
         detect.append(six.u('\u3042\u3042\u3042\u3042a'))
         self.assertEqual(detect.detect(), 'ja')
 
+    def test_script_languages(self):
+        script_languages = self.factory.get_script_languages()
+        self.assertEqual(script_languages[unicode_block.UNICODE_HIRAGANA], frozenset([2]))
+        self.assertEqual(script_languages[unicode_block.UNICODE_BASIC_LATIN], frozenset([0, 1]))
+
+    def test_detect_by_script(self):
+        detect = self.factory.create()
+        detect.append(six.u('\u3042\u3044\u3046 \u3042'))
+        self.assertEqual(detect._detect_by_script(), [0.0, 0.0, 1.0])
+        self.assertEqual(detect.detect(), 'ja')
+
+    def test_detect_by_script_ambiguous(self):
+        detect = self.factory.create()
+        detect.append('a b c')
+        self.assertIsNone(detect._detect_by_script())
+        detect = self.factory.create()
+        detect.append(six.u('\u3042\u3042\u3042\u3042a'))
+        self.assertIsNone(detect._detect_by_script())
+
+    def test_detect_by_script_with_prior_map(self):
+        detect = self.factory.create()
+        detect.set_prior_map({'fr': 1.0})
+        detect.append('a b c')
+        self.assertEqual(detect._detect_by_script(), [0.0, 1.0, 0.0])
+
     def test_lang_list(self):
         langlist = self.factory.get_lang_list()
         self.assertEqual(len(langlist), 3)
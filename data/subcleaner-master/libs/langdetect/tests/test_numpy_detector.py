@@ -0,0 +1,51 @@
+import unittest
+
+import six
+
+from libs.langdetect.detector import Detector
+from libs.langdetect.detector_factory import DetectorFactory
+from libs.langdetect.utils.lang_profile import LangProfile
+
+try:
+    from libs.langdetect.numpy_detector import NumpyDetector
+except ImportError:
+    NumpyDetector = None
+
+
+@unittest.skipUnless(NumpyDetector, 'NumPy is not installed')
+class NumpyDetectorTest(unittest.TestCase):
+    TRAINING_EN = 'a a a b b c c d e'
+    TRAINING_FR = 'a b b c c c d d d'
+    TRAINING_JA = six.u('あ あ あ い う え え')
+    TEXTS = ['a', 'b d', 'd e', six.u('ああああa'), 'a b c d e a b c d e']
+
+    def setUp(self):
+        self.factory = DetectorFactory()
+        for index, (lang, training) in enumerate((('en', self.TRAINING_EN), ('fr', self.TRAINING_FR),
+                                                  ('ja', self.TRAINING_JA))):
+            profile = LangProfile(lang)
+            for w in training.split():
+                profile.add(w)
+            self.factory.add_profile(profile, index, 3)
+
+    def detect_with(self, detector_class, text):
+        detector = detector_class(self.factory)
+        detector.append(text)
+        return detector.get_probabilities()
+
+    def test_factory_creates_numpy_detector(self):
+        self.assertIsInstance(self.factory.create(), NumpyDetector)
+
+    def test_detect(self):
+        for text, expected in zip(self.TEXTS, ['en', 'fr', 'en', 'ja']):
+            detector = self.factory.create()
+            detector.append(text)
+            self.assertEqual(detector.detect(), expected)
+
+    def test_identical_to_detector_with_seed(self):
+        for seed in (0, 1, 42):
+            self.factory.set_seed(seed)
+            for text in self.TEXTS:
+                expected = [(l.lang, l.prob) for l in self.detect_with(Detector, text)]
+                actual = [(l.lang, l.prob) for l in self.detect_with(NumpyDetector, text)]
+                self.assertEqual(actual, expected)
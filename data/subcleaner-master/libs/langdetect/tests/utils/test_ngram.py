@@ -27,6 +27,13 @@ class NGramTest(unittest.TestCase):
         self.assertEqual(NGram.normalize(six.u('\u00a0')), ' ')
         self.assertEqual(NGram.normalize(six.u('\u00a1')), six.u('\u00a1'))
 
+    def test_normalize_table_matches_rules(self):
+        for cp in range(0x10000):
+            if 0xD800 <= cp <= 0xDFFF:
+                continue
+            ch = six.unichr(cp)
+            self.assertEqual(NGram.normalize(ch), NGram._normalize(ch), hex(cp))
+
     def test_normalize_with_cjk_kanji(self):
         self.assertEqual(NGram.normalize(six.u('\u4E00')), six.u('\u4E00'))
         self.assertEqual(NGram.normalize(six.u('\u4E01')), six.u('\u4E01'))
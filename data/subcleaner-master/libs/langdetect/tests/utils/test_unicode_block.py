@@ -21,3 +21,9 @@ class UnicodeBlockTest(unittest.TestCase):
             self.assertEqual(unicode_block.unicode_block(six.u('\U000FFFFF')), unicode_block.UNICODE_SUPPLEMENTARY_PRIVATE_USE_AREA_A)
             self.assertEqual(unicode_block.unicode_block(six.u('\U00100000')), unicode_block.UNICODE_SUPPLEMENTARY_PRIVATE_USE_AREA_B)
             self.assertEqual(unicode_block.unicode_block(six.u('\U0010FFFF')), unicode_block.UNICODE_SUPPLEMENTARY_PRIVATE_USE_AREA_B)
+
+    def test_unicode_block_table_matches_block_ranges(self):
+        blocks = dict((cp, name) for name, start, end in unicode_block._unicode_blocks
+                      for cp in range(start, min(end, 0xFFFF) + 1))
+        for cp in range(0x10000):
+            self.assertEqual(unicode_block.unicode_block(six.unichr(cp)), blocks.get(cp), hex(cp))
@@ -5,6 +5,8 @@ import libs.six as six
 from . import messages
 from .unicode_block import (
     unicode_block,
+    BMP_SIZE,
+    _unicode_blocks,
     UNICODE_BASIC_LATIN,
     UNICODE_LATIN_1_SUPPLEMENT,
     UNICODE_LATIN_EXTENDED_B,
@@ -63,6 +65,13 @@ class NGram(object):
 
     @classmethod
     def normalize(cls, ch):
+        cp = ord(ch)
+        if cp < BMP_SIZE:
+            return cls.BMP_NORMALIZED[cp]
+        return cls._normalize(ch)
+
+    @classmethod
+    def _normalize(cls, ch):
         block = unicode_block(ch)
         if block == UNICODE_BASIC_LATIN:
             if ch < 'A' or ('Z' < ch < 'a') or 'z' < ch:
@@ -250,6 +259,12 @@ class NGram(object):
 
     CJK_MAP = {}
 
+    # blocks that _normalize() maps to a single character, and blocks with per-character rules
+    CONSTANT_BLOCKS = (UNICODE_GENERAL_PUNCTUATION, UNICODE_HIRAGANA, UNICODE_KATAKANA,
+                       UNICODE_BOPOMOFO, UNICODE_BOPOMOFO_EXTENDED, UNICODE_HANGUL_SYLLABLES)
+    NORMALIZED_BLOCKS = (UNICODE_BASIC_LATIN, UNICODE_LATIN_1_SUPPLEMENT, UNICODE_LATIN_EXTENDED_B,
+                         UNICODE_ARABIC, UNICODE_LATIN_EXTENDED_ADDITIONAL)
+
     @classmethod
     def _init_cjk_map(cls):
         for cjk_list in cls.CJK_CLASS:
@@ -258,3 +273,21 @@ class NGram(object):
                 cls.CJK_MAP[ch] = representative
 
 NGram._init_cjk_map()
+
+
+def _build_bmp_normalized():
+    '''Normalized form of every Basic Multilingual Plane character, indexed by code point.'''
+    table = [six.unichr(cp) for cp in range(BMP_SIZE)]
+    for block, start, end in _unicode_blocks:
+        if start >= BMP_SIZE:
+            break
+        if block in NGram.CONSTANT_BLOCKS:
+            table[start:end + 1] = [NGram._normalize(six.unichr(start))] * (end + 1 - start)
+        elif block in NGram.NORMALIZED_BLOCKS:
+            for cp in range(start, end + 1):
+                table[cp] = NGram._normalize(six.unichr(cp))
+    for ch, representative in NGram.CJK_MAP.items():
+        table[ord(ch)] = representative
+    return ''.join(table)
+
+NGram.BMP_NORMALIZED = _build_bmp_normalized()
@@ -444,14 +444,27 @@ _unicode_blocks = [
 ]
 
 NUM_BLOCKS = len(_unicode_blocks)
+BMP_SIZE = 0x10000
+
+
+def _build_bmp_blocks():
+    '''Block of every Basic Multilingual Plane code point, 0 where there is no block.'''
+    blocks = bytearray(BMP_SIZE)
+    for name, start, end in _unicode_blocks:
+        if start >= BMP_SIZE:
+            break
+        blocks[start:end + 1] = bytes((name,)) * (end + 1 - start)
+    return bytes(blocks)
+
+_bmp_blocks = _build_bmp_blocks()
 
 
 def unicode_block(ch):
     '''Return the Unicode block name for ch, or None if ch has no block.'''
     cp = ord(ch)
-    # special case basic latin
-    if cp <= 0x7F:
-        return UNICODE_BASIC_LATIN
+    # table lookup for the basic multilingual plane
+    if cp < BMP_SIZE:
+        return _bmp_blocks[cp] or None
     # binary search for the correct block
     be, en = 0, NUM_BLOCKS - 1
     while be <= en:
@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from .sub_block import SubBlock
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_VERSION = 2
+
+
+class RegistryEntry:
+    block: SubBlock
+    files: Dict[Path, int]
+
+    def __init__(self, block: SubBlock) -> None:
+        self.block = block
+        self.files = {}
+
+    @property
+    def count(self) -> int:
+        return sum(self.files.values())
+
+
+class AdRegistry:
+    """
+    Removed or warned about blocks of many subtitle files, grouped by their clean_content.
+
+    The first block seen with some content represents all of them in reports, together
+    with every file it was found in and how many times it was found in each.
+    """
+    entries: Dict[str, RegistryEntry]
+
+    def __init__(self) -> None:
+        self.entries = {}
+
+    def add(self, block: SubBlock, file: Path) -> None:
+        entry = self.entries.get(block.clean_content)
+        if entry is None:
+            entry = self.entries[block.clean_content] = RegistryEntry(block)
+        entry.files[file] = entry.files.get(file, 0) + 1
+
+    def merge(self, other: "AdRegistry") -> None:
+        """
+        Add the entries of another registry, such as those of a run to the library's.
+
+        A file found again replaces what was recorded for it, so cleaning a subtitle twice doesn't count its blocks twice.
+        """
+        for content, other_entry in other.entries.items():
+            entry = self.entries.get(content)
+            if entry is None:
+                entry = self.entries[content] = RegistryEntry(other_entry.block)
+            entry.files.update(other_entry.files)
+
+    def items(self) -> Iterator[Tuple[SubBlock, Dict[Path, int]]]:
+        for entry in self.entries.values():
+            yield entry.block, entry.files
+
+    def most_frequent(self, amount: int) -> List[RegistryEntry]:
+        """The entries found in the most files, ties broken by how often they were found."""
+        entries = sorted(self.entries.values(), key=lambda e: (len(e.files), e.count), reverse=True)
+        return entries[:amount]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def to_json(self) -> List[dict]:
+        return [{
+            "original_index": entry.block.original_index,
+            "start_ms": entry.block.start_ms,
+            "end_ms": entry.block.end_ms,
+            "content": entry.block.content,
+            "regex_matches": entry.block.regex_matches,
+            "hints": entry.block.hints,
+            "files": {str(file): count for file, count in sorted(entry.files.items())},
+        } for entry in self.entries.values()]
+
+    def update_from_json(self, items: List[dict]) -> None:
+        for item in items:
+            index = item["original_index"]
+            block = SubBlock.from_lines([str(index), ""] + item["content"].split("\n"),
+                                        [None, (item["start_ms"], item["end_ms"])], index)
+            block.regex_matches = item["regex_matches"]
+            block.hints = item["hints"]
+            entry = self.entries.get(block.clean_content)
+            if entry is None:
+                entry = self.entries[block.clean_content] = RegistryEntry(block)
+            entry.files.update((Path(file), count) for file, count in item["files"].items())
+
+
+def load(registry_file: Path, ad_blocks: AdRegistry, warning_blocks: AdRegistry) -> None:
+    """Add the blocks saved by earlier runs to the registries, a missing or unreadable file is skipped."""
+    try:
+        with registry_file.open("r", encoding="UTF-8") as file:
+            data = json.load(file)
+        if data.get("version") != REGISTRY_VERSION:
+            return
+        ad_blocks.update_from_json(data["ads"])
+        warning_blocks.update_from_json(data["warnings"])
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"could not read ad registry {registry_file}, starting a new one. reason: {e}")
+
+
+def record(registry_file: Path, ad_blocks: AdRegistry, warning_blocks: AdRegistry) -> AdRegistry:
+    """Add the blocks of a run to the saved registries and return the removed blocks of the whole library."""
+    library_ad_blocks, library_warning_blocks = AdRegistry(), AdRegistry()
+    load(registry_file, library_ad_blocks, library_warning_blocks)
+    library_ad_blocks.merge(ad_blocks)
+    library_warning_blocks.merge(warning_blocks)
+    save(registry_file, library_ad_blocks, library_warning_blocks)
+    return library_ad_blocks
+
+
+def save(registry_file: Path, ad_blocks: AdRegistry, warning_blocks: AdRegistry) -> None:
+    data = {"version": REGISTRY_VERSION, "ads": ad_blocks.to_json(), "warnings": warning_blocks.to_json()}
+    try:
+        registry_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=registry_file.parent, prefix=registry_file.name)
+        try:
+            with os.fdopen(fd, "w", encoding="UTF-8") as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(tmp_path, registry_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"could not save ad registry {registry_file}. reason: {e}")
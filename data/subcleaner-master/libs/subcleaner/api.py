@@ -0,0 +1,123 @@
+"""
+In-process entry point for applications that embed subcleaner.
+
+Importing this module loads the config and the regex profiles once; every
+clean_subtitle() call after that reuses them, as does the language detector.
+Detected languages are cached in memory by file content for as long as the process runs.
+Nothing is parsed from the command line and the host's logging setup is left alone.
+
+    from libs.subcleaner import api
+
+    result = api.clean_subtitle(Path("movie.en.srt"))
+    if result.success:
+        print(len(result.removed_blocks), "blocks removed")
+"""
+import logging
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from . import language_cache, regex_lists, report_generator
+from .cleaner import cleaner
+from .journal import Journal, JournalEntry
+from .settings import args, config
+from .sub_block import SubBlock
+from .subtitle import Subtitle, ParsingException, FileContentException
+
+logger = logging.getLogger(__name__)
+logging.getLogger("libs.subcleaner").addHandler(logging.NullHandler())
+
+
+class CleaningResult:
+    file: Path
+    success: bool
+    error: Optional[str]
+    language: Optional[str]
+    language_mismatch: bool
+    removed_blocks: List[SubBlock]
+    warning_blocks: List[SubBlock]
+    journal: List[JournalEntry]
+    changed: bool
+    content: Optional[str]
+    report: str
+
+    def __init__(self, file: Path) -> None:
+        self.file = file
+        self.success = False
+        self.error = None
+        self.language = None
+        self.language_mismatch = False
+        self.removed_blocks = []
+        self.warning_blocks = []
+        self.journal = []
+        self.changed = False
+        self.content = None
+        self.report = ""
+
+    def fail(self, error: str) -> "CleaningResult":
+        self.error = error
+        return self
+
+    def __repr__(self) -> str:
+        if not self.success:
+            return f"CleaningResult({self.file.name}: failed, {self.error})"
+        return f"CleaningResult({self.file.name}: {len(self.removed_blocks)} removed, " \
+               f"{len(self.warning_blocks)} warnings)"
+
+
+def clean_subtitle(subtitle_file: Path, language: Optional[str] = None, dry_run: bool = False) -> CleaningResult:
+    """
+    Clean one .srt file the same way the command line does.
+
+    The file is rewritten only when ads were removed or overlaps fixed and dry_run is off.
+    The cleaned content is returned either way in CleaningResult.content, and every removed or
+    retimed block in CleaningResult.journal.
+    """
+    subtitle_file = Path(subtitle_file)
+    result = CleaningResult(subtitle_file)
+
+    previous_language = args.language
+    args.language = language
+    try:
+        subtitle = Subtitle(subtitle_file)
+    except (UnicodeDecodeError, ParsingException, FileContentException) as e:
+        return result.fail(f"subcleaner was unable to decode the file: {e}")
+    finally:
+        args.language = previous_language
+
+    result.language = subtitle.language
+    if not subtitle:
+        return result.fail("Subtitle file is empty.")
+    if config.require_language_profile and not regex_lists.language_has_profile(subtitle.language):
+        return result.fail(f"language '{subtitle.language}' have no regex profile associated with it.")
+
+    result.language_mismatch = not subtitle.language_is_correct()
+    journal = Journal(subtitle)
+    cleaner.unscramble(subtitle)
+    cleaner.find_ads(subtitle)
+    changes = bool(subtitle.ad_blocks)
+    cleaner.remove_ads(subtitle)
+    if config.fix_overlaps:
+        changes = cleaner.fix_overlap(subtitle) or changes
+
+    result.removed_blocks = sorted(subtitle.ad_blocks, key=lambda b: b.original_index or 0)
+    result.warning_blocks = sorted(subtitle.warning_blocks, key=lambda b: b.current_index or 0)
+    if len(subtitle.blocks) == 0:
+        return result.fail("aborted, removed all subtitles.")
+
+    result.report = report_generator.generate_report(subtitle)
+    result.content = subtitle.to_content()
+    result.journal = journal.entries(subtitle)
+    result.changed = changes
+    result.success = True
+    if changes and not dry_run:
+        with subtitle_file.open("w", encoding="UTF-8") as file:
+            file.write(result.content)
+        if subtitle.detection:
+            language_cache.add(subtitle_file, language_cache.content_hash(result.content), *subtitle.detection)
+    return result
+
+
+def clean_subtitles(subtitle_files: Iterable[Path], language: Optional[str] = None,
+                    dry_run: bool = False) -> List[CleaningResult]:
+    """Clean many .srt files in this process, one CleaningResult per file in the same order."""
+    return [clean_subtitle(subtitle_file, language, dry_run) for subtitle_file in subtitle_files]
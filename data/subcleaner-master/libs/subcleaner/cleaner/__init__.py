@@ -1 +1 @@
-from .cleaner import find_ads, remove_ads, fix_overlap, unscramble, reset
+from .cleaner import find_ads, remove_ads, fix_overlap, unscramble
@@ -1,15 +1,9 @@
 import logging
-from datetime import timedelta
-from pathlib import Path
 from typing import *
 from libs.subcleaner.subtitle import Subtitle
 from libs.subcleaner.settings import args
 
 from . import detectors, punishers
-from ..sub_block import SubBlock
-
-ad_blocks: Dict[SubBlock, Set[Path]] = {}
-warning_blocks: Dict[SubBlock, Set[Path]] = {}
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +17,7 @@ def find_ads(subtitle: Subtitle) -> None:
 
     punishers.punish_quick_first_block(subtitle)
     punishers.punish_ad_adjacency(subtitle)
-    punishers.punish_clone_blocks(subtitle)
+    duplicates = punishers.punish_clone_blocks(subtitle)
 
     for block in subtitle.blocks:
         if block.regex_matches >= 3:
@@ -32,14 +26,10 @@ def find_ads(subtitle: Subtitle) -> None:
             subtitle.warn(block)
 
     detectors.detect_wedged(subtitle)
-    punishers.move_duplicated(subtitle)
+    punishers.move_duplicated(subtitle, duplicates)
     detectors.detect_chain(subtitle)
 
 
-def reset():
-    punishers.reset_duplicate()
-
-
 def remove_ads(subtitle: Subtitle):
     if args.sensitive and len(subtitle.blocks) > 1:
         subtitle.warn(subtitle.blocks[0])
@@ -52,27 +42,13 @@ def remove_ads(subtitle: Subtitle):
             if prev_block in subtitle.ad_blocks or next_block in subtitle.ad_blocks:
                 subtitle.warn(block)
 
-    for block in subtitle.ad_blocks:
-        try:
-            subtitle.blocks.remove(block)
-            if "-->" in block.content:
-                logger.warning(f"potential malformed subtitle blocks in removed block {block.original_index}.")
-        except ValueError:
-            pass
-        for e_block in ad_blocks:
-            if e_block.clean_content == block.clean_content:
-                ad_blocks[e_block].add(subtitle.short_path)
-                break
-        else:
-            ad_blocks[block] = {subtitle.short_path}
-
-    for block in subtitle.warning_blocks:
-        for e_block in warning_blocks:
-            if e_block.clean_content == block.clean_content:
-                warning_blocks[e_block].add(subtitle.short_path)
-                break
-        else:
-            warning_blocks[block] = {subtitle.short_path}
+    remaining_blocks = []
+    for block in subtitle.blocks:
+        if block not in subtitle.ad_blocks:
+            remaining_blocks.append(block)
+        elif "-->" in block.content:
+            logger.warning(f"potential malformed subtitle blocks in removed block {block.original_index}.")
+    subtitle.blocks = remaining_blocks
 
     subtitle.reindex()
 
@@ -81,28 +57,39 @@ def fix_overlap(subtitle: Subtitle):
     if len(subtitle.blocks) < 2:
         return False
     changes = False
+    # shifted times are tracked in microseconds so their fractions carry over to the next block, the blocks
+    # themselves get whole milliseconds truncated the same way the srt timestamps are.
     previous_block = subtitle.blocks[0]
+    previous_start, previous_end = previous_block.start_ms * 1000, previous_block.end_ms * 1000
     for block in subtitle.blocks[1:]:
-        if not (previous_block.start_time < block.start_time and previous_block.end_time < block.end_time):
-            previous_block = block
+        start, end = block.start_ms * 1000, block.end_ms * 1000
+        if not (previous_start < start and previous_end < end):
+            previous_block, previous_start, previous_end = block, start, end
             continue
 
-        overlap = previous_block.end_time - block.start_time + timedelta(seconds=3 / 30)
-        if timedelta(milliseconds=3) < overlap and (len(block.content) + len(previous_block.content)) > 0:
-            content_ratio = block.duration_seconds / (block.duration_seconds + previous_block.duration_seconds)
-            block.start_time += content_ratio * overlap
-            previous_block.end_time += (content_ratio - 1) * overlap
+        overlap = previous_end - start + 100_000
+        if 3_000 < overlap and (len(block.content) + len(previous_block.content)) > 0:
+            duration = (end - start) / 1_000_000
+            previous_duration = (previous_end - previous_start) / 1_000_000
+            content_ratio = duration / (duration + previous_duration)
+            start += round(content_ratio * overlap)
+            previous_end += round((content_ratio - 1) * overlap)
+            block.start_ms = start // 1000
+            previous_block.end_ms = previous_end // 1000
             changes = True
-        
-        previous_block = block
+
+        previous_block, previous_start, previous_end = block, start, end
     return changes
 
 
 def unscramble(subtitle: Subtitle):
-    subtitle.blocks.sort(key=lambda x: x.start_time)
-    for block in subtitle.blocks.copy():
-        if block.duration_seconds <= 0:
+    subtitle.blocks.sort(key=lambda x: x.start_ms)
+    remaining_blocks = []
+    for block in subtitle.blocks:
+        if block.duration_ms <= 0:
             subtitle.ad(block)
             block.hints.append("negative_duration")
-            subtitle.blocks.remove(block)
+        else:
+            remaining_blocks.append(block)
+    subtitle.blocks = remaining_blocks
     subtitle.reindex()
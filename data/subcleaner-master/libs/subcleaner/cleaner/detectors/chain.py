@@ -1,4 +1,3 @@
-from datetime import timedelta
 from typing import List
 
 from libs.subcleaner.sub_block import SubBlock
@@ -6,51 +5,62 @@ from libs.subcleaner.subtitle import Subtitle
 
 
 def detect_chain(subtitle: Subtitle) -> None:
+    blocks = subtitle.blocks
+    # strip every content once instead of once per comparison.
+    stripped = [block.content.strip() for block in blocks]
     chain: List[SubBlock] = []
+    chain_has_ad = False
     identical_count = 0
-    for i in range(1, len(subtitle.blocks)):
-        block = subtitle.blocks[i]
-        pre_block = subtitle.blocks[i - 1]
+    for i in range(1, len(blocks)):
+        block = blocks[i]
+        pre_block = blocks[i - 1]
 
-        link: bool = False
-
-        if is_link(pre_block, block):
+        if _is_link(pre_block, block, stripped[i - 1], stripped[i]):
             if pre_block.equal_content(block):
                 identical_count += 1
-            link = True
-
-        if link:
             if not chain:
                 chain.append(pre_block)
+                chain_has_ad = pre_block in subtitle.ad_blocks
             chain.append(block)
+            chain_has_ad = chain_has_ad or block in subtitle.ad_blocks
             continue
 
-        if len(chain) > 2 + identical_count or any(block in subtitle.ad_blocks for block in chain):
-            for chain_block in chain:
-                subtitle.ad(chain_block)
-                chain_block.hints.append("chain_block")
+        if len(chain) > 2 + identical_count or chain_has_ad:
+            _mark_chain(subtitle, chain)
 
         chain.clear()
+        chain_has_ad = False
         identical_count = 0
-    if len(chain) > 2 + identical_count or any(block in subtitle.ad_blocks for block in chain):
-        for chain_block in chain:
-            subtitle.ad(chain_block)
-            chain_block.hints.append("chain_block")
+    if len(chain) > 2 + identical_count or chain_has_ad:
+        _mark_chain(subtitle, chain)
+
+
+def _mark_chain(subtitle: Subtitle, chain: List[SubBlock]) -> None:
+    for chain_block in chain:
+        subtitle.ad(chain_block)
+        chain_block.hints.append("chain_block")
 
 
 def is_link(block: SubBlock, post_block: SubBlock) -> bool:
-    if block.start_time > post_block.start_time:
+    return _is_link(block, post_block, block.content.strip(), post_block.content.strip())
+
+
+def _is_link(block: SubBlock, post_block: SubBlock, block_stripped: str, post_block_stripped: str) -> bool:
+    if block.start_ms > post_block.start_ms:
         block, post_block = post_block, block
-    if post_block.start_time - block.end_time > timedelta(milliseconds=500):
+        block_stripped, post_block_stripped = post_block_stripped, block_stripped
+    if post_block.start_ms - block.end_ms > 500:
         return False
 
-    if len(block.content) < len(post_block.content) <= len(block.content) + 2:
-        if post_block.content.startswith(block.content) or post_block.content.endswith(block.content):
+    content = block.content
+    post_content = post_block.content
+    if len(content) < len(post_content) <= len(content) + 2:
+        if post_content.startswith(content) or post_content.endswith(content):
             return True
-    elif len(post_block.content) < len(block.content) <= len(post_block.content) + 2:
-        if block.content.startswith(post_block.content) or block.content.endswith(post_block.content):
+    elif len(post_content) < len(content) <= len(post_content) + 2:
+        if content.startswith(post_content) or content.endswith(post_content):
             return True
-    elif block.content.strip() == post_block.content.strip():
+    elif block_stripped == post_block_stripped:
         return True
 
     return False
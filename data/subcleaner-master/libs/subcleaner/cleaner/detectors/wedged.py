@@ -1,5 +1,3 @@
-from datetime import timedelta
-
 from libs.subcleaner.sub_block import SubBlock
 from libs.subcleaner.subtitle import Subtitle
 
@@ -13,7 +11,7 @@ def detect_wedged(subtitle: Subtitle) -> None:
         if index == 0:
             post_block: SubBlock = subtitle.blocks[index + 1]
             if post_block.regex_matches >= 3:
-                if (post_block.start_time - block.end_time) < timedelta(seconds=1):
+                if post_block.start_ms - block.end_ms < 1000:
                     if block in subtitle.warning_blocks:
                         subtitle.ad(block)
                     else:
@@ -28,7 +26,7 @@ def detect_wedged(subtitle: Subtitle) -> None:
             if pre_block.regex_matches < 3:
                 continue
             block.hints.append("wedged_block")
-            if (block.start_time - pre_block.end_time) > timedelta(seconds=1):
+            if block.start_ms - pre_block.end_ms > 1000:
                 subtitle.warn(block)
                 continue
 
@@ -42,8 +40,8 @@ def detect_wedged(subtitle: Subtitle) -> None:
         post_block: SubBlock = subtitle.blocks[index + 1]
 
         if pre_block.regex_matches >= 3 and post_block.regex_matches >= 3:
-            if (post_block.start_time - block.end_time) < timedelta(seconds=1) and \
-                    (block.start_time - pre_block.end_time) < timedelta(seconds=1):
+            if post_block.start_ms - block.end_ms < 1000 and \
+                    block.start_ms - pre_block.end_ms < 1000:
                 subtitle.ad(block)
                 block.hints.append("wedged_block")
                 continue
@@ -1,36 +1,44 @@
 import re
-from typing import Set
+from itertools import accumulate
+from typing import List, Set
 
 from libs.subcleaner.sub_block import SubBlock
 from libs.subcleaner.subtitle import Subtitle
 
+NEARBY_DISTANCE = 15
+SHORT_BLOCK_MAX_SPACES = 4
+_SPACES_REGEX = re.compile(" +")
+
 
 def punish_ad_adjacency(subtitle: Subtitle) -> None:
+    blocks = subtitle.blocks
+    # ad_count[i] is the number of ads among blocks[:i], so any window of blocks is counted in O(1).
+    ad_count = [0] + list(accumulate(block.regex_matches >= 3 for block in blocks))
+
     nearby_blocks: Set[SubBlock] = set()
-    for index in range(0, len(subtitle.blocks)):
-        block = subtitle.blocks[index]
+    for index in range(0, len(blocks)):
+        block = blocks[index]
         if index < 3:
             nearby_blocks.add(block)
             block.hints.append("close_to_start")
             continue
-        if index > len(subtitle.blocks) - 4:
+        if index > len(blocks) - 4:
             nearby_blocks.add(block)
             block.hints.append("close_to_end")
             continue
-        for compare_block in subtitle.blocks[max(0, index - 15): min(index + 16, len(subtitle.blocks))]:
-            if compare_block.regex_matches >= 3 and compare_block != block:
-                nearby_blocks.add(block)
-                block.hints.append("nearby_ad")
-                break
-
-    adjacent_blocks: Set[SubBlock] = set()
-    for index in range(0, len(subtitle.blocks)):
-        block = subtitle.blocks[index]
-        for compare_block in subtitle.blocks[max(0, index - 1): min(index + 2, len(subtitle.blocks))]:
-            if compare_block.regex_matches >= 2 and compare_block != block:
-                if re.sub(" +", " ", block.content.replace("\n", " ").strip()).count(" ") <= 4:
-                    adjacent_blocks.add(block)
-                    break
+        window_ads = ad_count[min(index + NEARBY_DISTANCE + 1, len(blocks))] - ad_count[max(0, index - NEARBY_DISTANCE)]
+        if window_ads - (block.regex_matches >= 3) > 0:
+            nearby_blocks.add(block)
+            block.hints.append("nearby_ad")
+
+    warned = [block.regex_matches >= 2 for block in blocks]
+    adjacent_blocks: List[SubBlock] = []
+    for index in range(0, len(blocks)):
+        if not (index > 0 and warned[index - 1] or index < len(blocks) - 1 and warned[index + 1]):
+            continue
+        block = blocks[index]
+        if _space_count(block.content) <= SHORT_BLOCK_MAX_SPACES:
+            adjacent_blocks.append(block)
 
     for block in nearby_blocks:
         block.regex_matches += 1
@@ -38,3 +46,7 @@ def punish_ad_adjacency(subtitle: Subtitle) -> None:
     for block in adjacent_blocks:
         block.regex_matches += 1
         block.hints.append("adjacent_ad")
+
+
+def _space_count(content: str) -> int:
+    return _SPACES_REGEX.sub(" ", content.replace("\n", " ").strip()).count(" ")
@@ -1,18 +1,14 @@
-import re
 from typing import Dict, List
 
 from libs.subcleaner.sub_block import SubBlock
 from libs.subcleaner.subtitle import Subtitle
 
 
-content_dict: Dict[str, List[SubBlock]] = {}
-content_dict_reverse: [SubBlock, str] = {}
-
-
-def punish_clone_blocks(subtitle: Subtitle) -> None:
+def punish_clone_blocks(subtitle: Subtitle) -> Dict[str, List[SubBlock]]:
+    """Punish blocks whose content is repeated in the subtitle, returns the blocks grouped by clean content."""
+    content_dict: Dict[str, List[SubBlock]] = {}
     for block in subtitle.blocks:
-        content = re.sub("[\\s.,:_-]", "", block.content)
-        content_dict_reverse[block] = content
+        content = block.clean_content
         if content not in content_dict:
             content_dict[content] = []
         content_dict[content].append(block)
@@ -25,22 +21,18 @@ def punish_clone_blocks(subtitle: Subtitle) -> None:
                 continue
             block.regex_matches += 1
             block.hints.append("similar_content")
+    return content_dict
 
 
-def move_duplicated(subtitle: Subtitle) -> None:
+def move_duplicated(subtitle: Subtitle, content_dict: Dict[str, List[SubBlock]]) -> None:
     for ad_block in subtitle.ad_blocks.copy():
         if "similar_content" not in ad_block.hints:
             continue
-        for block in content_dict[content_dict_reverse[ad_block]]:
+        for block in content_dict[ad_block.clean_content]:
             subtitle.ad(block)
 
     for warn_block in subtitle.warning_blocks.copy():
         if "similar_content" not in warn_block.hints:
             continue
-        for block in content_dict[content_dict_reverse[warn_block]]:
+        for block in content_dict[warn_block.clean_content]:
             subtitle.warn(block)
-
-
-def reset_duplicate():
-    content_dict.clear()
-    content_dict_reverse.clear()
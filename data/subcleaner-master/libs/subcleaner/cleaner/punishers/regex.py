@@ -1,31 +1,19 @@
-import re
-from typing import List, Tuple, Pattern
-
 from libs.subcleaner import regex_lists
 from libs.subcleaner.sub_block import SubBlock
 from libs.subcleaner.subtitle import Subtitle
 
 
 def punish_regex_matches(subtitle: Subtitle) -> None:
+    purge_matcher = regex_lists.get_purge_matcher(subtitle.language)
+    warning_matcher = regex_lists.get_warning_matcher(subtitle.language)
     for block in subtitle.blocks:
-        _run_regex_on_block(block, regex_lists.get_purge_regex(subtitle.language), 3)
-        _run_regex_on_block(block, regex_lists.get_warning_regex(subtitle.language), 1)
-
+        clean_content = " ".join(block.content.replace("-\n", "-").split())
+        _punish_matches(block, purge_matcher.find_matches(clean_content), 3)
+        _punish_matches(block, warning_matcher.find_matches(clean_content), 1)
 
-def _run_regex_on_block(block: SubBlock, regex_list: List[Tuple[str, Pattern]], punishment: int) -> None:
-    clean_content = " ".join(block.content.replace("-\n", "-").split())
-    for regex in regex_list:
-        try:
-            result = re.findall(regex[1], clean_content)
-            if result and isinstance(result[0], str):
-                result = [r.lower() for r in result]
-                result = set(result)
-            else:
-                result = set([t[0].lower() for t in result])
 
-        except re.error as e:
-            raise ValueError(f"regex {regex[0]} is miss configured: {e.msg}")
-        if result:
-            block.regex_matches += punishment * len(result)
-            for i in range(0, len(result)):
-                block.hints.append(regex[0])
+def _punish_matches(block: SubBlock, matches, punishment: int) -> None:
+    for key, count in matches:
+        block.regex_matches += punishment * count
+        for i in range(0, count):
+            block.hints.append(key)
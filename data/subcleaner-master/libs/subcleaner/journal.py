@@ -0,0 +1,111 @@
+from typing import Dict, List, Optional, Tuple
+
+from .sub_block import SubBlock, milliseconds_to_time_string
+from .subtitle import Subtitle
+
+REMOVED = "removed"
+RETIMED = "retimed"
+
+
+class JournalEntry:
+    """
+    One block that cleaning removed or retimed.
+
+    Neighbours are given as indexes in the cleaned file, so a removed block can be put back
+    right after previous_index without searching the file for it.
+    """
+    kind: str
+    original_index: int
+    position: int
+    start_ms: int
+    end_ms: int
+    content: str
+    current_index: Optional[int]
+    previous_index: int
+    next_index: Optional[int]
+    new_start_ms: int
+    new_end_ms: int
+    hints: List[str]
+
+    def __init__(self, kind: str, block: SubBlock, position: int, start_ms: int, end_ms: int) -> None:
+        self.kind = kind
+        self.original_index = block.original_index
+        self.position = position
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.content = block.content
+        self.current_index = block.current_index
+        self.previous_index = 0
+        self.next_index = None
+        self.new_start_ms = block.start_ms
+        self.new_end_ms = block.end_ms
+        self.hints = list(block.hints)
+
+    @property
+    def timeframe(self) -> str:
+        return f"{milliseconds_to_time_string(self.start_ms)} --> {milliseconds_to_time_string(self.end_ms)}"
+
+    @property
+    def new_timeframe(self) -> str:
+        return f"{milliseconds_to_time_string(self.new_start_ms)} --> {milliseconds_to_time_string(self.new_end_ms)}"
+
+    def to_json(self) -> dict:
+        item = {
+            "kind": self.kind,
+            "original_index": self.original_index,
+            "position": self.position,
+            "start_ms": self.start_ms,
+            "end_ms": self.end_ms,
+            "timeframe": self.timeframe,
+            "content": self.content,
+            "hints": self.hints,
+        }
+        if self.kind == REMOVED:
+            item["previous_index"] = self.previous_index
+            item["next_index"] = self.next_index
+        else:
+            item["current_index"] = self.current_index
+            item["new_start_ms"] = self.new_start_ms
+            item["new_end_ms"] = self.new_end_ms
+            item["new_timeframe"] = self.new_timeframe
+        return item
+
+    def __repr__(self) -> str:
+        return f"JournalEntry({self.kind} block {self.original_index}, {self.timeframe})"
+
+
+class Journal:
+    """
+    Remembers the blocks of a freshly parsed subtitle so the changes cleaning made to it can be listed.
+
+        journal = Journal(subtitle)
+        ... unscramble, find_ads, remove_ads, fix_overlap ...
+        entries = journal.entries(subtitle)
+    """
+    blocks: List[Tuple[SubBlock, int, int]]
+
+    def __init__(self, subtitle: Subtitle) -> None:
+        # the same stable sort unscramble does, so positions follow the order of the cleaned file.
+        self.blocks = [(block, block.start_ms, block.end_ms)
+                       for block in sorted(subtitle.blocks, key=lambda b: b.start_ms)]
+
+    def entries(self, subtitle: Subtitle) -> List[JournalEntry]:
+        """The removed and retimed blocks in file order, to be called after the subtitle was cleaned."""
+        kept: Dict[int, SubBlock] = {id(block): block for block in subtitle.blocks}
+        entries = []
+        waiting = []
+        previous_index = 0
+        for position, (block, start_ms, end_ms) in enumerate(self.blocks):
+            if id(block) not in kept:
+                entry = JournalEntry(REMOVED, block, position, start_ms, end_ms)
+                entry.previous_index = previous_index
+                entries.append(entry)
+                waiting.append(entry)
+                continue
+            for entry in waiting:
+                entry.next_index = block.current_index
+            waiting.clear()
+            previous_index = block.current_index
+            if (block.start_ms, block.end_ms) != (start_ms, end_ms):
+                entries.append(JournalEntry(RETIMED, block, position, start_ms, end_ms))
+        return entries
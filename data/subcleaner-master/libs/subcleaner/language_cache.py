@@ -0,0 +1,78 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+
+# the content_hash a subtitle had when its language was detected, the most probable language, its probability and how
+# many characters of content were sampled, keyed by the resolved path of the subtitle.
+Detection = Tuple[str, str, float, int]
+detections: Dict[str, Detection] = {}
+# detections made by this process since the last take_new(), handed from worker processes to the parent.
+new_detections: Dict[str, Detection] = {}
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("UTF-8", "surrogatepass")).hexdigest()
+
+
+def get(file: Path, digest: str) -> Optional[Tuple[str, float, int]]:
+    """The language, probability and sample length detected for the file, None when its content changed since."""
+    detection = detections.get(str(file.resolve()))
+    if detection is None or detection[0] != digest:
+        return None
+    return detection[1:]
+
+
+def add(file: Path, digest: str, language: str, probability: float, sample_length: int) -> None:
+    key = str(file.resolve())
+    detections[key] = new_detections[key] = (digest, language, probability, sample_length)
+
+
+def update(items: Dict[str, Detection]) -> None:
+    detections.update(items)
+
+
+def take_new() -> Dict[str, Detection]:
+    global new_detections
+    items, new_detections = new_detections, {}
+    return items
+
+
+def load(cache_file: Path) -> None:
+    """Add the detections saved by earlier runs, a missing or unreadable file is skipped."""
+    try:
+        with cache_file.open("r", encoding="UTF-8") as file:
+            data = json.load(file)
+        if data.get("version") != CACHE_VERSION:
+            return
+        detections.update((path, (digest, language, probability, sample_length))
+                          for path, (digest, language, probability, sample_length) in data["detections"].items())
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"could not read language cache {cache_file}, starting a new one. reason: {e}")
+
+
+def save(cache_file: Path) -> None:
+    """Save the detections, leaving out those of subtitles that were deleted or renamed since."""
+    data = {"version": CACHE_VERSION,
+            "detections": {path: detection for path, detection in detections.items() if os.path.exists(path)}}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name)
+        try:
+            with os.fdopen(fd, "w", encoding="UTF-8") as file:
+                json.dump(data, file)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"could not save language cache {cache_file}. reason: {e}")
@@ -1,33 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import logging
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional, Tuple
+from .ad_registry import AdRegistry
+from .sub_block import SubBlock
 from .subtitle import Subtitle, ParsingException, FileContentException
-from libs.subcleaner import cleaner, report_generator, languages, regex_lists
-from .settings import args, config
+from libs.subcleaner import ad_registry, cleaner, language_cache, report_generator, languages, regex_lists
+from .settings import args, config, log_config
 
 logger = logging.getLogger(__name__)
 
 files_handled: List[str] = []
 files_failed: Dict[str, str] = {}
+ad_blocks = AdRegistry()
+warning_blocks = AdRegistry()
+
+
+class FileResult:
+    """The outcome of cleaning one file, merged into the run's state by the process that started the run."""
+    file: Path
+    short_path: Path
+    failure: Optional[str]
+    ad_blocks: List[SubBlock]
+    warning_blocks: List[SubBlock]
+    log_records: List[Tuple[int, str, str]]
+    detections: Dict[str, language_cache.Detection]
+
+    def __init__(self, file: Path) -> None:
+        self.file = file
+        self.short_path = file
+        self.failure = None
+        self.ad_blocks = []
+        self.warning_blocks = []
+        self.log_records = []
+        self.detections = {}
+
+    def fail(self, reason: str) -> "FileResult":
+        self.failure = reason
+        return self
 
 
 def main():
+    args.parse_args()
+    log_config.configure_logging()
+    if config.use_language_cache:
+        language_cache.load(config.language_cache_file)
     try:
-        for file in args.subtitles:
-            if file.suffix == ".srt":
-                logger.debug(f"cleaning file: {file}")
-                clean_file(file)
-
-        logger.debug(f"path libraries: {args.libraries}")
-        for library in args.libraries:
-            logger.debug(f"cleaning library: {library}")
-            clean_directory(library)
+        clean_files(list(find_files()), args.processes)
     except KeyboardInterrupt:
         logger.info("subcleaner aborted")
 
     if files_handled:
+        if config.use_language_cache:
+            language_cache.save(config.language_cache_file)
+        library_ad_blocks = None
+        if config.use_ad_registry and not args.dry_run and (ad_blocks or warning_blocks):
+            library_ad_blocks = ad_registry.record(config.ad_registry_file, ad_blocks, warning_blocks)
         if args.end_report and len(files_handled) > 1:
-            logger.info("end of run report: \n" + report_generator.generate_end_report())
+            logger.info("end of run report: \n" +
+                        report_generator.generate_end_report(ad_blocks, warning_blocks, library_ad_blocks))
 
         if not files_failed:
             logger.info(f"subcleaner finished successfully. {len(files_handled)} files cleaned.")
@@ -51,33 +82,113 @@ def main():
                 print("subcleaner didn't find any files to clean!")
 
 
-def clean_file(subtitle_file: Path) -> None:
-    if subtitle_file.name in files_handled or subtitle_file.name in files_failed:
+def find_files() -> Iterator[Path]:
+    """The files to clean, in order. Of files sharing a name only the first is cleaned."""
+    names = set()
+    for file in _find_all_files():
+        if file.name not in names:
+            names.add(file.name)
+            yield file
+
+
+def _find_all_files() -> Iterator[Path]:
+    for file in args.subtitles:
+        if file.suffix == ".srt":
+            logger.debug(f"cleaning file: {file}")
+            yield file
+
+    logger.debug(f"path libraries: {args.libraries}")
+    for library in args.libraries:
+        logger.debug(f"cleaning library: {library}")
+        yield from find_library_files(library)
+
+
+def clean_files(files: List[Path], processes: int = 1) -> None:
+    """Clean files one after the other, or spread over a pool of worker processes when processes > 1."""
+    if processes <= 1 or len(files) <= 1:
+        for file in files:
+            merge_result(clean_file(file))
         return
+
+    # workers hand back their log records with the result, so every file's log stays in one piece and in order.
+    with ProcessPoolExecutor(processes, initializer=_init_worker,
+                             initargs=(args.get_settings(), logging.getLogger().level,
+                                       language_cache.detections)) as executor:
+        for result in executor.map(_clean_file_in_worker, files):
+            for level, name, message in result.log_records:
+                logging.getLogger(name).log(level, message)
+            merge_result(result)
+
+
+def merge_result(result: FileResult) -> None:
+    language_cache.update(result.detections)
+    file = result.file.resolve()
+    for block in result.ad_blocks:
+        ad_blocks.add(block, file)
+    for block in result.warning_blocks:
+        warning_blocks.add(block, file)
+    if result.failure is None:
+        files_handled.append(result.file.name)
+    else:
+        files_failed[result.file.name] = result.failure
+
+
+class _RecordCollector(logging.Handler):
+    records: List[Tuple[int, str, str]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append((record.levelno, record.name, record.getMessage()))
+
+
+_collector = _RecordCollector()
+
+
+def _init_worker(settings: Dict[str, object], level: int, detections: Dict[str, language_cache.Detection]) -> None:
+    args.set_settings(settings)
+    language_cache.update(detections)
+    base_logger = logging.getLogger()
+    base_logger.handlers.clear()
+    base_logger.setLevel(level)
+    base_logger.addHandler(_collector)
+
+
+def _clean_file_in_worker(subtitle_file: Path) -> FileResult:
+    _collector.records = []
+    result = clean_file(subtitle_file)
+    result.log_records = _collector.records
+    result.detections = language_cache.take_new()
+    return result
+
+
+def clean_file(subtitle_file: Path) -> FileResult:
+    result = FileResult(subtitle_file)
     logger.info("[---------------------------------------------------------------------------------]")
     try:
         short_file = subtitle_file.relative_to(config.relative_base)
     except ValueError:
         short_file = subtitle_file
+    result.short_path = short_file
     try:
         logger.info(f"loading subtitle: {short_file}")
         subtitle = Subtitle(subtitle_file)
     except (UnicodeDecodeError, ParsingException, FileContentException) as e:
         logger.error(f"subcleaner was unable to decode the file. reason:")
         logger.error(e)
-        files_failed[subtitle_file.name] = f"subcleaner was unable to decode the file: {e}"
-        return
+        return result.fail(f"subcleaner was unable to decode the file: {e}")
     if not subtitle:
         logger.warning("Subtitle file is empty.")
-        files_failed[subtitle_file.name] = "Subtitle file is empty."
-        return
+        return result.fail("Subtitle file is empty.")
     if config.require_language_profile and not regex_lists.language_has_profile(subtitle.language):
         logger.warning(f"language '{subtitle.language}' have no regex profile associated with it.")
         logger.warning(f"either create a regex profile for it or disable require_language_profile in the config.")
-        files_failed[subtitle_file.name] = f"language '{subtitle.language}' have no regex profile associated with it."
-        return
+        return result.fail(f"language '{subtitle.language}' have no regex profile associated with it.")
 
     logger.info(f"now cleaning subtitle: {subtitle.short_path}")
+    result.short_path = subtitle.short_path
 
     if not subtitle.language_is_correct():
         logger.warning(f"the language within the file does not match language: '{subtitle.language}'")
@@ -87,9 +198,10 @@ def clean_file(subtitle_file: Path) -> None:
     if subtitle.ad_blocks:
         changes = True
     cleaner.remove_ads(subtitle)
+    result.ad_blocks = sorted(subtitle.ad_blocks, key=lambda b: b.original_index or 0)
+    result.warning_blocks = sorted(subtitle.warning_blocks, key=lambda b: b.current_index or 0)
     if config.fix_overlaps:
         changes = changes or cleaner.fix_overlap(subtitle)
-    cleaner.reset()
 
     if len(subtitle.blocks) == 0:
         l = list(subtitle.ad_blocks)
@@ -104,11 +216,9 @@ def clean_file(subtitle_file: Path) -> None:
                      "Nothing was altered.")
         if reasons:
             logger.error("all removed blocks had common reasons: " + ", ".join(reasons))
-        files_failed[subtitle_file.name] = "aborted, removed all subtitles. all removed blocks had common reasons: " + ", ".join(reasons)
-        return
+        return result.fail("aborted, removed all subtitles. all removed blocks had common reasons: " + ", ".join(reasons))
 
     logger.info(f"Done. Cleaning report:\n{report_generator.generate_report(subtitle)}\n")
-    files_handled.append(subtitle_file.name)
     if changes:
         logger.info("no ads found") 
 
@@ -117,28 +227,34 @@ def clean_file(subtitle_file: Path) -> None:
         logger.warning("dry run: nothing was altered.")
     else:
         if changes:
+            content = subtitle.to_content()
             with subtitle_file.open("w", encoding="UTF-8") as file:
-                file.write(subtitle.to_content())
+                file.write(content)
+            # the cleaned file is in the same language, so cleaning it again needs no detection either.
+            if subtitle.detection:
+                language_cache.add(subtitle_file, language_cache.content_hash(content), *subtitle.detection)
+    return result
 
 
-def clean_directory(directory: Path) -> None:
+def find_library_files(directory: Path) -> Iterator[Path]:
     for file in directory.iterdir():
         if file.name.startswith("."):
             continue
 
         if file.is_dir() and not file.is_symlink():
-            clean_directory(file)
+            yield from find_library_files(file)
 
         if not file.is_file() or file.suffix != ".srt":
             continue
 
         if not args.language:
             logger.debug(f"cleaning file: {file}")
-            clean_file(file)
+            yield file
             continue
 
         for suffix in file.suffixes[max(-3, -len(file.suffixes)):-1]:
             parsed_lang = suffix.replace(":", "-").replace("_", "-").split("-")[0][1:]
             if languages.is_language(parsed_lang) and args.language == parsed_lang:
                 logger.debug(f"cleaning file: {file}")
-                clean_file(file)
+                yield file
+                break
@@ -1,7 +1,12 @@
 import configparser
 import re
 from pathlib import Path
-from typing import List, Dict, Tuple, Pattern
+from typing import List, Dict, Tuple, Pattern, Optional, FrozenSet
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
 
 from libs.subcleaner.settings import config
 import logging
@@ -11,6 +16,8 @@ logger = logging.getLogger(__name__)
 global_profiles: List["GlobalProfile"] = []
 purge_regex: Dict[str, List[Tuple[str, Pattern]]] = {}
 warning_regex: Dict[str, List[Tuple[str, Pattern]]] = {}
+_purge_matchers: Dict[str, "RegexMatcher"] = {}
+_warning_matchers: Dict[str, "RegexMatcher"] = {}
 
 
 def language_has_profile(language: str):
@@ -29,6 +36,127 @@ def get_warning_regex(language: str) -> List[Tuple[str, Pattern]]:
     return warning_regex["no_profile"]
 
 
+def get_purge_matcher(language: str) -> "RegexMatcher":
+    if language not in purge_regex:
+        language = "no_profile"
+    if language not in _purge_matchers:
+        _purge_matchers[language] = RegexMatcher(purge_regex[language])
+    return _purge_matchers[language]
+
+
+def get_warning_matcher(language: str) -> "RegexMatcher":
+    if language not in warning_regex:
+        language = "no_profile"
+    if language not in _warning_matchers:
+        _warning_matchers[language] = RegexMatcher(warning_regex[language])
+    return _warning_matchers[language]
+
+
+class RegexMatcher:
+    """
+    Runs a language's regex list against block content, skipping regexes that can't match.
+
+    Every regex is analyzed once for literal text any match must contain, e.g. "opensubtitles"
+    or one of "subs by"/"subtitles by". A regex is only run when the block contains that
+    literal, compared case-insensitively. Regexes without a usable literal always run.
+    """
+    MIN_LITERAL_LENGTH = 3
+    # characters that re.IGNORECASE matches with "i" but that don't casefold to it.
+    _FOLD_TABLE = {0x130: "i", 0x131: "i"}
+
+    entries: List[Tuple[str, Pattern, Optional[FrozenSet[str]]]]
+    literals: FrozenSet[str]
+
+    def __init__(self, regex_list: List[Tuple[str, Pattern]]) -> None:
+        self.entries = [(key, regex, _required_literals(regex)) for key, regex in regex_list]
+        self.literals = frozenset().union(*(literals for _, _, literals in self.entries if literals))
+
+    def find_matches(self, clean_content: str) -> List[Tuple[str, int]]:
+        """(key, number of distinct matches) of every regex matching clean_content, in list order."""
+        folded = clean_content.lower() if clean_content.isascii() else \
+            clean_content.translate(self._FOLD_TABLE).casefold()
+        present = set(filter(folded.__contains__, self.literals))
+        matches = []
+        for key, regex, literals in self.entries:
+            if literals is not None and literals.isdisjoint(present):
+                continue
+            try:
+                result = regex.findall(clean_content)
+            except re.error as e:
+                raise ValueError(f"regex {key} is miss configured: {e.msg}")
+            if result and isinstance(result[0], str):
+                result = set(r.lower() for r in result)
+            else:
+                result = set(t[0].lower() for t in result)
+            if result:
+                matches.append((key, len(result)))
+        return matches
+
+
+def _required_literals(regex: Pattern) -> Optional[FrozenSet[str]]:
+    """Literals of which every match of regex contains at least one, or None if there is no such set worth checking."""
+    try:
+        parsed = sre_parse.parse(regex.pattern, regex.flags)
+    except (re.error, TypeError, ValueError):
+        return None
+    literals = _sequence_literals(list(parsed))
+    if literals is None or min(map(len, literals)) < RegexMatcher.MIN_LITERAL_LENGTH:
+        return None
+    return literals
+
+
+def _sequence_literals(items: list) -> Optional[FrozenSet[str]]:
+    candidates = []
+    run = ""
+    for op, av in items:
+        if op is sre_parse.LITERAL and av < 128:
+            run += chr(av).casefold()
+            continue
+        alternatives = _branch_alternatives(op, av)
+        if run and alternatives:
+            # the literal just before a branch continues into the literal each alternative starts with.
+            candidates.append(frozenset(run + _leading_literal(alternative) for alternative in alternatives))
+        if run:
+            candidates.append(frozenset([run]))
+            run = ""
+        if op is sre_parse.SUBPATTERN:
+            candidates.append(_sequence_literals(list(av[-1])))
+        elif op is getattr(sre_parse, "ATOMIC_GROUP", None):
+            candidates.append(_sequence_literals(list(av)))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, "POSSESSIVE_REPEAT", None)):
+            if av[0] >= 1:
+                candidates.append(_sequence_literals(list(av[2])))
+        elif op is sre_parse.BRANCH:
+            alternatives = [_sequence_literals(list(alternative)) for alternative in av[1]]
+            if all(alternative is not None for alternative in alternatives):
+                candidates.append(frozenset().union(*alternatives))
+    if run:
+        candidates.append(frozenset([run]))
+
+    candidates = [c for c in candidates if c]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda c: (min(map(len, c)), -len(c)))
+
+
+def _branch_alternatives(op, av) -> Optional[list]:
+    """The alternatives of a branch, also when it is the only item of a group."""
+    if op is sre_parse.BRANCH:
+        return [list(alternative) for alternative in av[1]]
+    if op is sre_parse.SUBPATTERN and len(av[-1]) == 1:
+        return _branch_alternatives(*av[-1][0])
+    return None
+
+
+def _leading_literal(items: list) -> str:
+    literal = ""
+    for op, av in items:
+        if op is not sre_parse.LITERAL or av >= 128:
+            break
+        literal += chr(av).casefold()
+    return literal
+
+
 class GlobalProfile:
     excluded_languages: List[str]
     purge_regex_lines: List[Tuple[str, Pattern]]
@@ -1,12 +1,13 @@
 from pathlib import Path
 from typing import *
 
-from libs.subcleaner.cleaner import cleaner
+from libs.subcleaner.ad_registry import AdRegistry
 from libs.subcleaner.settings import args, config
 from libs.subcleaner.sub_block import SubBlock
 from libs.subcleaner.subtitle import Subtitle
 
 _report_base = "          | "
+MOST_FREQUENT_ADS = 20
 _report: str
 
 
@@ -27,16 +28,27 @@ def generate_report(subtitle: Subtitle) -> str:
     return _report[1:]
 
 
-def generate_end_report() -> str:
+def generate_end_report(ad_blocks: AdRegistry, warning_blocks: AdRegistry,
+                        library_ad_blocks: Optional[AdRegistry] = None) -> str:
     _reset()
     _add("")
-    _add(_end_deleted_card(cleaner.ad_blocks), " " * 4)
+    if library_ad_blocks:
+        _add(_most_frequent_card(library_ad_blocks), " " * 4)
+        _add("")
+    _add(_end_deleted_card(ad_blocks), " " * 4)
     _add("")
-    _add(_end_warning_card(cleaner.warning_blocks), " " * 40)
+    _add(_end_warning_card(warning_blocks), " " * 40)
     _add("")
     return _report[1:]
 
 
+def _short_path(file: Path) -> str:
+    try:
+        return str(file.relative_to(config.relative_base))
+    except ValueError:
+        return str(file)
+
+
 def _add(lines: str, spacer: str = "") -> None:
     lines = "\n" + lines
 
@@ -77,7 +89,17 @@ def _warning_card(warning_blocks: Set[SubBlock]) -> str:
     return card
 
 
-def _end_deleted_card(ad_blocks: Dict[SubBlock, Set[Path]]) -> str:
+def _most_frequent_card(ad_blocks: AdRegistry) -> str:
+    card = "[-----Most Frequent Ads in Library----]\n"
+    for entry in ad_blocks.most_frequent(MOST_FREQUENT_ADS):
+        card += f"removed {entry.count} times from {len(entry.files)} subtitles:\n"
+        card += f"{entry.block.content}\n"
+        card += "\n"
+    card = card[:-1] + "[---------------------------------]"
+    return card
+
+
+def _end_deleted_card(ad_blocks: AdRegistry) -> str:
 
     ad_blocks_list = list((key, value) for key, value in ad_blocks.items())
     ad_blocks_list.sort(key=lambda b: len(b[1]))
@@ -92,13 +114,13 @@ def _end_deleted_card(ad_blocks: Dict[SubBlock, Set[Path]]) -> str:
         card += f"{block[0]}\n"
         if args.explain:
             card += f"reasons: ({', '.join(block[0].hints)})\n"
-        card += "subtitles: \n" + "\n".join(map(str, block[1])) + "\n"
+        card += "subtitles: \n" + "\n".join(sorted(map(_short_path, block[1]))) + "\n"
         card += "\n"
     card = card[:-1] + "[---------------------------------]"
     return card
 
 
-def _end_warning_card(warning_blocks: Dict[SubBlock, Set[Path]]) -> str:
+def _end_warning_card(warning_blocks: AdRegistry) -> str:
     ad_blocks_list = list((key, value) for key, value in warning_blocks.items())
     ad_blocks_list.sort(key=lambda b: len(b[1]), reverse=True)
     card = "[---------All Warning Blocks----------]\n"
@@ -109,7 +131,7 @@ def _end_warning_card(warning_blocks: Dict[SubBlock, Set[Path]]) -> str:
         card += f"{block[0]}\n"
         if args.explain:
             card += f"reasons: ({', '.join(block[0].hints)})\n"
-        card += "subtitles: \n" + "\n".join(map(str, block[1])) + "\n"
+        card += "subtitles: \n" + "\n".join(sorted(map(_short_path, block[1]))) + "\n"
         card += "\n"
     card = card[:-1] + "[---------------------------------]"
     return card
@@ -4,7 +4,7 @@ import glob
 import os
 import pathlib
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from libs.subcleaner import languages
 from . import config
@@ -106,77 +106,116 @@ parser.add_argument("--end-report", action="store_true", dest="end_report",
                          "removed blocks with less than 9 warnings are sorted from fewest removed block with same content "
                          "and warning is sorted from most warned blocks with the same content. (debug)")
 
+processes: int
+parser.add_argument("--processes", "-p", metavar="N", type=int, dest="processes", default=1,
+                    help="Processes: clean the subtitles spread over N worker processes, useful for whole libraries. "
+                         "The reports are still printed one file at a time and in order. Default: 1")
+
 debug: bool
 parser.add_argument("--debug", action="store_true", dest="debug",
                     help="Debug: argument collection that contains arguments: "
                          "--dry-run, --sensitive and --end-report")
 
-args = parser.parse_args()
-# check usage:
-
-if len(args.subtitle) == 0 and len(args.library) == 0:
-    parser.print_help()
-    exit()
-
-debug = args.debug
-if debug:
-    print("debug mode.")
-
-if debug:
-    print(f"arg.library: {args.library}")
-
-libraries = []
-for library_str in args.library:
-    library: Path = Path(library_str)
-    if not library.is_absolute():
-        if library_str[0:2] == "./":
-            library = Path.cwd().joinpath(library)
-        else:
-            library = config.relative_base.joinpath(library)
-    if isinstance(library, pathlib.WindowsPath):
-        check_disk_liveliness(Path(library.drive + "/"))
-
-    for item in glob.glob(glob.escape(str(library)).replace("[*]", "*")):
-        item = Path(item).resolve()
-        if item.is_dir():
-            libraries.append(item)
-
-if debug:
-    print(f"arg.subtitle: {args.subtitle}")
-
 subtitles = []
-for file_str in args.subtitle:
-    file = Path(file_str)
-    if not file.is_absolute():
-        if file_str[0:2] == "./":
-            file = Path.cwd().joinpath(file)
-        else:
-            file = config.relative_base.joinpath(file)
-    if isinstance(file, pathlib.WindowsPath):
-        check_disk_liveliness(Path(file.drive + "/"))
-
-    for item in glob.glob(glob.escape(str(file)).replace("[*]", "*")):
-        item = Path(item).resolve()
-        if item.is_file() and item.name[-4:] == ".srt":
-            subtitles.append(item)
-
+libraries = []
 language = None
-if args.language:
-    language = args.language.replace("-", ":").split(":")[0].replace("\"", "").replace("'", "").lower()
-    if not languages.is_language(language):
-        logger.error("'" + args.language + "' is not a valid ISO-639 language.\n--help for more information.")
+destroy_list = []
+silent = False
+no_log = False
+dry_run = False
+errors_only = False
+removed_only = False
+sensitive = False
+explain = True
+end_report = False
+processes = 1
+debug = False
+
+# the settings a worker process needs to clean files the way the main process would.
+SETTINGS = ("subtitles", "libraries", "language", "destroy_list", "silent", "no_log", "dry_run", "errors_only",
+            "removed_only", "sensitive", "explain", "end_report", "processes", "debug")
+
+
+def get_settings() -> Dict[str, object]:
+    return {name: globals()[name] for name in SETTINGS}
+
+
+def set_settings(settings: Dict[str, object]) -> None:
+    globals().update((name, settings[name]) for name in SETTINGS)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> None:
+    """Parse the command line into this module's settings. Not called when subcleaner is used as a library."""
+    global args, debug, libraries, subtitles, language, destroy_list, silent, no_log, dry_run, errors_only, \
+        removed_only, sensitive, explain, end_report, processes
+
+    args = parser.parse_args(argv)
+    # check usage:
+
+    if len(args.subtitle) == 0 and len(args.library) == 0:
+        parser.print_help()
+        exit()
+
+    debug = args.debug
+    if debug:
+        print("debug mode.")
+
+    if debug:
+        print(f"arg.library: {args.library}")
+
+    libraries = []
+    for library_str in args.library:
+        library: Path = Path(library_str)
+        if not library.is_absolute():
+            if library_str[0:2] == "./":
+                library = Path.cwd().joinpath(library)
+            else:
+                library = config.relative_base.joinpath(library)
+        if isinstance(library, pathlib.WindowsPath):
+            check_disk_liveliness(Path(library.drive + "/"))
+
+        for item in glob.glob(glob.escape(str(library)).replace("[*]", "*")):
+            item = Path(item).resolve()
+            if item.is_dir():
+                libraries.append(item)
+
+    if debug:
+        print(f"arg.subtitle: {args.subtitle}")
+
+    subtitles = []
+    for file_str in args.subtitle:
+        file = Path(file_str)
+        if not file.is_absolute():
+            if file_str[0:2] == "./":
+                file = Path.cwd().joinpath(file)
+            else:
+                file = config.relative_base.joinpath(file)
+        if isinstance(file, pathlib.WindowsPath):
+            check_disk_liveliness(Path(file.drive + "/"))
+
+        for item in glob.glob(glob.escape(str(file)).replace("[*]", "*")):
+            item = Path(item).resolve()
+            if item.is_file() and item.name[-4:] == ".srt":
+                subtitles.append(item)
+
+    language = None
+    if args.language:
+        language = args.language.replace("-", ":").split(":")[0].replace("\"", "").replace("'", "").lower()
+        if not languages.is_language(language):
+            logger.error("'" + args.language + "' is not a valid ISO-639 language.\n--help for more information.")
+            exit(1)
+
+    destroy_list = args.destroy
+    if destroy_list and (len(subtitles) != 1 or len(libraries) != 0):
+        logger.error("option --destroy require one and only one specified subtitle file.\nsee --help for more info.")
         exit(1)
 
-destroy_list = args.destroy
-if destroy_list and (len(subtitles) != 1 or len(libraries) != 0):
-    logger.error("option --destroy require one and only one specified subtitle file.\nsee --help for more info.")
-    exit(1)
-
-silent = args.silent
-no_log = args.no_log
-dry_run = args.dry_run or args.debug
-errors_only = args.errors_only
-removed_only = args.removed_only
-sensitive = args.sensitive or args.debug
-explain = not args.no_explain
-end_report = args.end_report or args.debug
+    silent = args.silent
+    no_log = args.no_log
+    dry_run = args.dry_run or args.debug
+    errors_only = args.errors_only
+    removed_only = args.removed_only
+    sensitive = args.sensitive or args.debug
+    explain = not args.no_explain
+    end_report = args.end_report or args.debug
+    processes = max(1, args.processes)
@@ -1,7 +1,7 @@
 import logging
 from configparser import ConfigParser
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import libs
 from libs.subcleaner import languages
@@ -32,6 +32,7 @@ use_default_regex: bool
 fix_overlaps: bool
 relative_base: Path
 default_language: Optional[str]
+detection_prior_map: Optional[Dict[str, float]]
 config_file = home_dir.joinpath("subcleaner.conf")
 
 if not config_file.is_file():
@@ -60,6 +61,12 @@ relative_base = relative_base.resolve()
 
 fix_overlaps = cfg['SETTINGS'].getboolean("fix_overlaps", True)
 
+use_ad_registry = cfg['SETTINGS'].getboolean("ad_registry", True)
+ad_registry_file = home_dir.joinpath("databases", "ad_registry.json")
+
+use_language_cache = cfg['SETTINGS'].getboolean("language_cache", True)
+language_cache_file = home_dir.joinpath("databases", "language_cache.json")
+
 default_language = cfg['SETTINGS'].get("default_language", "")
 if default_language in ["blank", "Blank", "", "empty", "Empty"]:
     default_language = None
@@ -68,5 +75,16 @@ if default_language:
         logger.error("Config error: default language code must be a valid ISO:639 language. Exiting")
         exit(1)
 
+detection_prior_map = {}
+for language in cfg['SETTINGS'].get("detection_languages", "").replace(" ", "").split(","):
+    if not language:
+        continue
+    if not languages.is_language(language) or not languages.get_2letter_code(language):
+        logger.error(f"Config error: detection language '{language}' must be a valid ISO:639 language with a 2 letter "
+                     f"code. Exiting")
+        exit(1)
+    detection_prior_map[languages.get_2letter_code(language)] = 1.0
+detection_prior_map = detection_prior_map or None
+
 use_english_on_all = cfg['SETTINGS'].getboolean("use_english_on_all", False)
 require_language_profile = cfg['SETTINGS'].getboolean("require_language_profile", True)
@@ -1,26 +1,52 @@
 import datetime
 import logging
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# the common "00:01:02,345 --> 00:01:04,567" header. Anything else goes through time_string_to_timedelta.
+TIMEFRAME_REGEX = re.compile(r" *([0-9]+):([0-5][0-9]):([0-5][0-9])[,.]([0-9]{3}) *--> *"
+                             r"([0-9]+):([0-5][0-9]):([0-5][0-9])[,.]([0-9]{3})")
+CLEAN_CONTENT_REGEX = re.compile("[\\s.,:_-]")
+MILLISECONDS_PER_DAY = 24 * 3600 * 1000
+
 
 class SubBlock:
+    __slots__ = ("original_index", "current_index", "content", "_clean_content", "start_ms", "end_ms",
+                 "regex_matches", "hints")
+
     original_index: int
-    current_index: int
+    current_index: Optional[int]
     content: str
-    clean_content: str
-    start_time: datetime.timedelta
-    end_time: datetime.timedelta
-    regex_matches = 0
+    start_ms: int
+    end_ms: int
+    regex_matches: int
     hints: List[str]
 
     def __init__(self, block_content: str, original_index_actual: int):
         lines = block_content.strip().split("\n")
+        self._parse(lines, [parse_timeframe(line) for line in lines[:2]], original_index_actual)
+
+    @classmethod
+    def from_lines(cls, lines: List[str], timeframes: List[Optional[Tuple[int, int]]],
+                   original_index_actual: int) -> "SubBlock":
+        """Build a block from stripped lines whose first two timeframes are already parsed."""
+        block = cls.__new__(cls)
+        block._parse(lines, timeframes, original_index_actual)
+        return block
+
+    def _parse(self, lines: List[str], timeframes: List[Optional[Tuple[int, int]]], original_index_actual: int):
+        self.current_index = None
+        self._clean_content = None
+        self.regex_matches = 0
+        self.hints = []
 
-        if self.is_sub_block_header(lines[0]) and len(lines) > 1 and not self.is_sub_block_header(lines[1]):
+        if timeframes[0] and len(lines) > 1 and not timeframes[1]:
             lines = [""] + lines
+            timeframe = timeframes[0]
+        else:
+            timeframe = timeframes[1] if len(lines) > 1 else None
 
         if lines[0].isnumeric():
             self.original_index = int(lines[0])
@@ -36,33 +62,28 @@ class SubBlock:
             else:
                 self.original_index = original_index_actual
 
-        if len(lines) < 2 or not self.is_sub_block_header(lines[1]):
+        if not timeframe:
             raise ParsingException(self.original_index, "incorrectly formatted subtitle block")
-
-        times = lines[1].replace(" ", "").split("-->")
-        try:
-            self.start_time = time_string_to_timedelta(times[0])
-            self.end_time = time_string_to_timedelta(times[1])
-        except ValueError:
-            raise ParsingException(self.original_index, "failed to parse timeframe.")
-        except IndexError:
-            raise ParsingException(self.original_index, "failed to parse timeframe.")
+        self.start_ms, self.end_ms = timeframe
 
         if len(lines) > 2:
             self.content = "\n".join(lines[2:]).strip()
         else:
             self.content = ""
         self.content = self.content.replace("</br>", "\n")
-        self.clean_content = re.sub("[\\s.,:_-]", "", self.content)
-        self.hints = []
+
+    @property
+    def clean_content(self) -> str:
+        """The content without whitespace and punctuation, computed on first use."""
+        if self._clean_content is None:
+            self._clean_content = CLEAN_CONTENT_REGEX.sub("", self.content)
+        return self._clean_content
 
     def equal_content(self, block: "SubBlock") -> bool:
-        t = re.sub("[\\s.,:_-]", "", self.content)
-        o = re.sub("[\\s.,:_-]", "", block.content)
-        return t == o
+        return self.clean_content == block.clean_content
 
     def __str__(self) -> str:
-        string = f"{timedelta_to_time_string(self.start_time)} --> {timedelta_to_time_string(self.end_time)}\n" \
+        string = f"{milliseconds_to_time_string(self.start_ms)} --> {milliseconds_to_time_string(self.end_ms)}\n" \
                  f"{self.content}"
         return string
 
@@ -70,23 +91,15 @@ class SubBlock:
     def is_sub_block_header(cls, line: str) -> bool:
         if "\n" in line:
             return False
+        return parse_timeframe(line) is not None
 
-        times = line.replace(" ", "").split("-->")
-        if len(times) < 2:
-            return False
-        try:
-            time_string_to_timedelta(times[0])
-            time_string_to_timedelta(times[1])
-        except ValueError:
-            return False
-        except IndexError:
-            return False
-
-        return True
+    @property
+    def duration_ms(self) -> int:
+        return self.end_ms - self.start_ms
 
     @property
     def duration_seconds(self) -> float:
-        return (self.end_time - self.start_time).total_seconds()
+        return (self.end_ms - self.start_ms) / 1000
 
 
 class ParsingException(Exception):
@@ -103,6 +116,27 @@ class ParsingException(Exception):
         return f"Parsing error at block {self.block_index} in file \"{self.subtitle_file}\" line {self.file_line}. reason: {self.reason}"
 
 
+def parse_timeframe(line: str) -> Optional[Tuple[int, int]]:
+    """(start, end) in milliseconds when line is a subtitle block header, otherwise None."""
+    if ">" not in line:
+        return None
+    match = TIMEFRAME_REGEX.match(line)
+    if match:
+        h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, match.groups())
+        return ((h1 * 60 + m1) * 60 + s1) * 1000 + ms1, ((h2 * 60 + m2) * 60 + s2) * 1000 + ms2
+
+    times = line.replace(" ", "").split("-->")
+    if len(times) < 2:
+        return None
+    try:
+        start_time = time_string_to_timedelta(times[0])
+        end_time = time_string_to_timedelta(times[1])
+    except (ValueError, IndexError, OverflowError):
+        return None
+    millisecond = datetime.timedelta(milliseconds=1)
+    return start_time // millisecond, end_time // millisecond
+
+
 def time_string_to_timedelta(time_string: str) -> datetime.timedelta:
     time = time_string.replace(",", ".").replace(" ", "")
     split = time.split(":")
@@ -131,6 +165,13 @@ def time_string_to_timedelta(time_string: str) -> datetime.timedelta:
                               seconds=seconds)
 
 
+def milliseconds_to_time_string(milliseconds: int) -> str:
+    if not 0 <= milliseconds < MILLISECONDS_PER_DAY:
+        return timedelta_to_time_string(datetime.timedelta(milliseconds=milliseconds))
+    return "%02d:%02d:%02d,%03d" % (milliseconds // 3600000, milliseconds // 60000 % 60, milliseconds // 1000 % 60,
+                                    milliseconds % 1000)
+
+
 def timedelta_to_time_string(timedelta: datetime.timedelta) -> str:
     time_string = str(timedelta)
     if "." in time_string:
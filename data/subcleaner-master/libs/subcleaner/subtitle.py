@@ -1,10 +1,10 @@
 import logging
 import re
-from typing import List, Set, Dict
+from typing import List, Set, Optional, Tuple
 
-from . import languages
+from . import language_cache, languages
 from .settings import args, config
-from .sub_block import SubBlock, ParsingException
+from .sub_block import SubBlock, ParsingException, parse_timeframe
 from libs import langdetect
 from pathlib import Path
 
@@ -12,6 +12,10 @@ from ..langdetect import LangDetectException
 
 logger = logging.getLogger(__name__)
 
+MIN_DETECTION_LENGTH = 500
+# characters of content sampled per detection attempt, the last is as much as langdetect looks at.
+DETECTION_SAMPLE_LENGTHS = (1000, 4000, 10000)
+
 
 class Subtitle:
     blocks: List[SubBlock]
@@ -21,6 +25,8 @@ class Subtitle:
     file: Path
     short_path: Path
     pre_content_artifact: str = ""
+    content_hash: str = ""
+    detection: Optional[Tuple[str, float, int]] = None
 
     def __init__(self, subtitle_file: Path) -> None:
         self.file = subtitle_file
@@ -29,6 +35,7 @@ class Subtitle:
         self.warning_blocks = set()
 
         file_content = read_file(self.file)
+        self.content_hash = language_cache.content_hash(file_content)
         self._parse_file_content(file_content)
 
         for i in range(len(self.blocks)):
@@ -53,13 +60,13 @@ class Subtitle:
             prev_block = self.blocks[0]
             blocks_to_remove: Set[SubBlock] = set()
             for block in self.blocks[1:]:
-                if block.content == prev_block.content and (block.start_time - prev_block.end_time).total_seconds() < 1/31:
-                    prev_block.end_time = block.end_time
+                if block.content == prev_block.content and block.start_ms - prev_block.end_ms < 1000 / 31:
+                    prev_block.end_ms = block.end_ms
                     blocks_to_remove.add(block)
                     continue
                 prev_block = block
-            for block in blocks_to_remove:
-                self.blocks.remove(block)
+            if blocks_to_remove:
+                self.blocks = [block for block in self.blocks if block not in blocks_to_remove]
 
     def warn(self, block: SubBlock):
         if block not in self.ad_blocks:
@@ -74,28 +81,46 @@ class Subtitle:
 
     def _parse_file_content(self, file_content: str) -> None:
         file_content = file_content.replace("—>", "-->")
-        current_line = 0
-        line_lookup: Dict[str, int] = {}
-
-        lines = file_content.split("\n")
-        if len(lines) < 2:
+        if file_content.count("\n") < 1:
             raise FileContentException(self.file)
-        for line in lines:
-            current_line += 1
-            if "-->" in line:
-                line_lookup[line] = current_line
+        self._file_content = file_content
+        self._line_lookup = None
+
         file_content = re.sub(r'\n\s*\n', '\n', file_content)
         file_content = file_content.strip()
-        file_content_lines = file_content.split("\n")
-        file_content_lines.append("")
-        self._breakup_block(file_content_lines, line_lookup)
-
-    def _breakup_block(self, lines: List[str], line_lookup: Dict[str, int]) -> None:
+        lines = file_content.split("\n")
+        lines.append("")
+        timeframes = [parse_timeframe(line) for line in lines]
+        # a header starts a block unless the line after it is a header as well.
+        block_starts = [bool(timeframes[i]) and not timeframes[i + 1] for i in range(len(lines) - 1)] + [False]
+        try:
+            self._breakup_block(lines, timeframes, block_starts)
+        finally:
+            del self._file_content, self._line_lookup
+
+    def _file_line(self, lines: List[str], index: int) -> Optional[int]:
+        if self._line_lookup is None:
+            self._line_lookup = {}
+            for line_number, line in enumerate(self._file_content.split("\n"), 1):
+                if "-->" in line:
+                    self._line_lookup[line] = line_number
+        file_line = self._line_lookup.get(lines[index], None)
+        if not file_line:
+            file_line = self._line_lookup.get(lines[index + 1], None)
+        return file_line
+
+    def _make_block(self, lines: List[str], timeframes: List[Optional[Tuple[int, int]]], start: int,
+                    end: int) -> SubBlock:
+        block_lines = "\n".join(lines[start:end]).strip().split("\n")
+        # stripping only ever drops lines from the end, the timeframes of the first two lines still apply.
+        return SubBlock.from_lines(block_lines, timeframes[start:start + 2], len(self.blocks) + 1)
+
+    def _breakup_block(self, lines: List[str], timeframes: List[Optional[Tuple[int, int]]],
+                       block_starts: List[bool]) -> None:
         last_break = 0
         start_index = 0
         for i in range(len(lines)):
-            line = lines[i]
-            if not SubBlock.is_sub_block_header(line) or i == len(lines)-1 or SubBlock.is_sub_block_header(lines[i+1]):
+            if not block_starts[i]:
                 continue
             start_index = i + 1
             if i == 0:
@@ -111,9 +136,7 @@ class Subtitle:
         if last_break > 1:
             e = ParsingException(1, "incorrectly formatted subtitle block")
             e.subtitle_file = self.file
-            e.file_line = line_lookup.get(lines[last_break], None)
-            if not e.file_line:
-                e.file_line = line_lookup.get(lines[last_break + 1], None)
+            e.file_line = self._file_line(lines, last_break)
             logger.warning(str(e))
 
             for line in lines[:last_break]:
@@ -122,23 +145,19 @@ class Subtitle:
                 self.pre_content_artifact += line + "\n"
 
         for i in range(start_index, len(lines)):
-            line = lines[i]
-            previous_line = lines[i-1]
-            if not SubBlock.is_sub_block_header(line) or i == len(lines)-1 or SubBlock.is_sub_block_header(lines[i+1]):
+            if not block_starts[i]:
                 continue
 
-            if previous_line[0].isnumeric():
+            if lines[i - 1][0].isnumeric():
                 next_break = i - 1
             else:
                 next_break = i
 
             try:
-                block = SubBlock("\n".join(lines[last_break:next_break]), len(self.blocks) + 1)
+                block = self._make_block(lines, timeframes, last_break, next_break)
             except ParsingException as e:
                 e.subtitle_file = self.file
-                e.file_line = line_lookup.get(lines[last_break], None)
-                if not e.file_line:
-                    e.file_line = line_lookup.get(lines[last_break+1], None)
+                e.file_line = self._file_line(lines, last_break)
                 if not self.blocks:
                     self.pre_content_artifact += "\n" + "\n".join(lines[last_break:next_break]) + "\n"
                 logger.warning(e)
@@ -152,12 +171,10 @@ class Subtitle:
                 block.hints.append("malformed_block")
             last_break = next_break
         try:
-            block = SubBlock("\n".join(lines[last_break:]), len(self.blocks) + 1)
+            block = self._make_block(lines, timeframes, last_break, len(lines))
         except ParsingException as e:
             e.subtitle_file = self.file
-            e.file_line = line_lookup.get(lines[last_break], None)
-            if not e.file_line:
-                e.file_line = line_lookup.get(lines[last_break + 1], None)
+            e.file_line = self._file_line(lines, last_break)
             logger.warning(e)
             if not self.blocks:
                 raise e
@@ -193,19 +210,11 @@ class Subtitle:
         if not language_code_2:
             return True  # unknown language.
 
-        sub_content: str = ""
-        for block in self.blocks:
-            sub_content += block.content
-
-        if len(sub_content) < 500:
+        detection = self.detect_language(0.8)
+        if detection is None:
             return True  # not enough content to estimate language.
-        try:
-            detected_language = langdetect.detect_langs(sub_content)[0]
-        except LangDetectException:
-            logger.warning(f"{self} can't be analyzed by language detector.")
-            return True
-
-        return detected_language.lang == language_code_2 and detected_language.prob > 0.8
+        detected_language, probability = detection
+        return detected_language == language_code_2 and probability > 0.8
 
     def determine_language(self) -> None:
         if config.default_language:
@@ -236,30 +245,68 @@ class Subtitle:
             return
         #  todo: parse hi and sdh properly 
 
-        sub_content: str = ""
-        for block in self.blocks:
-            sub_content += block.content
-        if len(sub_content) < 500:
-            return
-        try:
-            detected_language = langdetect.detect_langs(sub_content)[0]
-        except LangDetectException:
-            logger.warning(f"{self} can't be analyzed by language detector.")
-            return
+        detection = self.detect_language(0.9)
+        if detection and detection[1] > 0.9:
+            self.language = detection[0]
+
+    def detect_language(self, threshold: float) -> Optional[Tuple[str, float]]:
+        """
+        The most probable language of the content and its probability, None when it can't be estimated.
+
+        Detection samples more content until its probability passes the threshold, and is cached with the sample length
+        by the hash of the file, so an unchanged file is only sampled again when a higher threshold asks for more.
+        """
+        content_length = sum(len(block.content) for block in self.blocks)
+        if self.detection is None:
+            self.detection = language_cache.get(self.file, self.content_hash)
+        sampled = 0
+        if self.detection is not None:
+            language, probability, sampled = self.detection
+            if probability > threshold or sampled >= min(content_length, DETECTION_SAMPLE_LENGTHS[-1]):
+                return language, probability
+        detection = self._sample_language(threshold, content_length, sampled)
+        if detection is not None:
+            self.detection = detection
+            language_cache.add(self.file, self.content_hash, *self.detection)
+        if self.detection is None:
+            return None
+        return self.detection[:2]
+
+    def _sample_language(self, threshold: float, content_length: int,
+                         sampled: int = 0) -> Optional[Tuple[str, float, int]]:
+        """Detect the language from ever longer samples longer than sampled, until one is probable enough."""
+        if content_length < MIN_DETECTION_LENGTH:
+            return None
+        detection = None
+        for sample_length in DETECTION_SAMPLE_LENGTHS:
+            if sample_length <= sampled:
+                continue
+            try:
+                detected_language = langdetect.detect_langs(self._sample_content(sample_length, content_length),
+                                                           config.detection_prior_map)[0]
+            except LangDetectException:
+                logger.warning(f"{self} can't be analyzed by language detector.")
+                return None
+            detection = detected_language.lang, detected_language.prob, min(sample_length, content_length)
+            if detected_language.prob > threshold or sample_length >= content_length:
+                break
+        return detection
 
-        if detected_language.prob > 0.9:
-            self.language = detected_language.lang
+    def _sample_content(self, length: int, content_length: int) -> str:
+        """Evenly spaced blocks holding about length characters of content, joined at once."""
+        if length >= content_length:
+            return "\n".join(block.content for block in self.blocks)
+        count = len(self.blocks) * length // content_length + 1
+        return "\n".join(self.blocks[i * len(self.blocks) // count].content for i in range(count))
 
     def to_content(self) -> str:
-        content = self.pre_content_artifact
+        content = [self.pre_content_artifact]
         for block in self.blocks:
-            content += f"{block.current_index}\n" \
-                       f"{block}\n" \
-                       f"\n"
+            content.append(f"{block.current_index}\n{block}\n\n")
 
             if "-->" in block.content:
                 logger.warning(f"potential malformed subtitle blocks in block {block.current_index}.")
-        return content[:-1]
+        return "".join(content)[:-1]
 
     def get_warning_indexes(self) -> List[str]:
         l: List[int] = []
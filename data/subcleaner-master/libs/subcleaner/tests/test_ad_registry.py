@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from libs.subcleaner import ad_registry
+from libs.subcleaner.ad_registry import AdRegistry
+from libs.subcleaner.sub_block import SubBlock
+
+
+def block(index: int, content: str) -> SubBlock:
+    return SubBlock.from_lines([str(index), "", content], [None, (index * 1000, index * 1000 + 500)], index)
+
+
+def run(*files: Path) -> AdRegistry:
+    registry = AdRegistry()
+    for file in files:
+        registry.add(block(1, "subtitles by someone"), file)
+        registry.add(block(9, "subtitles by: some-one."), file)
+    return registry
+
+
+class AdRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.registry_file = Path(self.directory.name, "ad_registry.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_blocks_are_grouped_by_clean_content(self):
+        registry = run(Path("/a.srt"), Path("/b.srt"))
+        self.assertEqual(len(registry), 1)
+        entry, = registry.most_frequent(1)
+        self.assertEqual(entry.files, {Path("/a.srt"): 2, Path("/b.srt"): 2})
+        self.assertEqual(entry.count, 4)
+
+    def test_recording_a_file_again_does_not_count_it_twice(self):
+        ad_registry.record(self.registry_file, run(Path("/a.srt")), AdRegistry())
+        library = ad_registry.record(self.registry_file, run(Path("/a.srt"), Path("/b.srt")), AdRegistry())
+        entry, = library.most_frequent(1)
+        self.assertEqual(entry.count, 4)
+        self.assertEqual(set(entry.files), {Path("/a.srt"), Path("/b.srt")})
+
+    def test_saved_registry_is_loaded_unchanged(self):
+        ad_registry.save(self.registry_file, run(Path("/a.srt")), run(Path("/b.srt")))
+        ad_blocks, warning_blocks = AdRegistry(), AdRegistry()
+        ad_registry.load(self.registry_file, ad_blocks, warning_blocks)
+        self.assertEqual(ad_blocks.to_json(), run(Path("/a.srt")).to_json())
+        self.assertEqual(warning_blocks.to_json(), run(Path("/b.srt")).to_json())
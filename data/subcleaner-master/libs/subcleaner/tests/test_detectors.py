@@ -0,0 +1,180 @@
+import random
+import re
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Set
+
+from libs.subcleaner.cleaner import detectors, punishers
+from libs.subcleaner.sub_block import SubBlock
+from libs.subcleaner.subtitle import Subtitle
+
+
+# the detectors as they were before they used precomputed features, kept as the reference.
+def reference_punish_ad_adjacency(subtitle: Subtitle) -> None:
+    nearby_blocks: Set[SubBlock] = set()
+    for index in range(0, len(subtitle.blocks)):
+        block = subtitle.blocks[index]
+        if index < 3:
+            nearby_blocks.add(block)
+            block.hints.append("close_to_start")
+            continue
+        if index > len(subtitle.blocks) - 4:
+            nearby_blocks.add(block)
+            block.hints.append("close_to_end")
+            continue
+        for compare_block in subtitle.blocks[max(0, index - 15): min(index + 16, len(subtitle.blocks))]:
+            if compare_block.regex_matches >= 3 and compare_block != block:
+                nearby_blocks.add(block)
+                block.hints.append("nearby_ad")
+                break
+
+    adjacent_blocks: Set[SubBlock] = set()
+    for index in range(0, len(subtitle.blocks)):
+        block = subtitle.blocks[index]
+        for compare_block in subtitle.blocks[max(0, index - 1): min(index + 2, len(subtitle.blocks))]:
+            if compare_block.regex_matches >= 2 and compare_block != block:
+                if re.sub(" +", " ", block.content.replace("\n", " ").strip()).count(" ") <= 4:
+                    adjacent_blocks.add(block)
+                    break
+
+    for block in nearby_blocks:
+        block.regex_matches += 1
+
+    for block in adjacent_blocks:
+        block.regex_matches += 1
+        block.hints.append("adjacent_ad")
+
+
+def reference_detect_chain(subtitle: Subtitle) -> None:
+    chain: List[SubBlock] = []
+    identical_count = 0
+    for i in range(1, len(subtitle.blocks)):
+        block = subtitle.blocks[i]
+        pre_block = subtitle.blocks[i - 1]
+
+        link: bool = False
+
+        if reference_is_link(pre_block, block):
+            if re.sub("[\\s.,:_-]", "", pre_block.content) == re.sub("[\\s.,:_-]", "", block.content):
+                identical_count += 1
+            link = True
+
+        if link:
+            if not chain:
+                chain.append(pre_block)
+            chain.append(block)
+            continue
+
+        if len(chain) > 2 + identical_count or any(block in subtitle.ad_blocks for block in chain):
+            for chain_block in chain:
+                subtitle.ad(chain_block)
+                chain_block.hints.append("chain_block")
+
+        chain.clear()
+        identical_count = 0
+    if len(chain) > 2 + identical_count or any(block in subtitle.ad_blocks for block in chain):
+        for chain_block in chain:
+            subtitle.ad(chain_block)
+            chain_block.hints.append("chain_block")
+
+
+def reference_is_link(block: SubBlock, post_block: SubBlock) -> bool:
+    if block.start_ms > post_block.start_ms:
+        block, post_block = post_block, block
+    if timedelta(milliseconds=post_block.start_ms - block.end_ms) > timedelta(milliseconds=500):
+        return False
+
+    if len(block.content) < len(post_block.content) <= len(block.content) + 2:
+        if post_block.content.startswith(block.content) or post_block.content.endswith(block.content):
+            return True
+    elif len(post_block.content) < len(block.content) <= len(post_block.content) + 2:
+        if block.content.startswith(post_block.content) or block.content.endswith(post_block.content):
+            return True
+    elif block.content.strip() == post_block.content.strip():
+        return True
+
+    return False
+
+
+def empty_subtitle() -> Subtitle:
+    subtitle = Subtitle.__new__(Subtitle)
+    subtitle.file = Path("test.srt")
+    subtitle.blocks = []
+    subtitle.ad_blocks = set()
+    subtitle.warning_blocks = set()
+    return subtitle
+
+
+def random_subtitle(seed: int) -> Subtitle:
+    rng = random.Random(seed)
+    words = ["hey", "you", "go", "no", "what", "come", "here", "ads", "sync", "by"]
+    subtitle = empty_subtitle()
+    time = 0
+    content = "hey"
+    for index in range(rng.randint(0, 120)):
+        roll = rng.random()
+        if roll < 0.25:
+            content = content + rng.choice(["", ".", "!", " "])
+        elif roll < 0.35:
+            content = " " + content + "\t"
+        else:
+            content = " ".join(rng.choice(words) for _ in range(rng.randint(1, 9)))
+            content = content.replace(" ", rng.choice([" ", "\n", "  "]), 1)
+        time += rng.choice([0, 100, 300, 600, 2000])
+        start = time
+        time += rng.randint(200, 3000)
+        block = SubBlock.from_lines([str(index + 1), ""] + content.split("\n"), [None, (start, time)], index + 1)
+        block.content = content
+        block.current_index = index
+        block.regex_matches = rng.choice([-1, -1, -1, 0, 1, 2, 2, 3, 4])
+        if block.regex_matches >= 3:
+            subtitle.ad(block)
+        elif block.regex_matches == 2 and rng.random() < 0.5:
+            subtitle.warn(block)
+        subtitle.blocks.append(block)
+    return subtitle
+
+
+def state(subtitle: Subtitle):
+    return ([(block.regex_matches, block.hints) for block in subtitle.blocks],
+            sorted(block.current_index for block in subtitle.ad_blocks),
+            sorted(block.current_index for block in subtitle.warning_blocks))
+
+
+class DetectorTest(unittest.TestCase):
+    SEEDS = range(300)
+
+    def test_adjacency_matches_reference(self):
+        for seed in self.SEEDS:
+            expected, actual = random_subtitle(seed), random_subtitle(seed)
+            reference_punish_ad_adjacency(expected)
+            punishers.punish_ad_adjacency(actual)
+            self.assertEqual(state(actual), state(expected), f"seed {seed}")
+
+    def test_chain_matches_reference(self):
+        for seed in self.SEEDS:
+            expected, actual = random_subtitle(seed), random_subtitle(seed)
+            reference_detect_chain(expected)
+            detectors.detect_chain(actual)
+            self.assertEqual(state(actual), state(expected), f"seed {seed}")
+
+    def test_random_subtitles_have_chains_and_nearby_ads(self):
+        hints = set()
+        for seed in self.SEEDS:
+            subtitle = random_subtitle(seed)
+            punishers.punish_ad_adjacency(subtitle)
+            detectors.detect_chain(subtitle)
+            hints.update(hint for block in subtitle.blocks for hint in block.hints)
+        self.assertTrue({"nearby_ad", "adjacent_ad", "chain_block", "close_to_start", "close_to_end"} <= hints)
+
+    def test_nearby_window_excludes_block_itself(self):
+        subtitle = empty_subtitle()
+        for index in range(40):
+            block = SubBlock.from_lines([str(index + 1), "", "hello there"], [None, (index * 5000, index * 5000 + 1000)],
+                                        index + 1)
+            block.regex_matches = 3 if index == 20 else -1
+            subtitle.blocks.append(block)
+        punishers.punish_ad_adjacency(subtitle)
+        nearby = [index for index, block in enumerate(subtitle.blocks) if "nearby_ad" in block.hints]
+        self.assertEqual(nearby, [index for index in range(5, 36) if index != 20])
@@ -0,0 +1,51 @@
+import unittest
+
+from libs.subcleaner.cleaner import cleaner
+from libs.subcleaner.journal import Journal, REMOVED, RETIMED
+from libs.subcleaner.sub_block import SubBlock
+from libs.subcleaner.tests.test_detectors import empty_subtitle
+
+
+def block(index: int, start_ms: int, end_ms: int, content: str) -> SubBlock:
+    return SubBlock.from_lines([str(index), "", content], [None, (start_ms, end_ms)], index)
+
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        self.subtitle = empty_subtitle()
+        self.subtitle.blocks = [
+            block(1, 1000, 2000, "ad at the start"),
+            block(2, 3000, 4000, "hello"),
+            block(3, 3500, 5000, "overlapping"),
+            block(4, 6000, 7000, "ad in the middle"),
+            block(5, 6500, 6500, "no duration"),
+            block(6, 8000, 9000, "bye"),
+            block(7, 10000, 11000, "ad at the end"),
+        ]
+        self.journal = Journal(self.subtitle)
+        cleaner.unscramble(self.subtitle)
+        for ad in (self.subtitle.blocks[0], self.subtitle.blocks[3], self.subtitle.blocks[-1]):
+            self.subtitle.ad(ad)
+        cleaner.remove_ads(self.subtitle)
+        cleaner.fix_overlap(self.subtitle)
+
+    def test_removed_blocks_know_their_kept_neighbours(self):
+        removed = [(e.original_index, e.previous_index, e.next_index)
+                   for e in self.journal.entries(self.subtitle) if e.kind == REMOVED]
+        self.assertEqual(removed, [(1, 0, 1), (4, 2, 3), (5, 2, 3), (7, 3, None)])
+
+    def test_retimed_blocks_keep_their_original_times(self):
+        retimed = [(e.original_index, e.current_index, e.start_ms, e.end_ms, e.new_start_ms, e.new_end_ms)
+                   for e in self.journal.entries(self.subtitle) if e.kind == RETIMED]
+        self.assertEqual(retimed, [(2, 1, 3000, 4000, 3000, 3760), (3, 2, 3500, 5000, 3860, 5000)])
+
+    def test_splicing_the_journal_back_gives_the_original(self):
+        blocks = [(b.start_ms, b.end_ms, b.content) for b in self.subtitle.blocks]
+        for entry in self.journal.entries(self.subtitle):
+            if entry.kind == REMOVED:
+                blocks.insert(entry.position, (entry.start_ms, entry.end_ms, entry.content))
+            else:
+                blocks[entry.position] = (entry.start_ms, entry.end_ms, entry.content)
+        self.assertEqual(blocks, [(start_ms, end_ms, b.content) for b, start_ms, end_ms in self.journal.blocks])
+        self.assertEqual(self.journal.entries(self.subtitle)[0].to_json()["timeframe"],
+                         "00:00:01,000 --> 00:00:02,000")
@@ -0,0 +1,94 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from libs.subcleaner import language_cache
+from libs.subcleaner.settings import config
+from libs.subcleaner.sub_block import SubBlock
+from libs.subcleaner.tests.test_detectors import empty_subtitle
+
+
+def subtitle_with_lines(amount: int):
+    subtitle = empty_subtitle()
+    subtitle.blocks = [SubBlock.from_lines([str(i), "", f"line number {i:04}"], [None, (i * 1000, i * 1000 + 500)], i)
+                       for i in range(amount)]
+    subtitle.content_hash = language_cache.content_hash(str(amount))
+    return subtitle
+
+
+class LanguageTest(unittest.TestCase):
+    def tearDown(self):
+        language_cache.detections.clear()
+        language_cache.take_new()
+
+    def test_sample_is_bounded_and_evenly_spaced(self):
+        subtitle = subtitle_with_lines(1000)
+        content_length = sum(len(block.content) for block in subtitle.blocks)
+        sample = subtitle._sample_content(1000, content_length).split("\n")
+        self.assertLessEqual(sum(map(len, sample)), 1000 + len(sample[0]))
+        self.assertEqual(sample[0], "line number 0000")
+        self.assertGreaterEqual(sample[-1], "line number 0950")
+
+    def test_short_content_is_sampled_whole(self):
+        subtitle = subtitle_with_lines(10)
+        self.assertEqual(subtitle._sample_content(1000, 160), "\n".join(b.content for b in subtitle.blocks))
+
+    def test_cached_detection_skips_detector(self):
+        subtitle = subtitle_with_lines(100)
+        language_cache.add(subtitle.file, subtitle.content_hash, "en", 0.99, 1000)
+        with mock.patch("libs.langdetect.detect_langs", side_effect=AssertionError("detector was used")):
+            self.assertEqual(subtitle.detect_language(0.8), ("en", 0.99))
+
+    def test_cached_detection_of_other_content_is_ignored(self):
+        subtitle = subtitle_with_lines(100)
+        language_cache.add(subtitle.file, language_cache.content_hash("before cleaning"), "en", 0.99, 1000)
+        detected = mock.Mock(lang="de", prob=0.95)
+        with mock.patch("libs.langdetect.detect_langs", return_value=[detected]):
+            self.assertEqual(subtitle.detect_language(0.8), ("de", 0.95))
+
+    def test_detection_is_cached(self):
+        subtitle = subtitle_with_lines(100)
+        detected = mock.Mock(lang="de", prob=0.95)
+        with mock.patch("libs.langdetect.detect_langs", return_value=[detected]) as detect_langs:
+            self.assertEqual(subtitle.detect_language(0.8), ("de", 0.95))
+            self.assertEqual(detect_langs.call_count, 1)
+        self.assertEqual(language_cache.take_new(),
+                         {str(subtitle.file.resolve()): (subtitle.content_hash, "de", 0.95, 1000)})
+
+    def test_higher_threshold_samples_past_cached_detection(self):
+        subtitle = subtitle_with_lines(1000)
+        language_cache.add(subtitle.file, subtitle.content_hash, "en", 0.85, 1000)
+        detected = mock.Mock(lang="en", prob=0.97)
+        with mock.patch("libs.langdetect.detect_langs", return_value=[detected]) as detect_langs:
+            self.assertEqual(subtitle.detect_language(0.8), ("en", 0.85))
+            self.assertEqual(detect_langs.call_count, 0)
+            self.assertEqual(subtitle.detect_language(0.9), ("en", 0.97))
+            self.assertEqual(detect_langs.call_count, 1)
+        self.assertEqual(language_cache.get(subtitle.file, subtitle.content_hash), ("en", 0.97, 4000))
+
+    def test_fully_sampled_detection_is_not_sampled_again(self):
+        subtitle = subtitle_with_lines(100)
+        language_cache.add(subtitle.file, subtitle.content_hash, "en", 0.85, 1600)
+        with mock.patch("libs.langdetect.detect_langs", side_effect=AssertionError("detector was used")):
+            self.assertEqual(subtitle.detect_language(0.9), ("en", 0.85))
+
+    def test_detection_languages_decide_shared_alphabet(self):
+        subtitle = empty_subtitle()
+        subtitle.blocks = [SubBlock.from_lines([str(i), "", "Привет, как дела? Я давно тебя не видел, где ты был?"],
+                                               [None, (i * 1000, i * 1000 + 500)], i) for i in range(20)]
+        subtitle.content_hash = language_cache.content_hash("cyrillic")
+        with mock.patch.object(config, "detection_prior_map", {"ru": 1.0, "en": 1.0}):
+            self.assertEqual(subtitle.detect_language(0.9), ("ru", 1.0))
+
+    def test_save_leaves_out_deleted_subtitles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            kept, deleted = Path(directory, "kept.srt"), Path(directory, "deleted.srt")
+            kept.touch()
+            language_cache.add(kept, "a", "en", 0.99, 1000)
+            language_cache.add(deleted, "b", "en", 0.99, 1000)
+            cache_file = Path(directory, "language_cache.json")
+            language_cache.save(cache_file)
+            language_cache.detections.clear()
+            language_cache.load(cache_file)
+        self.assertEqual(language_cache.detections, {str(kept.resolve()): ("a", "en", 0.99, 1000)})
@@ -0,0 +1,92 @@
+import random
+import re
+import unittest
+from typing import List, Tuple
+
+from libs.subcleaner.regex_lists import RegexMatcher, _required_literals
+
+FLAGS = re.IGNORECASE | re.UNICODE
+REGEX_LIST = [(key, re.compile(value, flags=FLAGS)) for key, value in [
+    ("opensubtitles", r"\bopen\s?subtitles\b"),
+    ("subsby", r"\b(sub(title)?s?|captions?|synced?|sync(hroni[sz]ed)?|corrected)\s+(and\s+\w+\s+)?(by|from)\b"),
+    ("addic7ed", r"\baddic7ed\b|\baddicted\s?\.?\s?com\b"),
+    ("become_vip", r"\bbecome\s+(a\s+)?vip\b"),
+    ("resync", r"\bre-?sync(ed)?\s+(for|by)\b"),
+    ("website", r"\b(visit|check\s+out)\s+(us\s+)?(at\s+)?\w+\.(com|org|net)\b"),
+    ("twitter", r"@\w+\s+on\s+twitter"),
+    ("istanbul", r"istanbul"),
+    ("sync", r"\bsync(ed|hronized)?\b"),
+    ("com", r"\.(com|org|net|tv)\b"),
+    ("short", r"\bby\b"),
+]]
+FRAGMENTS = ["open subtitles", "OpenSubtitles", "open  subtitles", "SUBS BY", "subtitle by", "Synced and corrected by",
+             "captions from", "addic7ed", "Addicted.com", "addicted . com", "become a VIP", "become vip", "resync for",
+             "re-synced by", "Visit us at site.com", "check out example.net", "@team on Twitter", "İSTANBUL", "Istanbul",
+             "ıstanbul", "synchronized", "sync", "by", "hello", "there", "-", ".", "\n", " "]
+
+
+# what find_matches returned before literals were used to skip regexes, kept as the reference.
+def reference_find_matches(regex_list: List[Tuple[str, re.Pattern]], clean_content: str) -> List[Tuple[str, int]]:
+    matches = []
+    for key, regex in regex_list:
+        result = regex.findall(clean_content)
+        if result and isinstance(result[0], str):
+            result = set(r.lower() for r in result)
+        else:
+            result = set(t[0].lower() for t in result)
+        if result:
+            matches.append((key, len(result)))
+    return matches
+
+
+def literals(pattern: str):
+    return _required_literals(re.compile(pattern, flags=FLAGS))
+
+
+class RequiredLiteralsTest(unittest.TestCase):
+    def test_plain_literal(self):
+        self.assertEqual(literals(r"\bpodnapisi\b"), {"podnapisi"})
+
+    def test_literals_are_casefolded(self):
+        self.assertEqual(literals(r"\bOpenSubs\b"), {"opensubs"})
+
+    def test_alternation_gives_one_literal_per_alternative(self):
+        self.assertEqual(literals(r"\byify\b|\byts\b"), {"yify", "yts"})
+
+    def test_literal_continues_into_group_alternatives(self):
+        self.assertEqual(literals(r"\bsub(s|titles)\b"), {"subs", "subtitles"})
+
+    def test_optional_group_is_not_required(self):
+        self.assertEqual(literals(r"\b(www\.)?podnapisi\b"), {"podnapisi"})
+        self.assertEqual(literals(r"\bbecome\s+(a\s+)?vip\b"), {"become"})
+
+    def test_repeated_group_is_required(self):
+        self.assertEqual(literals(r"(podnapisi)+"), {"podnapisi"})
+
+    def test_regex_with_short_or_unusable_literals_has_none(self):
+        self.assertEqual(literals(r"\bpodnapisi\b|\w+\.com"), {"podnapisi", ".com"})
+        self.assertIsNone(literals(r"\bpodnapisi\b|\w+\d"))
+        self.assertIsNone(literals(r"\bby\b"))
+        self.assertIsNone(literals(r"[a-z]+\d"))
+
+    def test_non_ascii_literal_ends_run(self):
+        self.assertEqual(literals(r"traducción"), {"traducci"})
+
+
+class RegexMatcherTest(unittest.TestCase):
+    def test_matches_plain_findall(self):
+        matcher = RegexMatcher(REGEX_LIST)
+        rng = random.Random(0)
+        for _ in range(2000):
+            content = "".join(rng.choice(FRAGMENTS) + rng.choice(["", " "]) for _ in range(rng.randint(1, 8)))
+            self.assertEqual(matcher.find_matches(content), reference_find_matches(REGEX_LIST, content), repr(content))
+
+    def test_dotted_and_dotless_i_match_case_insensitively(self):
+        matcher = RegexMatcher(REGEX_LIST)
+        for content in ["İSTANBUL", "ıstanbul", "SYNCED BY"]:
+            self.assertEqual(matcher.find_matches(content), reference_find_matches(REGEX_LIST, content), content)
+            self.assertTrue(matcher.find_matches(content))
+
+    def test_regex_without_literal_always_runs(self):
+        matcher = RegexMatcher(REGEX_LIST)
+        self.assertEqual(matcher.find_matches("made by me"), [("short", 1)])
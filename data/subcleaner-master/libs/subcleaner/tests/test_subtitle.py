@@ -0,0 +1,131 @@
+import random
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Tuple
+from unittest import mock
+
+from libs.subcleaner.cleaner import cleaner
+from libs.subcleaner.settings import args
+from libs.subcleaner.sub_block import SubBlock
+from libs.subcleaner.subtitle import Subtitle
+from libs.subcleaner.tests.test_detectors import empty_subtitle
+
+# files and what to_content() made of them once reindexed, before parsing worked on integer milliseconds, kept as the
+# reference.
+PARSED = {
+    "plain": ("1\n00:00:01,000 --> 00:00:02,500\nHello there.\n\n"
+              "2\n00:00:03,000 --> 00:00:04,000\nGeneral Kenobi!\nYou are a bold one.\n\n",
+              "1\n00:00:01,000 --> 00:00:02,500\nHello there.\n\n"
+              "2\n00:00:03,000 --> 00:00:04,000\nGeneral Kenobi!\nYou are a bold one.\n"),
+    "crlf_bom": ("﻿1\r\n00:00:01,000 --> 00:00:02,000\r\nWindows line\r\n\r\n"
+                 "2\r\n00:00:02,100 --> 00:00:03,000\r\nendings\r\n\r\n",
+                 "1\n00:00:01,000 --> 00:00:02,000\nWindows line\n\n2\n00:00:02,100 --> 00:00:03,000\nendings\n"),
+    "preamble": ("WEBVTT junk header\nsomething\n\n1\n00:00:01,000 --> 00:00:02,000\nafter preamble\n\n"
+                 "2\n00:00:05,000 --> 00:00:06,000\nsecond\n",
+                 "WEBVTT junk header\nsomething\n1\n00:00:01,000 --> 00:00:02,000\nafter preamble\n\n"
+                 "2\n00:00:05,000 --> 00:00:06,000\nsecond\n"),
+    "malformed": ("1\n00:00:01,000 --> 00:00:02,000\nno blank line after this\n"
+                  "2\n00:00:03,000 --> 00:00:04,000\nwrong order next\n\n"
+                  "5\n00:00:02,000 --> 00:00:02,800\nout of order index\n\n"
+                  "00:00:07,000 --> 00:00:08,000\nmissing index\n\n"
+                  "4\n00:00:09.000 --> 00:00:10.000\ndot separators\n\n\n\n"
+                  "6\n00:00:11,000 --> 00:00:12,000\n\n"
+                  "7\n00:00:13,000 --> 00:00:14,000\nafter empty block\n",
+                  "1\n00:00:01,000 --> 00:00:02,000\nno blank line after this\n\n"
+                  "2\n00:00:03,000 --> 00:00:04,000\nwrong order next\n\n"
+                  "3\n00:00:02,000 --> 00:00:02,800\nout of order index\n\n"
+                  "4\n00:00:07,000 --> 00:00:08,000\nmissing index\n\n"
+                  "5\n00:00:09,000 --> 00:00:10,000\ndot separators\n\n"
+                  "6\n00:00:13,000 --> 00:00:14,000\nafter empty block\n"),
+}
+# the overlapping file after unscramble and fix_overlap, before they worked on integer milliseconds.
+OVERLAPPING = ("1\n00:00:01,000 --> 00:00:03,000\nfirst line that is long\n\n"
+               "2\n00:00:02,500 --> 00:00:04,000\nsecond\n\n"
+               "3\n00:00:03,990 --> 00:00:05,333\nthird block here\n\n"
+               "4\n00:00:05,300 --> 00:00:05,400\nx\n")
+OVERLAP_FIXED = ("1\n00:00:01,000 --> 00:00:02,657\nfirst line that is long\n\n"
+                 "2\n00:00:02,757 --> 00:00:03,947\nsecond\n\n"
+                 "3\n00:00:04,047 --> 00:00:05,209\nthird block here\n\n"
+                 "4\n00:00:05,309 --> 00:00:05,400\nx\n")
+
+
+# fix_overlap as it was with timedelta arithmetic, kept as the reference.
+def reference_fix_overlap(times: List[Tuple[timedelta, timedelta]], contents: List[str]) -> None:
+    previous = 0
+    for current in range(1, len(times)):
+        (previous_start, previous_end), (start, end) = times[previous], times[current]
+        if not (previous_start < start and previous_end < end):
+            previous = current
+            continue
+
+        overlap = previous_end - start + timedelta(seconds=3 / 30)
+        if timedelta(milliseconds=3) < overlap and (len(contents[current]) + len(contents[previous])) > 0:
+            duration = (end - start).total_seconds()
+            previous_duration = (previous_end - previous_start).total_seconds()
+            content_ratio = duration / (duration + previous_duration)
+            times[current] = (start + content_ratio * overlap, end)
+            times[previous] = (previous_start, previous_end + (content_ratio - 1) * overlap)
+        previous = current
+
+
+def overlapping_subtitle(seed: int) -> Subtitle:
+    rng = random.Random(seed)
+    subtitle = empty_subtitle()
+    time = 0
+    for index in range(rng.randint(2, 80)):
+        time += rng.randint(0, 1500)
+        content = rng.choice(["", "hey", "what was that", "come here\nright now"])
+        subtitle.blocks.append(SubBlock.from_lines([str(index + 1), ""] + content.split("\n"),
+                                                   [None, (time, time + rng.randint(1, 4000))], index + 1))
+    return subtitle
+
+
+class SubtitleTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(args, "language", "en")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def parse(self, content: str, encoding: str = "UTF-8") -> Subtitle:
+        file = Path(self.directory.name, "test.srt")
+        file.write_bytes(content.encode(encoding))
+        subtitle = Subtitle(file)
+        subtitle.reindex()
+        return subtitle
+
+    def test_to_content_matches_reference(self):
+        for name, (content, expected) in PARSED.items():
+            with self.subTest(name):
+                self.assertEqual(self.parse(content).to_content(), expected)
+
+    def test_cp1252_file_is_decoded(self):
+        subtitle = self.parse("1\n00:00:01,000 --> 00:00:02,000\ncafé crème\n", "cp1252")
+        self.assertEqual(subtitle.to_content(), "1\n00:00:01,000 --> 00:00:02,000\ncafé crème\n")
+
+    def test_to_content_parses_back_unchanged(self):
+        for name, (content, _) in PARSED.items():
+            with self.subTest(name):
+                once = self.parse(content).to_content()
+                self.assertEqual(self.parse(once).to_content(), once)
+
+    def test_fix_overlap_matches_reference(self):
+        subtitle = self.parse(OVERLAPPING)
+        cleaner.unscramble(subtitle)
+        self.assertTrue(cleaner.fix_overlap(subtitle))
+        self.assertEqual(subtitle.to_content(), OVERLAP_FIXED)
+
+    def test_fix_overlap_matches_timedelta_reference(self):
+        for seed in range(200):
+            subtitle = overlapping_subtitle(seed)
+            times = [(timedelta(milliseconds=block.start_ms), timedelta(milliseconds=block.end_ms))
+                     for block in subtitle.blocks]
+            reference_fix_overlap(times, [block.content for block in subtitle.blocks])
+            cleaner.fix_overlap(subtitle)
+            expected = [(start // timedelta(milliseconds=1), end // timedelta(milliseconds=1)) for start, end in times]
+            self.assertEqual([(block.start_ms, block.end_ms) for block in subtitle.blocks], expected, f"seed {seed}")
@@ -0,0 +1,81 @@
+import os
+import sys
+import json
+import sqlite3
+import datetime
+from pathlib import Path
+from utils import get_config, get_subservient_folder
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+CONFIG_PATH = SCRIPT_DIR / '.config'
+ENV_VAR = 'SUBSERVIENT_HEADLESS'
+
+_queue = None
+
+def headless():
+    """Return True when questions are deferred instead of asked, from --headless, the environment or the headless config key."""
+    if '--headless' in sys.argv:
+        os.environ[ENV_VAR] = 'true'
+    mode = os.environ.get(ENV_VAR)
+    if mode is None:
+        return get_config(CONFIG_PATH).get_bool('headless')
+    return mode.strip().lower() in ('true', '1', 'yes', 'on')
+
+def get_queue():
+    """Open the decision queue once per session; it keeps every question a headless run deferred and the answer it got in review."""
+    global _queue
+    if _queue is None:
+        data_dir = get_subservient_folder() / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        queue = sqlite3.connect(str(data_dir / "decisions.db"))
+        queue.execute("CREATE TABLE IF NOT EXISTS decisions (id INTEGER PRIMARY KEY, created TEXT, phase TEXT, kind TEXT, video TEXT, "
+                      "language TEXT, question TEXT, choices TEXT, default_choice TEXT, answer TEXT, status TEXT, "
+                      "UNIQUE (kind, video, language))")
+        queue.commit()
+        _queue = queue
+    return _queue
+
+def take_answer(kind, video, language=''):
+    """Return the answer given in review to a deferred question and mark it applied, or None when there is none."""
+    queue = get_queue()
+    row = queue.execute("SELECT id, answer FROM decisions WHERE kind = ? AND video = ? AND language = ? AND status = 'answered'",
+                        (kind, str(video), language or '')).fetchone()
+    if row is None:
+        return None
+    queue.execute("UPDATE decisions SET status = 'applied' WHERE id = ?", (row[0],))
+    queue.commit()
+    return row[1]
+
+def defer(phase, kind, video, question, choices, default, language=''):
+    """Put a question in the queue for review, replacing an earlier one about the same video, and return its default.
+
+    choices maps every answer that can be given in review to its description; default must be one of them
+    and should be the answer that changes nothing that cannot be undone.
+    """
+    queue = get_queue()
+    queue.execute("INSERT OR REPLACE INTO decisions (created, phase, kind, video, language, question, choices, default_choice, status) "
+                  "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending')",
+                  (datetime.datetime.now().isoformat(timespec='seconds'), phase, kind, str(video), language or '',
+                   question, json.dumps(choices, ensure_ascii=False), default))
+    queue.commit()
+    return default
+
+def pending():
+    """Return the questions waiting for review, oldest first."""
+    rows = get_queue().execute("SELECT id, created, phase, kind, video, language, question, choices, default_choice FROM decisions "
+                               "WHERE status = 'pending' ORDER BY id").fetchall()
+    return [{'id': row[0], 'created': row[1], 'phase': row[2], 'kind': row[3], 'video': row[4], 'language': row[5],
+             'question': row[6], 'choices': json.loads(row[7]), 'default': row[8]} for row in rows]
+
+def answer(decision_id, choice):
+    """Record the answer to a deferred question; it is applied the next time a run reaches the question.
+
+    A question with a single choice only asks to acknowledge something, so its answer needs no run to apply it.
+    """
+    queue = get_queue()
+    row = queue.execute("SELECT choices FROM decisions WHERE id = ?", (decision_id,)).fetchone()
+    if row is None:
+        return
+    status = 'applied' if len(json.loads(row[0])) == 1 else 'answered'
+    queue.execute("UPDATE decisions SET answer = ?, status = ? WHERE id = ?", (choice, status, decision_id))
+    queue.commit()
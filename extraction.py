@@ -34,7 +34,7 @@ def check_required_packages():
 check_required_packages()
 
 from pathlib import Path
-from langdetect import detect
+from langdetect import detect_langs, LangDetectException
 import datetime
 from colorama import init, Fore, Style
 import re
@@ -43,7 +43,12 @@ import json
 import pycountry
 import threading
 import time
-from utils import ASCII_ART, clear_and_print_ascii, map_lang_3to2, get_skip_dirs_from_config, LANG_2TO3_PREFERRED, lang_in_list, fix_permissions_proactively, ensure_file_writable, ensure_directory_writable
+from utils import ASCII_ART, clear_and_print_ascii, map_lang_3to2, get_skip_dirs_from_config, LANG_2TO3_PREFERRED, lang_in_list, fix_permissions_proactively, ensure_file_writable, ensure_directory_writable, write_config_text, walk_library, list_library_folder
+import pipeline
+import runlog
+import metrics
+import profiling
+import decisions
 
 SNAPSHOT_DIR = Path(__file__).parent.resolve()
 BANNER_LINE = f"                   {Style.BRIGHT}{Fore.RED}[Phase 2/4]{Style.RESET_ALL} Subtitle Extraction"
@@ -57,115 +62,141 @@ PRESERVE_FORCED_SUBTITLES = None
 PRESERVE_UNWANTED_SUBTITLES = None
 PAUSE_SECONDS = None
 RUN_COUNTER = None
-if CONFIG_PATH.exists():
-    lines = CONFIG_PATH.read_text(encoding='utf-8').splitlines()
-    in_setup = False
-    run_counter_line_idx = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == '[setup]':
-            in_setup = True
-            continue
-        if in_setup:
-            if line.strip().startswith('[') and line.strip().lower() != '[setup]':
-                break
-            if line.strip() and not line.strip().startswith('#'):
-                l = line.lower()
-                if l.startswith('run_counter') and '=' in line:
-                    run_counter_line_idx = idx
-                    _, value = line.split('=', 1)
-                    try:
-                        RUN_COUNTER = int(value.strip())
-                    except Exception:
-                        RUN_COUNTER = 0
-                elif l.startswith('languages') and '=' in line:
-                    _, value = line.split('=', 1)
-                    langs = [lang.strip().lower() for lang in value.strip().strip('"').split(',') if lang.strip()]
-                    if langs:
-                        WANTED_LANGUAGES = langs
-                elif l.startswith('series_mode') and '=' in line:
-                    _, value = line.split('=', 1)
-                    SERIES_MODE = value.strip().lower() in ('true', '1', 'yes', 'on')
-                elif l.startswith('delete_extra_videos') and '=' in line:
-                    _, value = line.split('=', 1)
-                    DELETE_EXTRA_VIDEOS = value.strip().lower() in ('true', '1', 'yes', 'on')
-                elif l.startswith('extras_folder_name') and '=' in line:
-                    _, value = line.split('=', 1)
-                    if value.strip():
-                        EXTRAS_FOLDER_NAME = value.strip()
-                elif l.startswith('audio_track_languages') and '=' in line:
-                    _, value = line.split('=', 1)
-                    value_clean = value.strip().strip('"').lower()
-                    if value_clean == 'all':
-                        AUDIO_TRACK_LANGUAGES = 'ALL'
-                    else:
-                        langs = [lang.strip().lower() for lang in value_clean.split(',') if lang.strip()]
+LANGUAGE_DETECTION_CONFIDENCE = 0.9
+JSON_LOG = False
+PROMETHEUS_TEXTFILE_DIR = ''
+LOGS_DIR = None
+RUN_LOG = None
+
+def read_config():
+    """Read the [SETUP] settings of .config and count this run."""
+    global AUDIO_TRACK_LANGUAGES, DELETE_EXTRA_VIDEOS, EXTRAS_FOLDER_NAME, JSON_LOG
+    global LANGUAGE_DETECTION_CONFIDENCE, PAUSE_SECONDS, PRESERVE_FORCED_SUBTITLES
+    global PRESERVE_UNWANTED_SUBTITLES, PROMETHEUS_TEXTFILE_DIR, RUN_COUNTER, SERIES_MODE
+    global WANTED_LANGUAGES
+    if CONFIG_PATH.exists():
+        lines = CONFIG_PATH.read_text(encoding='utf-8').splitlines()
+        in_setup = False
+        run_counter_line_idx = None
+        for idx, line in enumerate(lines):
+            if line.strip().lower() == '[setup]':
+                in_setup = True
+                continue
+            if in_setup:
+                if line.strip().startswith('[') and line.strip().lower() != '[setup]':
+                    break
+                if line.strip() and not line.strip().startswith('#'):
+                    l = line.lower()
+                    if l.startswith('run_counter') and '=' in line:
+                        run_counter_line_idx = idx
+                        _, value = line.split('=', 1)
+                        try:
+                            RUN_COUNTER = int(value.strip())
+                        except Exception:
+                            RUN_COUNTER = 0
+                    elif l.startswith('languages') and '=' in line:
+                        _, value = line.split('=', 1)
+                        langs = [lang.strip().lower() for lang in value.strip().strip('"').split(',') if lang.strip()]
                         if langs:
-                            AUDIO_TRACK_LANGUAGES = langs
-                elif l.startswith('preserve_forced_subtitles') and '=' in line:
-                    _, value = line.split('=', 1)
-                    PRESERVE_FORCED_SUBTITLES = value.strip().lower() in ('true', '1', 'yes', 'on')
-                elif l.startswith('preserve_unwanted_subtitles') and '=' in line:
-                    _, value = line.split('=', 1)
-                    PRESERVE_UNWANTED_SUBTITLES = value.strip().lower() in ('true', '1', 'yes', 'on')
-                elif l.startswith('pause_seconds') and '=' in line:
-                    _, value = line.split('=', 1)
+                            WANTED_LANGUAGES = langs
+                    elif l.startswith('series_mode') and '=' in line:
+                        _, value = line.split('=', 1)
+                        SERIES_MODE = value.strip().lower() in ('true', '1', 'yes', 'on')
+                    elif l.startswith('delete_extra_videos') and '=' in line:
+                        _, value = line.split('=', 1)
+                        DELETE_EXTRA_VIDEOS = value.strip().lower() in ('true', '1', 'yes', 'on')
+                    elif l.startswith('extras_folder_name') and '=' in line:
+                        _, value = line.split('=', 1)
+                        if value.strip():
+                            EXTRAS_FOLDER_NAME = value.strip()
+                    elif l.startswith('audio_track_languages') and '=' in line:
+                        _, value = line.split('=', 1)
+                        value_clean = value.strip().strip('"').lower()
+                        if value_clean == 'all':
+                            AUDIO_TRACK_LANGUAGES = 'ALL'
+                        else:
+                            langs = [lang.strip().lower() for lang in value_clean.split(',') if lang.strip()]
+                            if langs:
+                                AUDIO_TRACK_LANGUAGES = langs
+                    elif l.startswith('preserve_forced_subtitles') and '=' in line:
+                        _, value = line.split('=', 1)
+                        PRESERVE_FORCED_SUBTITLES = value.strip().lower() in ('true', '1', 'yes', 'on')
+                    elif l.startswith('preserve_unwanted_subtitles') and '=' in line:
+                        _, value = line.split('=', 1)
+                        PRESERVE_UNWANTED_SUBTITLES = value.strip().lower() in ('true', '1', 'yes', 'on')
+                    elif l.startswith('pause_seconds') and '=' in line:
+                        _, value = line.split('=', 1)
+                        try:
+                            PAUSE_SECONDS = float(value.strip())
+                        except Exception:
+                            pass
+                    elif l.startswith('language_detection_confidence') and '=' in line:
+                        _, value = line.split('=', 1)
+                        try:
+                            LANGUAGE_DETECTION_CONFIDENCE = min(max(float(value.strip()), 0.0), 1.0)
+                        except Exception:
+                            pass
+                    elif l.startswith('json_log') and '=' in line:
+                        _, value = line.split('=', 1)
+                        JSON_LOG = value.strip().lower() in ('true', '1', 'yes', 'on')
+                    elif l.startswith('prometheus_textfile_dir') and '=' in line:
+                        _, value = line.split('=', 1)
+                        PROMETHEUS_TEXTFILE_DIR = value.strip()
+        if run_counter_line_idx is not None and RUN_COUNTER is not None:
+            RUN_COUNTER += 1
+            lines[run_counter_line_idx] = f"run_counter= {RUN_COUNTER}"
+            try:
+                write_config_text(CONFIG_PATH, '\n'.join(lines) + '\n')
+            except PermissionError:
+                fixed_items = fix_permissions_proactively(CONFIG_PATH)
+                if fixed_items:
                     try:
-                        PAUSE_SECONDS = float(value.strip())
+                        write_config_text(CONFIG_PATH, '\n'.join(lines) + '\n')
+                        print(f"Info: Fixed permissions and updated run counter in config file")
                     except Exception:
-                        pass
-    if run_counter_line_idx is not None and RUN_COUNTER is not None:
-        RUN_COUNTER += 1
-        lines[run_counter_line_idx] = f"run_counter= {RUN_COUNTER}"
-        try:
-            CONFIG_PATH.write_text('\n'.join(lines) + '\n', encoding='utf-8')
-        except PermissionError:
-            fixed_items = fix_permissions_proactively(CONFIG_PATH)
-            if fixed_items:
-                try:
-                    CONFIG_PATH.write_text('\n'.join(lines) + '\n', encoding='utf-8')
-                    print(f"Info: Fixed permissions and updated run counter in config file")
-                except Exception:
+                        print(f"Warning: Could not update run counter in config file (permission denied)")
+                else:
                     print(f"Warning: Could not update run counter in config file (permission denied)")
-            else:
-                print(f"Warning: Could not update run counter in config file (permission denied)")
-        except Exception as e:
-            print(f"Warning: Could not update run counter in config file: {str(e)}")
-LOGS_DIR = SNAPSHOT_DIR / 'logs' / f'Subservient-run-{RUN_COUNTER}'
-try:
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
-except PermissionError:
-    fixed_items = fix_permissions_proactively(SNAPSHOT_DIR / 'logs')
-    if fixed_items:
-        try:
-            LOGS_DIR.mkdir(parents=True, exist_ok=True)
-            print(f"Info: Fixed permissions and created logs directory")
-        except Exception:
-            print(f"Warning: Could not create logs directory (permission denied). Continuing without logging.")
-            LOGS_DIR = None
-    else:
-        print(f"Warning: Could not create logs directory (permission denied). Continuing without logging.")
-        LOGS_DIR = None
-except Exception as e:
-    print(f"Warning: Could not create logs directory: {str(e)}. Continuing without logging.")
-    LOGS_DIR = None
-
-log_time = datetime.datetime.now().strftime('%d-%m-%Y_%H.%M.%S')
-LOG_FILE = LOGS_DIR / f"extraction_log_{log_time}.txt" if LOGS_DIR else None
+            except Exception as e:
+                print(f"Warning: Could not update run counter in config file: {str(e)}")
 
-init(autoreset=True)
-if LOG_FILE:
+def open_run_log():
+    """Create this run's logs folder and open the extraction log in it."""
+    global LOGS_DIR, RUN_LOG
+    LOGS_DIR = SNAPSHOT_DIR / 'logs' / f'Subservient-run-{RUN_COUNTER}'
     try:
-        with LOG_FILE.open('w', encoding='utf-8') as f:
-            f.write(ASCII_ART + '\n')
-            f.write(BANNER_LINE + '\n\n')
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
     except PermissionError:
-        print(f"Warning: Could not create log file (permission denied). Continuing without logging.")
-        LOG_FILE = None
+        fixed_items = fix_permissions_proactively(SNAPSHOT_DIR / 'logs')
+        if fixed_items:
+            try:
+                LOGS_DIR.mkdir(parents=True, exist_ok=True)
+                print(f"Info: Fixed permissions and created logs directory")
+            except Exception:
+                print(f"Warning: Could not create logs directory (permission denied). Continuing without logging.")
+                LOGS_DIR = None
+        else:
+            print(f"Warning: Could not create logs directory (permission denied). Continuing without logging.")
+            LOGS_DIR = None
     except Exception as e:
-        print(f"Warning: Could not create log file: {str(e)}. Continuing without logging.")
-        LOG_FILE = None
+        print(f"Warning: Could not create logs directory: {str(e)}. Continuing without logging.")
+        LOGS_DIR = None
 
-clear_and_print_ascii(BANNER_LINE)
+    log_time = datetime.datetime.now().strftime('%d-%m-%Y_%H.%M.%S')
+    LOG_FILE = LOGS_DIR / f"extraction_log_{log_time}.txt" if LOGS_DIR else None
+
+    if LOG_FILE:
+        try:
+            RUN_LOG = runlog.open_log(LOG_FILE, "extraction", structured=JSON_LOG, truncate=True)
+            RUN_LOG.write(ASCII_ART + '\n')
+            RUN_LOG.write(BANNER_LINE + '\n\n')
+            metrics.configure(LOGS_DIR, PROMETHEUS_TEXTFILE_DIR)
+        except PermissionError:
+            print(f"Warning: Could not create log file (permission denied). Continuing without logging.")
+            LOG_FILE = None
+        except Exception as e:
+            print(f"Warning: Could not create log file: {str(e)}. Continuing without logging.")
+            LOG_FILE = None
 
 def ensure_initial_setup():
     """Check if Subservient initial setup is complete."""
@@ -186,8 +217,7 @@ def ensure_initial_setup():
               f"{Fore.CYAN}2.{Style.RESET_ALL} Run subordinate.py. This will perform the internal setup and register all necessary script paths.\n"
               f"{Fore.CYAN}3.{Style.RESET_ALL} After setup, you can move subordinate.py to the movie(s) you want to process and run it again.\n\n"
               f"{Fore.YELLOW}If you need help, see the README file for more details.{Style.RESET_ALL}\n")
-        input("Press Enter to exit...")
-        sys.exit(1)
+        exit_with_prompt()
     lines = pathfile.read_text(encoding="utf-8").splitlines()
     keys = {l.split('=')[0] for l in lines if '=' in l}
     if not all(k in keys for k in required_keys):
@@ -197,11 +227,7 @@ def ensure_initial_setup():
               f"{Fore.CYAN}2.{Style.RESET_ALL} Run subordinate.py. This will perform the internal setup and register all necessary script paths.\n"
               f"{Fore.CYAN}3.{Style.RESET_ALL} After setup, you can move subordinate.py to the movie(s) you want to process and run it again.\n\n"
               f"{Fore.YELLOW}If you need help, see the README file for more details.{Style.RESET_ALL}\n")
-        input("Press Enter to exit...")
-        sys.exit(1)
-
-ensure_initial_setup()
-
+        exit_with_prompt()
 
 progress_last = False
 
@@ -209,11 +235,9 @@ def log(msg, end='\n'):
     """Write message to log file only."""
     if isinstance(msg, str) and msg.strip().startswith('Progress:'):
         return
-    if LOG_FILE:
+    if RUN_LOG:
         try:
-            with LOG_FILE.open('a', encoding='utf-8') as f:
-                ansi_escape = re.compile(r'\x1b\[[0-9;]*m|\033\[[0-9;]*m')
-                f.write(ansi_escape.sub('', str(msg)) + ('' if end == '' else end))
+            RUN_LOG.event(msg, end=end)
         except (PermissionError, OSError):
             pass  # Continue silently if logging fails
 def print_and_log(msg, end='\n'):
@@ -235,17 +259,103 @@ def print_and_log(msg, end='\n'):
 def ext_tag():
     """Return formatted extraction tag for console output."""
     return f"{Style.BRIGHT}{Fore.BLUE}[Extraction]{Style.RESET_ALL}"
+
+def exit_with_prompt(message="Press Enter to exit..."):
+    """Wait for the user before exiting after an error; a headless run exits straight away, as nobody is there to answer."""
+    if decisions.headless():
+        print_and_log(f"{ext_tag()} {Fore.RED}Headless run stopped because of the error above.{Style.RESET_ALL}")
+        sys.exit(1)
+    try:
+        input(f"\n{Fore.RED}{message}{Style.RESET_ALL}")
+    except EOFError:
+        os.system("pause")
+    sys.exit(1)
 UNWANTED_EXTENSIONS = [".sub", ".idx", ".sup", ".vob"]
 ALLOWED_CODECS = ["SubRip/SRT", "S_TEXT/UTF8", "SubStationAlpha", "S_TEXT/ASS", "SSA", "ASS"]
-def detect_language(sub_path):
-    """Detect language of subtitle file using langdetect library."""
+LANGUAGE_SAMPLE_CUES = 60
+LANGUAGE_SAMPLE_ROUNDS = 3
+CONTAINER_TAG_CHECK_CUES = 8
+UNRELIABLE_LANGUAGE_TAGS = {'und', 'mul', 'mis', 'zxx', 'qaa'}
+ASS_OVERRIDE_TAGS = re.compile(r'\{[^}]*\}')
+def read_subtitle_cues(sub_path):
+    """Read the text of every cue in a subtitle file, skipping indexes and timestamps."""
+    with open(sub_path, "r", encoding="utf-8", errors="ignore") as f:
+        content = f.read()
+    if '[Events]' in content:
+        dialogue = (ASS_OVERRIDE_TAGS.sub('', line.split(',', 9)[-1]).replace('\\N', ' ').strip()
+                    for line in content.splitlines() if line.startswith('Dialogue:'))
+        return [text for text in dialogue if text]
+    cues = []
+    for block in re.split(r'\n\s*\n', content):
+        text = " ".join(line.strip() for line in block.splitlines()
+                        if line.strip() and not line.strip().isdigit() and '-->' not in line)
+        if text:
+            cues.append(text)
+    return cues
+def sample_cues(cues, count):
+    """Pick up to count cues spread evenly over the whole subtitle."""
+    if len(cues) <= count:
+        return list(cues)
+    step = len(cues) / count
+    return [cues[int(i * step)] for i in range(count)]
+def classify_language(text, candidates):
+    """Classify text among the candidate languages, folding every other language into one bucket.
+
+    Returns (language, confidence). When the 'other' bucket wins, the most probable
+    language inside that bucket is returned so it can still be reported and removed.
+    """
+    buckets = {}
+    other_lang, other_prob = 'other', 0.0
+    for result in detect_langs(text):
+        lang = result.lang.split('-')[0].lower()
+        if lang in candidates:
+            buckets[lang] = buckets.get(lang, 0.0) + result.prob
+        else:
+            buckets['other'] = buckets.get('other', 0.0) + result.prob
+            if result.prob > other_prob:
+                other_lang, other_prob = lang, result.prob
+    if not buckets:
+        return 'unknown', 0.0
+    best = max(buckets, key=buckets.get)
+    return (other_lang if best == 'other' else best), buckets[best]
+def container_tag_is_reliable(lang_tag, cues, candidates):
+    """Quick check whether a container language tag can be trusted instead of full detection."""
+    if not lang_tag or lang_tag.lower() in UNRELIABLE_LANGUAGE_TAGS:
+        return False
+    lang = map_lang_3to2(lang_tag.lower())
+    if len(lang) != 2:
+        return False
+    try:
+        verdict, _ = classify_language(" ".join(sample_cues(cues, CONTAINER_TAG_CHECK_CUES)), candidates | {lang})
+    except LangDetectException:
+        return False
+    return verdict == lang
+def detect_language(sub_path, container_lang=None):
+    """Detect subtitle language from evenly spaced cue samples, stopping once confident.
+
+    Candidates are the wanted languages plus an 'other' bucket. A track whose container
+    language tag passes a quick check skips the sampled detection entirely.
+    """
     try:
-        with open(sub_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = [line.strip() for line in f if line.strip() and not line.strip().isdigit()]
-            text_sample = " ".join(lines[:200])
-            if not text_sample.strip():
-                raise ValueError("No usable text for detection.")
-            return detect(text_sample)
+        cues = read_subtitle_cues(sub_path)
+        if not cues:
+            raise ValueError("No usable text for detection.")
+        candidates = {map_lang_3to2(lang) for lang in WANTED_LANGUAGES}
+        if container_tag_is_reliable(container_lang, cues, candidates):
+            log(f"[DEBUG] Container language tag '{container_lang}' trusted for {sub_path.name}, detection skipped")
+            return map_lang_3to2(container_lang.lower())
+        sample = sample_cues(cues, LANGUAGE_SAMPLE_CUES)
+        detected = 'unknown'
+        for round_idx in range(1, LANGUAGE_SAMPLE_ROUNDS + 1):
+            text_sample = " ".join(cue for i, cue in enumerate(sample) if i % LANGUAGE_SAMPLE_ROUNDS < round_idx)
+            try:
+                detected, confidence = classify_language(text_sample, candidates)
+            except LangDetectException:
+                continue
+            if confidence >= LANGUAGE_DETECTION_CONFIDENCE:
+                log(f"[DEBUG] Language {detected} detected with confidence {confidence:.2f} after sampling round {round_idx}")
+                break
+        return detected
     except Exception as e:
         print_and_log(f"{ext_tag()} {Fore.RED}Error detecting language in {sub_path.name}: {str(e)}{Style.RESET_ALL}")
         return "unknown"
@@ -280,7 +390,7 @@ def print_movie_header(movie_name, idx, total):
     print(bar.ljust(79), end='\n')
 def run_extraction_with_progress(cmd, output_path, total_subtitles, current_sub):
     """Run subtitle extraction command with progress display."""
-    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    process = metrics.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     start_time = time.time()
     
     def update_progress():
@@ -307,7 +417,7 @@ def run_extraction_with_progress(cmd, output_path, total_subtitles, current_sub)
 
 def run_remux_with_progress(cmd, temp_path, orig_size):
     """Run video remux command with file size-based progress bar."""
-    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    process = metrics.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     percent = [0]
     stop_flag = [False]
     def progress_thread():
@@ -333,6 +443,9 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
     """Extract internal subtitles from video file and clean up temporary files."""
     extracted_files = []
     deleted_files = []
+    if RUN_LOG:
+        RUN_LOG.set_context(video=file_path.name)
+    metrics.set_context(video=file_path.name)
     if file_path.stat().st_size < 50 * 1024 * 1024:
         print_and_log(f"{ext_tag()} {Fore.YELLOW}Skipped (file too small < 50MB): {shortname(file_path)}{Style.RESET_ALL}")
         return
@@ -347,10 +460,11 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
     base_path = parent_dir / base_name
     has_lang = {lang: (parent_dir / f"{base_name}.{lang}.srt").exists() for lang in WANTED_LANGUAGES}
     sxxexx_code = extract_sxxexx_code(file_path.name) if SERIES_MODE else None
+    track_language_tags = {}
 
     try:
         info_cmd_json = ['mkvmerge', '-J', str(file_path)]
-        result_json = subprocess.run(info_cmd_json, capture_output=True, text=True)
+        result_json = metrics.run(info_cmd_json, capture_output=True, text=True)
         if result_json.returncode != 0:
             print_and_log(f"{ext_tag()} {Fore.RED}Error reading file (JSON).{Style.RESET_ALL}")
             return
@@ -397,6 +511,7 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
                                             print_and_log(f"{ext_tag()} {Fore.YELLOW}Please check folder permissions and try again.{Style.RESET_ALL}")
                     print_and_log(f"{ext_tag()} {Fore.CYAN}External subtitle found: {shortname(sub)}{Style.RESET_ALL}")
             subtitle_tracks = [t for t in mkv_info.get('tracks', []) if t.get('type') == 'subtitles']
+            track_language_tags = {str(t.get('id')): t.get('properties', {}).get('language', 'und') for t in subtitle_tracks}
             vobsub_per_lang = {lang: [] for lang in WANTED_LANGUAGES}
             vobsub_forced_per_lang = {lang: [] for lang in WANTED_LANGUAGES}
             srt_found_per_lang = {lang: (parent_dir / f"{base_name}.{lang}.srt").exists() or 
@@ -505,7 +620,7 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
             print_and_log(f"{ext_tag()} {Fore.RED}Failed to parse mkvmerge JSON output: {e}{Style.RESET_ALL}")
     except Exception as e:
         print_and_log(f"{ext_tag()} {Fore.RED}Error with {shortname(file_path)}: {str(e)}{Style.RESET_ALL}")
-    lines = subprocess.run(['mkvmerge', '-i', str(file_path)], capture_output=True, text=True).stdout.splitlines()
+    lines = metrics.run(['mkvmerge', '-i', str(file_path)], capture_output=True, text=True).stdout.splitlines()
     subtitle_lines = [line for line in lines if 'subtitles' in line.lower()]
     
     total_subtitles_to_extract = 0
@@ -540,7 +655,7 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
             stdout, stderr = run_extraction_with_progress(extract_cmd, out_path, total_subtitles_to_extract, current_subtitle)
             print_and_log(f"{ext_tag()} {Fore.GREEN}Extracted: {shortname(out_path)}{Style.RESET_ALL}")
             extracted_files.append(str(out_path))
-        detected = detect_language(out_path)
+        detected = detect_language(out_path, track_language_tags.get(track_id, lang_code))
         if detected != 'unknown':
             print_and_log(f"{ext_tag()} {Fore.GREEN}Detected and recognized language: {detected.upper()}{Style.RESET_ALL}")
         if detected in WANTED_LANGUAGES and not has_lang[detected]:
@@ -573,9 +688,7 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
                 print_and_log(f"{ext_tag()} {Fore.YELLOW}This usually happens when Subservient was interrupted previously and left incomplete files.{Style.RESET_ALL}")
                 print_and_log(f"{ext_tag()} {Fore.CYAN}SOLUTION: Please remove all .srt files that are not fully synchronized/complete and try again.{Style.RESET_ALL}")
                 print_and_log(f"{ext_tag()} {Fore.CYAN}Look for files like: *.und0.srt, *.temp.srt, or duplicate .forced.srt files{Style.RESET_ALL}")
-                print(f"\n{Fore.RED}Press Enter to exit...{Style.RESET_ALL}")
-                input()
-                sys.exit(1)
+                exit_with_prompt()
             except PermissionError as e:
                 print_and_log(f"{ext_tag()} {Fore.YELLOW}Permission error for subtitle renaming - attempting automatic fix...{Style.RESET_ALL}")
                 fixed_items = fix_permissions_proactively(out_path)
@@ -594,9 +707,7 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
                         print_and_log(f"{ext_tag()} {Fore.CYAN}2. Move the entire Subservient folder to a different location (Desktop, Documents, etc.){Style.RESET_ALL}")
                         print_and_log(f"{ext_tag()} {Fore.CYAN}3. Make sure no other application is accessing the subtitle files{Style.RESET_ALL}")
                         print_and_log(f"{ext_tag()} {Fore.CYAN}4. Try running Subservient as Administrator{Style.RESET_ALL}")
-                        print(f"\n{Fore.RED}Press Enter to exit...{Style.RESET_ALL}")
-                        input()
-                        sys.exit(1)
+                        exit_with_prompt()
                 else:
                     print_and_log(f"{ext_tag()} {Fore.RED}PERMISSION ERROR: Cannot rename subtitle file!{Style.RESET_ALL}")
                     print_and_log(f"{ext_tag()} {Fore.RED}Source: {out_path.name}{Style.RESET_ALL}")
@@ -607,9 +718,7 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
                     print_and_log(f"{ext_tag()} {Fore.CYAN}2. Move the entire Subservient folder to a different location (Desktop, Documents, etc.){Style.RESET_ALL}")
                     print_and_log(f"{ext_tag()} {Fore.CYAN}3. Make sure no other application is accessing the subtitle files{Style.RESET_ALL}")
                     print_and_log(f"{ext_tag()} {Fore.CYAN}4. Try running Subservient as Administrator{Style.RESET_ALL}")
-                    print(f"\n{Fore.RED}Press Enter to exit...{Style.RESET_ALL}")
-                    input()
-                    sys.exit(1)
+                    exit_with_prompt()
             if is_forced_extracted:
                 if PRESERVE_FORCED_SUBTITLES:
                     print_and_log(f"{ext_tag()} {Fore.MAGENTA}Recognized as FORCED language: {detected.upper()} - preserved with .forced. naming{Style.RESET_ALL}")
@@ -648,7 +757,7 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
                 print_and_log(f"{ext_tag()} {Fore.YELLOW}Warning: Could not remove unwanted extracted subtitle {out_path.name}: {str(e)}{Style.RESET_ALL}")
         und_index += 1
     info_cmd_json = ['mkvmerge', '-J', str(file_path)]
-    result_json = subprocess.run(info_cmd_json, capture_output=True, text=True)
+    result_json = metrics.run(info_cmd_json, capture_output=True, text=True)
     audio_tracks = []
     unwanted_audio_tracks = []
     subtitle_tracks = []
@@ -918,9 +1027,7 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
                         print_and_log(f"{ext_tag()} {Fore.CYAN}5. Try restarting your computer and running Subservient again{Style.RESET_ALL}")
                         print_and_log(f"\n{ext_tag()} {Fore.YELLOW}The temp file '{temp_path.name}' contains your processed video.{Style.RESET_ALL}")
                         print_and_log(f"{ext_tag()} {Fore.YELLOW}You can manually rename it to replace the original if needed.{Style.RESET_ALL}")
-                        print(f"\n{Fore.RED}Press Enter to exit...{Style.RESET_ALL}")
-                        input()
-                        sys.exit(1)
+                        exit_with_prompt()
                 else:
                     print_and_log(f"{ext_tag()} {Fore.RED}PERMISSION ERROR: Cannot complete remux operation!{Style.RESET_ALL}")
                     print_and_log(f"{ext_tag()} {Fore.RED}Error details: {str(e)}{Style.RESET_ALL}")
@@ -932,15 +1039,11 @@ def extract_subtitles(file_path, movie_idx=1, total_movies=1):
                     print_and_log(f"{ext_tag()} {Fore.CYAN}5. Try restarting your computer and running Subservient again{Style.RESET_ALL}")
                     print_and_log(f"\n{ext_tag()} {Fore.YELLOW}The temp file '{temp_path.name}' contains your processed video.{Style.RESET_ALL}")
                     print_and_log(f"{ext_tag()} {Fore.YELLOW}You can manually rename it to replace the original if needed.{Style.RESET_ALL}")
-                    print(f"\n{Fore.RED}Press Enter to exit...{Style.RESET_ALL}")
-                    input()
-                    sys.exit(1)
+                    exit_with_prompt()
             except Exception as e:
                 print_and_log(f"{ext_tag()} {Fore.RED}Unexpected error during remux: {str(e)}{Style.RESET_ALL}")
                 print_and_log(f"{ext_tag()} {Fore.YELLOW}The temp file '{temp_path.name}' contains your processed video.{Style.RESET_ALL}")
-                print(f"\n{Fore.RED}Press Enter to exit...{Style.RESET_ALL}")
-                input()
-                sys.exit(1)
+                exit_with_prompt()
         else:
             print_and_log(f"{ext_tag()} {Fore.RED}Remux failed, temp.mkv not found.{Style.RESET_ALL}")
     else:
@@ -1073,9 +1176,16 @@ def to_iso639_2(code):
     except (KeyError, AttributeError):
         pass
     return code
-def get_video_files_for_folder(folder: Path) -> list:
-    """Get all video files in folder while respecting skip_dirs configuration."""
-    video_files = [f for f in folder.iterdir() if f.is_file() and f.suffix.lower() in ['.mkv', '.mp4']]
+def get_video_files_for_folder(folder: Path, filenames=None) -> list:
+    """Get all video files in folder while respecting skip_dirs configuration.
+    
+    The file names come from the library index (or the walk that already listed the folder), so only the videos
+    themselves are touched on disk: stat'ed to pick the largest, and moved or deleted when they are extras.
+    """
+    if filenames is None:
+        listing = list_library_folder(str(folder))
+        filenames = listing[1] if listing else []
+    video_files = [folder / name for name in filenames if name.lower().endswith(('.mkv', '.mp4'))]
     if SERIES_MODE:
         return sorted(video_files)
     if not video_files:
@@ -1111,49 +1221,49 @@ def get_subservient_anchor():
     pathfile = config_dir / "Subservient_pathfiles"
     if not pathfile.exists():
         print_and_log(f"\033[1;31m[ERROR]\033[0m Subservient_pathfiles not found in your user config directory. Please run subordinate.py first.")
-        try:
-            input("\nPress any key to exit...")
-        except EOFError:
-            os.system("pause")
-        sys.exit(1)
+        exit_with_prompt("Press any key to exit...")
     with open(pathfile, "r", encoding="utf-8") as f:
         for line in f:
             if line.startswith("subservient_anchor="):
                 return Path(line.split("=", 1)[1].strip())
     print_and_log(f"\033[1;31m[ERROR]\033[0m subservient_anchor not found in Subservient_pathfiles. Please run subordinate.py again.")
-    try:
-        input("\nPress any key to exit...")
-    except EOFError:
-        os.system("pause")
-    sys.exit(1)
-anchor_dir = get_subservient_anchor()
-os.chdir(anchor_dir)
-__file__ = str((anchor_dir / Path(__file__).name).resolve())
+    exit_with_prompt("Press any key to exit...")
+
+def flag_for_acquisition(video_file):
+    """Flag a video for acquisition when one of the wanted subtitles is still missing."""
+    if not all(video_file.with_name(f"{video_file.stem}.{lang}.srt").exists() for lang in WANTED_LANGUAGES):
+        pipeline.queue("acquisition", video_file)
 
 def process_directory(root_path):
     """Process all video files in directory and extract their internal subtitles."""
     anchor_videos = get_video_files_for_folder(root_path)
     if anchor_videos:
+        pipeline.set_videos(anchor_videos)
         total_movies = len(anchor_videos)
         idx = 1
         for video_file in anchor_videos:
             extract_subtitles(video_file, idx, total_movies)
+            flag_for_acquisition(video_file)
             idx += 1
     else:
         all_folders = []
         skip_dirs = get_skip_dirs_from_config()
         
-        for dirpath, dirnames, filenames in os.walk(root_path):
+        for dirpath, dirnames, filenames in walk_library(root_path):
             dirnames[:] = [d for d in dirnames if d.lower() not in skip_dirs]
+            if not any(f.lower().endswith(('.mkv', '.mp4')) for f in filenames):
+                continue
             folder = Path(dirpath)
-            video_files = get_video_files_for_folder(folder)
+            video_files = get_video_files_for_folder(folder, filenames)
             if video_files:
                 all_folders.append((folder, video_files))
+        pipeline.set_videos(video for _, video_files in all_folders for video in video_files)
         total_movies = sum(len(v) for _, v in all_folders) or 1
         idx = 1
         for folder, video_files in all_folders:
             for video_file in video_files:
                 extract_subtitles(video_file, idx, total_movies)
+                flag_for_acquisition(video_file)
                 idx += 1
     if missing_subs_list:
         print_and_log(f"\n{ext_tag()} {Fore.YELLOW}Summary: The following files are missing required subtitles:{Style.RESET_ALL}")
@@ -1177,7 +1287,7 @@ def process_directory(root_path):
         time.sleep(PAUSE_SECONDS)
         acq_script_path = SNAPSHOT_DIR / "acquisition.py"
         if acq_script_path.exists():
-            os.system(f'python "{acq_script_path}"')
+            pipeline.hand_off("acquisition")
             print_and_log(f"{ext_tag()} {Fore.GREEN}*{Style.RESET_ALL} extraction.py will now close.")
         else:
             print_and_log(f"{ext_tag()} {Fore.RED}acquisition.py not found in {SNAPSHOT_DIR}{Style.RESET_ALL}")
@@ -1188,15 +1298,29 @@ def process_directory(root_path):
         time.sleep(PAUSE_SECONDS)
         acq_script_path = SNAPSHOT_DIR / "acquisition.py"
         if acq_script_path.exists():
-            os.system(f'python "{acq_script_path}"')
+            pipeline.hand_off("acquisition")
             print_and_log(f"{ext_tag()} {Fore.GREEN}*{Style.RESET_ALL} extraction.py will now close.")
         else:
             print_and_log(f"{ext_tag()} {Fore.RED}acquisition.py not found in {SNAPSHOT_DIR}{Style.RESET_ALL}")
         exit(0)
-current_folder = Path(".").resolve()
-log(f"{ext_tag()} {Fore.CYAN}Start scanning: {current_folder}{Style.RESET_ALL}")
-missing_subs_list = []
-missing_file_log = LOGS_DIR / "subtitle_missing_tracks.txt"
 MOVIES_WITH_LINEAR_OFFSET_FILE = SNAPSHOT_DIR / 'movies_with_linear_offset.txt'
+missing_subs_list = []
+
+def main():
+    """Extract the subtitles of every video in the library, then hand over to acquisition."""
+    global missing_subs_list
+    init(autoreset=True)
+    read_config()
+    open_run_log()
+    clear_and_print_ascii(BANNER_LINE)
+    ensure_initial_setup()
+    anchor_dir = get_subservient_anchor()
+    os.chdir(anchor_dir)
+    current_folder = Path(".").resolve()
+    log(f"{ext_tag()} {Fore.CYAN}Start scanning: {current_folder}{Style.RESET_ALL}")
+    missing_subs_list = []
+    missing_file_log = LOGS_DIR / "subtitle_missing_tracks.txt"
+    process_directory(current_folder)
 
-process_directory(current_folder)
+if __name__ == "__main__":
+    profiling.run_phase("extraction", main)
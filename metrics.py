@@ -0,0 +1,202 @@
+import os
+import json
+import time
+import atexit
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+
+SUMMARY_FILE = 'metrics_summary.txt'
+RECORDS_FILE = 'metrics.jsonl'
+TEXTFILE_NAME = 'subservient.prom'
+
+records = []
+context = {}
+lock = threading.Lock()
+logs_dir = None
+textfile_dir = None
+
+def configure(run_logs_dir, prometheus_textfile_dir=None):
+    """Keep the timings of this run in its logs folder and, when a folder is given, export them for Prometheus."""
+    global logs_dir, textfile_dir
+    if logs_dir is None:
+        atexit.register(finish)
+    logs_dir = Path(run_logs_dir)
+    textfile_dir = Path(prometheus_textfile_dir) if prometheus_textfile_dir else None
+
+def set_context(**fields):
+    """Set the video or language the following operations belong to; a value of None removes the field."""
+    with lock:
+        for key, value in fields.items():
+            if value is None:
+                context.pop(key, None)
+            else:
+                context[key] = str(value)
+
+def record(operation, seconds, exit_code=None, size=0, retries=0, **fields):
+    entry = {'operation': operation, 'seconds': round(seconds, 4), 'exit_code': exit_code, 'bytes': size, 'retries': retries}
+    with lock:
+        entry.update(context)
+        entry.update({key: str(value) for key, value in fields.items() if value is not None})
+        records.append(entry)
+
+def input_size(cmd):
+    """Size of the first file named on a command line, taken as the bytes the command processes."""
+    for arg in cmd[1:]:
+        try:
+            if os.path.isfile(arg):
+                return os.path.getsize(arg)
+        except (TypeError, ValueError, OSError):
+            continue
+    return 0
+
+def command_name(cmd):
+    return Path(str(cmd[0])).stem.lower()
+
+def run(cmd, *args, operation=None, fields=None, **kwargs):
+    """subprocess.run that records wall time, input size and exit code, with fields such as video overriding the context."""
+    size = input_size(cmd)
+    start = time.perf_counter()
+    exit_code = None
+    try:
+        result = subprocess.run(cmd, *args, **kwargs)
+        exit_code = result.returncode
+        return result
+    except subprocess.TimeoutExpired:
+        exit_code = 'timeout'
+        raise
+    finally:
+        record(operation or command_name(cmd), time.perf_counter() - start, exit_code, size, **(fields or {}))
+
+class Popen(subprocess.Popen):
+    """subprocess.Popen that records wall time, input size and exit code once the process has been waited for."""
+
+    def __init__(self, cmd, *args, operation=None, **kwargs):
+        self.operation = operation or command_name(cmd)
+        self.size = input_size(cmd)
+        self.started = time.perf_counter()
+        self.recorded = False
+        super().__init__(cmd, *args, **kwargs)
+
+    def wait(self, timeout=None):
+        exit_code = super().wait(timeout)
+        if not self.recorded:
+            self.recorded = True
+            record(self.operation, time.perf_counter() - self.started, exit_code, self.size)
+        return exit_code
+
+def request(method, url, operation, retries=0, **kwargs):
+    """requests.request that records wall time, response size, HTTP status and the retries it took."""
+    import requests
+    start = time.perf_counter()
+    status, size = 'error', 0
+    try:
+        response = requests.request(method, url, **kwargs)
+        status, size = response.status_code, len(response.content)
+        return response
+    finally:
+        record(operation, time.perf_counter() - start, status, size, retries)
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def is_failure(entry):
+    exit_code = entry.get('exit_code')
+    if isinstance(exit_code, int):
+        return exit_code >= 400 if exit_code >= 100 else exit_code != 0
+    return exit_code is not None
+
+def operation_stats(entries):
+    stats = {}
+    for entry in entries:
+        stats.setdefault(entry['operation'], []).append(entry)
+    return {
+        operation: {
+            'count': len(items),
+            'seconds': [item['seconds'] for item in items],
+            'failures': sum(is_failure(item) for item in items),
+            'bytes': sum(item.get('bytes') or 0 for item in items),
+            'retries': sum(item.get('retries') or 0 for item in items),
+        }
+        for operation, items in sorted(stats.items())
+    }
+
+def render_summary(entries, slowest=10):
+    """Per operation p50/p95 wall time and totals, followed by the videos that took longest."""
+    lines = [f"{'operation':<16}{'count':>7}{'total s':>10}{'p50 s':>9}{'p95 s':>9}{'max s':>9}{'failed':>8}{'retries':>9}{'MB':>10}"]
+    for operation, stats in operation_stats(entries).items():
+        seconds = stats['seconds']
+        lines.append(f"{operation:<16}{stats['count']:>7}{sum(seconds):>10.1f}{percentile(seconds, 0.5):>9.2f}"
+                     f"{percentile(seconds, 0.95):>9.2f}{max(seconds):>9.2f}{stats['failures']:>8}{stats['retries']:>9}"
+                     f"{stats['bytes'] / 1e6:>10.1f}")
+    per_video = {}
+    for entry in entries:
+        if entry.get('video'):
+            per_video[entry['video']] = per_video.get(entry['video'], 0.0) + entry['seconds']
+    if per_video:
+        lines.append('')
+        lines.append('Slowest videos:')
+        for video, seconds in sorted(per_video.items(), key=lambda item: item[1], reverse=True)[:slowest]:
+            lines.append(f"{seconds:>10.1f}s  {video}")
+    return '\n'.join(lines) + '\n'
+
+def render_prometheus(entries):
+    """The run's timings in the Prometheus text format, for node_exporter's textfile collector."""
+    lines = [
+        '# HELP subservient_operation_seconds Wall time of external commands and API requests in the last run.',
+        '# TYPE subservient_operation_seconds summary',
+    ]
+    stats = operation_stats(entries)
+    for operation, item in stats.items():
+        for quantile in (0.5, 0.95):
+            lines.append(f'subservient_operation_seconds{{operation="{operation}",quantile="{quantile}"}} {percentile(item["seconds"], quantile):.4f}')
+        lines.append(f'subservient_operation_seconds_sum{{operation="{operation}"}} {sum(item["seconds"]):.4f}')
+        lines.append(f'subservient_operation_seconds_count{{operation="{operation}"}} {item["count"]}')
+    for name, key, help_text in (('failures', 'failures', 'Operations that failed or returned an error status'),
+                                 ('retries', 'retries', 'Retries taken by API requests'),
+                                 ('bytes', 'bytes', 'Bytes processed by commands or received from the API')):
+        lines.append(f'# HELP subservient_operation_{name} {help_text} in the last run.')
+        lines.append(f'# TYPE subservient_operation_{name} gauge')
+        for operation, item in stats.items():
+            lines.append(f'subservient_operation_{name}{{operation="{operation}"}} {item[key]}')
+    lines.append('# HELP subservient_last_run_timestamp_seconds When the last run wrote these metrics.')
+    lines.append('# TYPE subservient_last_run_timestamp_seconds gauge')
+    lines.append(f'subservient_last_run_timestamp_seconds {time.time():.0f}')
+    return '\n'.join(lines) + '\n'
+
+def write_atomically(path, text):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def finish():
+    """Add this process's timings to the run and write the run's summary and Prometheus file."""
+    if logs_dir is None:
+        return
+    with lock:
+        entries = records[:]
+        records.clear()
+    try:
+        records_path = logs_dir / RECORDS_FILE
+        if entries:
+            with open(records_path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries)
+        run_entries = []
+        if records_path.exists():
+            with open(records_path, 'r', encoding='utf-8') as f:
+                run_entries = [json.loads(line) for line in f if line.strip()]
+        if not run_entries:
+            return
+        write_atomically(logs_dir / SUMMARY_FILE, render_summary(run_entries))
+        if textfile_dir:
+            textfile_dir.mkdir(parents=True, exist_ok=True)
+            write_atomically(textfile_dir / TEXTFILE_NAME, render_prometheus(run_entries))
+    except (OSError, ValueError):
+        pass
@@ -0,0 +1,163 @@
+import os
+import re
+import sys
+import runpy
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from utils import get_config, get_subtitle_offset
+import metrics
+import decisions
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+CONFIG_PATH = SCRIPT_DIR / '.config'
+STAGES = ("extraction", "acquisition", "synchronisation")
+
+active = False
+next_stage = None
+videos = []
+pending = {}
+presync_pool = None
+presync_dir = None
+presync_jobs = {}
+
+def hand_off(stage):
+    """Start the next phase: after this one in the orchestrator, otherwise in a new interpreter."""
+    global next_stage
+    if active:
+        next_stage = stage
+        sys.exit(0)
+    flags = ' --headless' if decisions.headless() else ''
+    os.system(f'python "{SCRIPT_DIR / f"{stage}.py"}"{flags}')
+
+def set_videos(found):
+    """Remember every video of the library so later phases do not have to walk the tree again."""
+    if active:
+        videos[:] = [str(video) for video in found]
+
+def library_videos():
+    """Return every video extraction found, or None when the phase was started on its own."""
+    return list(videos) if active else None
+
+def queue(stage, video):
+    """Flag a video for the given phase, keeping the order in which videos were flagged."""
+    if active:
+        pending.setdefault(stage, {})[str(video)] = None
+
+def take(stage):
+    """Return the videos flagged for the given phase, or None when the phase was started on its own."""
+    if not active:
+        return None
+    return list(pending.pop(stage, {}))
+
+def start_presync():
+    """Start the background workers that synchronise candidates while acquisition is still downloading."""
+    global presync_pool, presync_dir
+    try:
+        workers = int(get_config(CONFIG_PATH).get('background_sync_workers', 2))
+    except ValueError:
+        workers = 2
+    if workers > 0 and shutil.which('ffsubsync'):
+        presync_pool = ThreadPoolExecutor(max_workers=workers)
+        presync_dir = tempfile.mkdtemp(prefix="subservient-presync-")
+
+def stop_presync():
+    """Stop the background workers and remove the synchronised subtitles nobody picked up."""
+    global presync_pool, presync_dir
+    if presync_pool:
+        presync_pool.shutdown(wait=True, cancel_futures=True)
+    if presync_dir:
+        shutil.rmtree(presync_dir, ignore_errors=True)
+    presync_pool = presync_dir = None
+    presync_jobs.clear()
+
+def presync(video, lang):
+    """Queue the downloaded candidates of a video for synchronisation in the background."""
+    if presync_pool:
+        presync_jobs[(str(video), lang)] = presync_pool.submit(presync_candidates, str(video), lang)
+
+def presync_candidates(video, lang):
+    """Synchronise candidates in the order synchronisation tries them, until one is not rejected as DRIFT."""
+    results = {}
+    if os.path.exists(f"{os.path.splitext(video)[0]}.{lang}.srt"):
+        return results
+    video_dir = os.path.dirname(video)
+    candidates = [os.path.join(video_dir, f) for f in os.listdir(video_dir)
+                  if re.match(rf".*\.{re.escape(lang)}\.number\d+\.srt$", f)]
+    candidates.sort(key=lambda x: int(re.search(r"number(\d+)", x).group(1)))
+    reject_threshold = float(get_config(CONFIG_PATH).get('reject_offset_threshold', 2.5))
+    for sub in candidates:
+        fd, output_path = tempfile.mkstemp(suffix=".srt", dir=presync_dir)
+        os.close(fd)
+        try:
+            result = metrics.run(['ffsubsync', video, '-i', sub, '-o', output_path], operation="ffsubsync_background",
+                                 fields={'video': os.path.basename(video), 'language': lang},
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=600)
+            success = result.returncode == 0 and os.path.getsize(output_path) > 0
+        except (OSError, subprocess.TimeoutExpired):
+            success = False
+        if not success:
+            results[sub] = (None, 0.0)
+            continue
+        try:
+            offset_seconds = get_subtitle_offset(sub, output_path)
+        except (OSError, ValueError):
+            offset_seconds = 0.0
+        results[sub] = (output_path, offset_seconds)
+        if offset_seconds <= reject_threshold:
+            break
+    return results
+
+def take_presynced(video, lang, subtitle, output_path):
+    """Move a background synchronisation of subtitle to output_path and return (success, offset), or None when there is none."""
+    job = presync_jobs.get((str(video), lang))
+    if job is None:
+        return None
+    try:
+        result = job.result().pop(subtitle, None)
+    except Exception:
+        return None
+    if result is None:
+        return None
+    synced_path, offset_seconds = result
+    if synced_path is None:
+        return False, 0.0
+    shutil.move(synced_path, output_path)
+    return True, offset_seconds
+
+def run_stage(stage):
+    """Run one phase script in this process and return its exit code."""
+    stdout, stderr = sys.stdout, sys.stderr
+    try:
+        runpy.run_path(str(SCRIPT_DIR / f"{stage}.py"), run_name="__main__")
+        return 0
+    except SystemExit as e:
+        return e.code
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+def run(first_stage="extraction"):
+    """Run the phases in one process, passing the flagged videos from one phase to the next."""
+    global active, next_stage
+    if str(SCRIPT_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPT_DIR))
+    sys.modules.setdefault("pipeline", sys.modules[__name__])
+    active = True
+    videos.clear()
+    pending.clear()
+    next_stage = first_stage
+    code = 0
+    start_presync()
+    try:
+        while next_stage:
+            stage, next_stage = next_stage, None
+            code = run_stage(stage)
+            if next_stage is None:
+                break
+    finally:
+        stop_presync()
+        active = False
+        next_stage = None
+    return code
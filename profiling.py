@@ -0,0 +1,81 @@
+import io
+import os
+import sys
+import time
+import cProfile
+import pstats
+import tracemalloc
+from pathlib import Path
+from utils import get_config
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+CONFIG_PATH = SCRIPT_DIR / '.config'
+ENV_VAR = 'SUBSERVIENT_PROFILE'
+TOP_N = 40
+
+def profile_mode():
+    """Return 'memory', 'cpu' or None, from --profile-memory/--profile, the environment or the profile config key."""
+    if '--profile-memory' in sys.argv:
+        os.environ[ENV_VAR] = 'memory'
+    elif '--profile' in sys.argv:
+        os.environ.setdefault(ENV_VAR, 'cpu')
+    mode = os.environ.get(ENV_VAR)
+    if mode is None:
+        mode = str(get_config(CONFIG_PATH).get('profile', 'false')).strip().lower()
+    if mode == 'memory':
+        return 'memory'
+    if mode in ('cpu', 'true', '1', 'yes', 'on'):
+        return 'cpu'
+    return None
+
+def profile_paths(phase):
+    """Return the .pstats and report paths for the next profile of a phase in this run's logs folder."""
+    try:
+        run_counter = int(get_config(CONFIG_PATH).get('run_counter', 1))
+    except ValueError:
+        run_counter = 1
+    logs_dir = SCRIPT_DIR / 'logs' / f'Subservient-run-{run_counter}'
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    part = 1
+    while (logs_dir / f'{phase}_profile_{part}.pstats').exists():
+        part += 1
+    return logs_dir / f'{phase}_profile_{part}.pstats', logs_dir / f'{phase}_profile_{part}.txt'
+
+def render_report(phase, profiler, seconds, snapshot=None, peak=None):
+    """Top functions by cumulative and own time, and the lines that allocated most memory when it was traced."""
+    out = io.StringIO()
+    out.write(f'{phase.capitalize()} profile - {seconds:.1f}s wall time\n')
+    for sort_key, title in (('cumulative', 'cumulative time'), ('tottime', 'own time')):
+        out.write(f'\n=== Top {TOP_N} functions by {title} ===\n')
+        pstats.Stats(profiler, stream=out).sort_stats(sort_key).print_stats(TOP_N)
+    if snapshot is not None:
+        out.write(f'\n=== Top {TOP_N} allocations by line (peak {peak / 1e6:.1f} MB) ===\n')
+        for stat in snapshot.statistics('lineno')[:TOP_N]:
+            out.write(f'{stat}\n')
+    return out.getvalue()
+
+def run_phase(phase, main):
+    """Run a phase's main(), under cProfile (and tracemalloc) when profiling is on."""
+    mode = profile_mode()
+    if mode is None:
+        return main()
+    if mode == 'memory':
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+        return profiler.runcall(main)
+    finally:
+        seconds = time.perf_counter() - start
+        snapshot = peak = None
+        if mode == 'memory':
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        try:
+            stats_path, report_path = profile_paths(phase)
+            profiler.dump_stats(str(stats_path))
+            report_path.write_text(render_report(phase, profiler, seconds, snapshot, peak), encoding='utf-8')
+            print(f"Profile of {phase} written to {report_path}")
+        except OSError as e:
+            print(f"Warning: Could not write the {phase} profile: {e}")
@@ -0,0 +1,157 @@
+import os
+import re
+import json
+import time
+import atexit
+import datetime
+import threading
+from pathlib import Path
+
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m|\033\[[0-9;]*m')
+FLUSH_SECONDS = 2.0
+PARTS_FILE = 'log_parts.json'
+
+open_logs = {}
+_flusher = None
+
+def strip_ansi(text):
+    """Remove ANSI color codes from text."""
+    return ANSI_ESCAPE.sub('', str(text))
+
+class RunLog:
+    """A phase log kept open for the whole run; the text log is a rendering of the events written to it.
+
+    With structured logging on, every event is also written as one JSON line next to the text log,
+    carrying the phase, the current video and language, and any fields given with the event.
+    """
+
+    def __init__(self, path, phase, structured=False, truncate=False):
+        self.path = Path(path)
+        self.phase = phase
+        self.context = {}
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.file = open(self.path, 'w' if truncate else 'a', encoding='utf-8')
+        self.json_file = None
+        if structured:
+            self.json_file = open(self.path.with_suffix('.jsonl'), 'w' if truncate else 'a', encoding='utf-8')
+
+    def write(self, text):
+        """Write text to the text log only, for banners and headers."""
+        with self.lock:
+            self.file.write(strip_ansi(text))
+            self.dirty = True
+
+    def set_context(self, **fields):
+        """Set fields such as video or language for the events that follow; a value of None removes the field."""
+        with self.lock:
+            for key, value in fields.items():
+                if value is None:
+                    self.context.pop(key, None)
+                else:
+                    self.context[key] = str(value)
+
+    def event(self, message, end='\n', **fields):
+        """Log a message, with optional structured fields such as candidate or duration."""
+        text = strip_ansi(message)
+        with self.lock:
+            self.file.write(text + ('' if end == '' else end))
+            if self.json_file:
+                record = {'time': datetime.datetime.now().isoformat(timespec='milliseconds'), 'phase': self.phase}
+                record.update(self.context)
+                record.update({key: value for key, value in fields.items() if value is not None})
+                record['message'] = text.strip()
+                self.json_file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self.dirty = True
+
+    def user_input(self, answer):
+        """Log an answer the user typed and flush, as the run may be stopped at any prompt."""
+        self.event(f'[USER INPUT] {answer}', kind='input')
+        self.flush()
+
+    def flush(self):
+        with self.lock:
+            if self.dirty and not self.file.closed:
+                self.file.flush()
+                if self.json_file:
+                    self.json_file.flush()
+                self.dirty = False
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.file.close()
+            if self.json_file:
+                self.json_file.close()
+
+def flush_periodically():
+    while True:
+        time.sleep(FLUSH_SECONDS)
+        for run_log in list(open_logs.values()):
+            try:
+                run_log.flush()
+            except (OSError, ValueError):
+                pass
+
+def close_all():
+    """Flush and close every open log."""
+    for path in list(open_logs):
+        try:
+            open_logs.pop(path).close()
+        except (OSError, ValueError):
+            pass
+
+atexit.register(close_all)
+
+def open_log(path, phase, structured=False, truncate=False):
+    """Open a log for the run, or return it when it is already open; raises OSError when it cannot be created."""
+    global _flusher
+    key = str(Path(path).resolve())
+    run_log = open_logs.get(key)
+    if run_log is None or run_log.file.closed:
+        run_log = open_logs[key] = RunLog(path, phase, structured, truncate)
+    elif truncate:
+        run_log.file.seek(0)
+        run_log.file.truncate()
+    if _flusher is None:
+        _flusher = threading.Thread(target=flush_periodically, name='runlog-flush', daemon=True)
+        _flusher.start()
+    return run_log
+
+def next_part(logs_dir, phase, log_file):
+    """Count another part of a phase's log, so the log itself does not have to be read to number its parts."""
+    parts_path = Path(logs_dir) / PARTS_FILE
+    try:
+        parts = json.loads(parts_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        parts = {}
+    if phase not in parts:
+        title = f'{phase.capitalize()} - part'
+        try:
+            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+                parts[phase] = sum(line.startswith(title) for line in f)
+        except OSError:
+            parts[phase] = 0
+    parts[phase] += 1
+    try:
+        parts_path.write_text(json.dumps(parts), encoding='utf-8')
+    except OSError:
+        pass
+    return parts[phase]
+
+def open_phase_log(logs_dir, phase, structured=False):
+    """Continue the phase's log of this run, or start one, and write a '<Phase> - part N' header to it."""
+    logs_dir = Path(logs_dir)
+    existing_log = next((logs_dir / f for f in os.listdir(logs_dir)
+                         if f.startswith(f'{phase}_log') and f.endswith('.txt')), None)
+    if existing_log:
+        log_file = existing_log
+    else:
+        log_time = datetime.datetime.now().strftime('%d-%m-%Y_%H.%M.%S')
+        log_file = logs_dir / f'{phase}_log_{log_time}.txt'
+    part = next_part(logs_dir, phase, log_file)
+    run_log = open_log(log_file, phase, structured)
+    if run_log.file.tell() > 0:
+        run_log.write('\n')
+    run_log.write(f'{phase.capitalize()} - part {part}\n')
+    return run_log
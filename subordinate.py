@@ -1,6 +1,7 @@
 import os
 import sys
 import subprocess
+import importlib.util
 try:
     from colorama import init, Fore, Style
     init(autoreset=True)
@@ -25,12 +26,7 @@ def ensure_core_requirements():
         ("ffsubsync", None),
         ("langdetect", None),
     ]
-    missing = []
-    for pkg, import_name in REQUIRED_PACKAGES:
-        try:
-            __import__(import_name or pkg)
-        except ImportError:
-            missing.append(pkg)
+    missing = [pkg for pkg, import_name in REQUIRED_PACKAGES if importlib.util.find_spec(import_name or pkg) is None]
     if missing:
         print("\n[Subservient] The following required packages are missing:")
         for pkg in missing:
@@ -90,14 +86,16 @@ def ensure_core_requirements():
 ensure_core_requirements()
 
 print("[Subservient] Loading imports..")
-import importlib.util
+import importlib.metadata
+import json
+import glob
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from platformdirs import user_config_dir
 from datetime import datetime
 import re
-import pycountry
-import requests
 
 BANNER_LINE = f"                   {Fore.LIGHTRED_EX}[Phase 1/4]{Style.RESET_ALL} Subservient Set-up"
 
@@ -174,15 +172,7 @@ def print_subservient_checklist():
     if anchor_path is None:
         anchor_path = Path(__file__).parent.resolve()
     
-    config_path = anchor_path / '.config'
-    config = {}
-    if config_path.exists():
-        with open(config_path, encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                m = re.match(r'^([a-zA-Z0-9_]+)\s*=\s*(.+)$', line)
-                if m:
-                    config[m.group(1).strip().lower()] = m.group(2).strip()
+    config = dict(utils.get_config(anchor_path / '.config').settings)
     
     series_mode = config.get('series_mode', None)
     top_downloads = config.get('top_downloads', None)
@@ -250,7 +240,8 @@ def print_main_menu():
     print(f"  {Fore.GREEN}5{Style.RESET_ALL} = Extra tools")
     print(f"  {Fore.GREEN}6{Style.RESET_ALL} = Recreate .config file")
     print(f"  {Fore.GREEN}7{Style.RESET_ALL} = Open README file")
-    print(f"  {Fore.GREEN}8{Style.RESET_ALL} = Exit\n")
+    print(f"  {Fore.GREEN}8{Style.RESET_ALL} = Review deferred decisions")
+    print(f"  {Fore.GREEN}9{Style.RESET_ALL} = Exit\n")
 
 def print_subtitle_cleaner_intro():
     """Display subtitle cleaner introduction and options."""
@@ -475,6 +466,11 @@ accept_offset_threshold= 0.05
 #   You could try up to 4 seconds if you want to be more lenient, but I would not recommend going any higher, unless some videos are consistently rejected.
 reject_offset_threshold= 2.5
 
+# - BACKGROUND_SYNC_WORKERS: Number of subtitles that are synchronised in the background while acquisition is still searching and downloading.
+#   Synchronisation then mostly picks up finished results instead of starting from scratch. Set to 0 to synchronise everything afterwards, as before.
+#   Each worker runs one ffsubsync at a time, so keep this below the number of CPU cores you have. Recommended: 2.
+background_sync_workers= 2
+
 # - SERIES_MODE: If true, treat all videos in the same folder as episodes of a TV series.
 #   If false, only the largest video file in each folder is processed (movie mode).
 series_mode= false
@@ -495,6 +491,11 @@ extras_folder_name= extras
 preserve_forced_subtitles= false
 preserve_unwanted_subtitles= false
 
+# - LANGUAGE_DETECTION_CONFIDENCE: Confidence (0.0 to 1.0) needed before an extracted subtitle's detected language is accepted.
+#   Extraction samples cues spread across the subtitle and stops as soon as this confidence is reached.
+#   Tracks whose container language tag passes a quick check skip detection altogether. Lower values are faster, higher values are stricter. Recommended: 0.9.
+language_detection_confidence= 0.9
+
 # - PAUSE_SECONDS: Number of seconds to pause between phases, breaks, and other script waits.
 #   If you don't mind about reading what happens in the terminal, a lower value can be set. Example: 5 means a 5 second pause between phases and after summaries. Average speed = 5.
 pause_seconds= 5
@@ -527,6 +528,22 @@ skip_dirs= new folder,nieuwe map,extra,extra's,extras,featurettes,bonus,bonusmat
 #   The inclusion of various format and distribution tags serves technical interoperability purposes only.
 UNWANTED_TERMS= sample,cam,ts,workprint,unrated,uncut,720p,1080p,2160p,480p,4k,uhd,imax,eng,ita,jap,hindi,web,webrip,web-dl,bluray,brrip,bdrip,dvdrip,hdrip,hdtv,remux,x264,x265,h.264,h.265,hevc,avc,hdr,hdr10,hdr10+,dv,dolby.vision,sdr,10bit,8bit,ddp,dd+,dts,aac,ac3,eac3,truehd,atmos,flac,5.1,7.1,2.0,yts,yts.mx,yify,rarbg,fgt,galaxyrg,cm8,evo,sparks,drones,amiable,kingdom,tigole,chd,ddr,hdchina,cinefile,ettv,eztv,aXXo,maven,fitgirl,skidrow,reloaded,codex,cpy,conspir4cy,hoodlum,hive-cm8,extras,final.cut,open.matte,hybrid,version,v2,proper,limited,dubbed,subbed,multi,dual.audio,complete.series,complete.season,Licdom,ac,sub,nl,en,ita,eng,subs,rip,h265,xvid,mp3,mp4,avi,Anime Time,[Anime Time]
 
+# - JSON_LOG: If true, every phase also writes its log as JSON lines (a .jsonl file next to the .txt log in the logs folder).
+#   Each line carries the phase, video, language and, where it applies, the subtitle candidate and how long it took. Handy for scripts and dashboards.
+json_log= false
+
+# - PROMETHEUS_TEXTFILE_DIR: Folder of node_exporter's textfile collector. If set, every run writes its timings there as subservient.prom.
+#   The logs folder of the run always gets metrics_summary.txt, with the median and 95th percentile time of every tool and API call and the slowest videos.
+prometheus_textfile_dir=
+
+# - PROFILE: If true, every phase is profiled with cProfile; set it to memory to also trace memory allocations.
+#   The .pstats file and a text report of the slowest functions are written to the logs folder of the run. Starting with --profile does the same for one run.
+profile= false
+
+# - HEADLESS: If true, the phases never wait for input. Every question is answered with its safe default and kept in a review queue.
+#   Go through the queue with main menu option 8 or subordinate.py --review; answers are applied on the next run. Starting with --headless does the same for one run.
+headless= false
+
 # - RUN_COUNTER: used to count how many full runs have been made. Also used to organize logfiles
 #   Don't change if you don't need to, as it may result in overwriting existing logs
 run_counter= 0
@@ -566,6 +583,8 @@ def import_utils():
     
     if utils_path and Path(utils_path).exists():
         try:
+            if str(Path(utils_path).parent) not in sys.path:
+                sys.path.insert(0, str(Path(utils_path).parent))
             spec = importlib.util.spec_from_file_location("utils", utils_path)
             utils = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(utils)
@@ -606,7 +625,7 @@ def ensure_initial_setup():
     Also detects if subordinate.py has been moved and requires re-setup.
     """
     required_keys = ["subservient_anchor", "subordinate_path", "extraction_path", "acquisition_path", "synchronisation_path", "utils_path"]
-    required_scripts = ["subordinate.py", "extraction.py", "acquisition.py", "synchronisation.py", "utils.py"]
+    required_scripts = ["subordinate.py", "extraction.py", "acquisition.py", "synchronisation.py", "utils.py", "pipeline.py", "metrics.py", "profiling.py", "decisions.py"]
     
     config_dir = Path(user_config_dir()) / "Subservient"
     config_dir.mkdir(parents=True, exist_ok=True)
@@ -725,12 +744,18 @@ ensure_initial_setup()
 utils = import_utils()
 write_anchor_to_pathfile()
 write_subordinate_path_to_pathfile()
+REQUIREMENTS_LOG = None
+
 def get_log_path():
     """Get path for requirements log file based on run counter.
     
     Creates logs directory if needed and returns the log file path using
     the main Subservient folder for logs, not the local subordinate.py location.
+    The path is chosen once per start, so all events of a check end up in one log.
     """
+    global REQUIREMENTS_LOG
+    if REQUIREMENTS_LOG:
+        return REQUIREMENTS_LOG
     config_dir = Path(user_config_dir()) / "Subservient"
     pathfile = config_dir / "Subservient_pathfiles"
     
@@ -749,7 +774,8 @@ def get_log_path():
     logs_dir = subservient_anchor / "logs"
     logs_dir.mkdir(exist_ok=True)
     log_timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    return logs_dir / f"install_log_{log_timestamp}.txt"
+    REQUIREMENTS_LOG = logs_dir / f"install_log_{log_timestamp}.txt"
+    return REQUIREMENTS_LOG
 
 def log_requirements_event(message):
     """Log requirements-related event to requirements log file.
@@ -779,218 +805,272 @@ def get_config_and_pause_seconds():
                     anchor_path = utils_path.parent
                     break
     
-    config_path = anchor_path / '.config'
-    config = {}
-    if config_path.exists():
-        with open(config_path, encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                m = re.match(r'^([a-zA-Z0-9_]+)\s*=\s*(.+)$', line)
-                if m:
-                    config[m.group(1).strip().lower()] = m.group(2).strip()
+    config = dict(utils.get_config(anchor_path / '.config').settings)
     
     pause_seconds = float(config.get('pause_seconds', 5))
     return config, pause_seconds
 
-def check_requirements_status():
-    """Comprehensive check and installation of all required packages and tools.
+REQUIREMENTS_CACHE = Path(user_config_dir()) / "Subservient" / "requirements_cache.json"
+REQUIRED_MODULES = [
+    ("colorama", "Colorama"),
+    ("platformdirs", "Platformdirs"),
+    ("requests", "Requests"),
+    ("tqdm", "Tqdm"),
+    ("pycountry", "PyCountry"),
+    ("ffsubsync", "ffsubsync"),
+    ("langdetect", "langdetect"),
+]
+VS_PATTERNS = [
+    r"C:\Program Files\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
+    r"C:\Program Files (x86)\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
+    r"C:\Program Files\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
+    r"C:\Program Files (x86)\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
+    r"C:\Program Files (x86)\Microsoft Visual Studio\*\BuildTools\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
+    r"C:\Program Files (x86)\Microsoft Visual Studio\*\BuildTools\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
+    r"C:\Program Files (x86)\Microsoft Visual Studio 14.0\VC\bin\cl.exe",
+    r"C:\Program Files (x86)\Microsoft Visual Studio\2017\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
+    r"C:\Program Files (x86)\Microsoft Visual Studio\2017\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe"
+]
+
+def load_requirements_cache():
+    """Load the results of earlier requirement checks; a missing or unreadable cache is empty."""
+    try:
+        with open(REQUIREMENTS_CACHE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_requirements_cache(cache):
+    """Save the results of requirement checks for the next start."""
+    try:
+        REQUIREMENTS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(REQUIREMENTS_CACHE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+
+def package_fingerprint(module):
+    """Return the interpreter, version and install location of a package, or None when it is not installed."""
+    spec = importlib.util.find_spec(module)
+    if spec is None:
+        return None
+    try:
+        version = importlib.metadata.version(module)
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    origin = spec.origin or next(iter(spec.submodule_search_locations or []), "")
+    try:
+        mtime = os.stat(origin).st_mtime_ns
+    except OSError:
+        mtime = 0
+    return f"{sys.executable}|{version}|{origin}|{mtime}"
+
+def tool_fingerprint(tool):
+    """Return the path, modification time and size of an executable on PATH, or None when it is not found."""
+    path = shutil.which(tool)
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{path}|{st.st_mtime_ns}|{st.st_size}"
+
+def cached_check(cache, name, fingerprint, check):
+    """Run check() unless it passed before for the same fingerprint; returns (passed, message, from_cache).
     
-    This complex function tests all Python packages, external tools like ffmpeg and MKVToolNix,
-    and Windows-specific build tools. It displays detailed status information, performs
-    functional tests where possible, and logs all results to file for troubleshooting.
+    Only passing results are kept, so anything that failed is tested again on the next check.
     """
-    import importlib
-    import time
-    import pycountry
-    import requests
-    import re
-    config, pause_seconds = get_config_and_pause_seconds()
-    status_lines = []
-    log_requirements_event("--- REQUIREMENTS VERIFICATION START ---")
-    
-    from platformdirs import user_config_dir
-    config_dir = Path(user_config_dir()) / "Subservient"
-    pathfile = Path(config_dir) / "Subservient_pathfiles"
-    anchor_path = Path(__file__).parent
-    
-    if pathfile.exists():
-        with open(pathfile, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("utils_path="):
-                    utils_path = Path(line.split("=", 1)[1].strip())
-                    anchor_path = utils_path.parent
-                    break
-    
-    config_path = anchor_path / '.config'
-    config = {}
-    if config_path.exists():
-        with open(config_path, encoding='utf-8') as f:
-            for line in f:
-                m = re.match(r'^([a-zA-Z0-9_]+)\s*=\s*(.+)$', line.strip())
-                if m:
-                    config[m.group(1).strip().lower()] = m.group(2).strip()
-    
-    required = [
-        ("colorama", "Colorama"),
-        ("platformdirs", "Platformdirs"),
-        ("requests", "Requests"),
-        ("tqdm", "Tqdm"),
-        ("pycountry", "PyCountry"),
-        ("ffsubsync", "ffsubsync"),
-        ("langdetect", "langdetect"),
-    ]
-    
-    total = len(required) + 3 
-    for idx, (mod, display) in enumerate(required, 1):
-        utils.clear_and_print_ascii(BANNER_LINE)
-        print(f"{Fore.LIGHTYELLOW_EX}Subservient is currently testing {display}... {Fore.LIGHTBLUE_EX}[{idx}/{total}]{Style.RESET_ALL}")
-        test_passed = False
-        test_msg = ""
-        
-        try:
-            m = importlib.import_module(mod)
-            if mod == "colorama":
-                _ = m.Fore.GREEN + m.Style.RESET_ALL
-                test_passed = True
-                test_msg = "colorama functional test passed"
-            elif mod == "platformdirs":
-                from platformdirs import user_config_dir
-                _ = user_config_dir("SubservientTest")
-                test_passed = True
-                test_msg = "platformdirs functional test passed"
-            elif mod == "requests":
-                print(f"{Fore.LIGHTYELLOW_EX}Testing internet connectivity... {Fore.LIGHTBLUE_EX}[{idx}/{total}]{Style.RESET_ALL}")
-                for i in range(5):
-                    try:
-                        r = requests.get("https://httpbin.org/get", timeout=3)
-                        if r.status_code == 200:
-                            test_passed = True
-                            test_msg = "requests functional test passed"
-                            break
-                    except Exception as e:
-                        log_requirements_event(f"Requests attempt {i+1}: {e}")
-                    if i < 4:
-                        time.sleep(pause_seconds)
-                if not test_passed:
-                    test_msg = "requests functional test failed"
-            elif mod == "tqdm":
-                from tqdm import tqdm
-                for _ in tqdm(range(1), disable=True):
-                    pass
-                test_passed = True
-                test_msg = "tqdm functional test passed"
-            elif mod == "pycountry":
-                lang = pycountry.languages.get(alpha_2="en")
-                test_passed = lang is not None and hasattr(lang, "alpha_3")
-                test_msg = "pycountry functional test passed" if test_passed else "pycountry lookup failed"
-            elif mod == "ffsubsync":
-                result = subprocess.run(["ffsubsync", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=10)
-                output = result.stdout.decode(errors="ignore") + result.stderr.decode(errors="ignore")
-                version_match = re.search(r"\d+\.\d+(\.\d+)?", output)
-                test_passed = result.returncode == 0 and version_match is not None
-                test_msg = "ffsubsync version check passed" if test_passed else f"ffsubsync version check failed"
-            elif mod == "langdetect":
-                from langdetect import detect
-                detected = detect("This is an English sentence.")
-                test_passed = detected == "en"
-                test_msg = "langdetect functional test passed" if test_passed else f"langdetect returned '{detected}'"
-            
-            log_requirements_event(f"{display:<13} : {'working' if test_passed else 'installed, but not working'} | {test_msg}")
-            status = f"{Fore.WHITE}[{Fore.GREEN}working{Fore.WHITE}]{Style.RESET_ALL}" if test_passed else f"{Fore.WHITE}[{Fore.YELLOW}installed, but not working{Fore.WHITE}]{Style.RESET_ALL}"
-            
-        except Exception as e:
-            status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not installed{Fore.WHITE}]{Style.RESET_ALL}"
-            log_requirements_event(f"{display:<13} : not installed | import failed: {e}")
-        
-        status_lines.append(f"{Fore.YELLOW}{display:<13}{Style.RESET_ALL} : {status}")
+    entry = cache.get(name)
+    if entry and entry.get("fingerprint") == fingerprint:
+        return True, entry.get("message", ""), True
+    passed, message = check()
+    if passed:
+        cache[name] = {"fingerprint": fingerprint, "message": message}
+    else:
+        cache.pop(name, None)
+    return passed, message, False
+
+def find_build_tools(cache):
+    """Return (cl_path, in_path) for the Microsoft Visual C++ compiler, or (None, False) when it is not found.
     
-    utils.clear_and_print_ascii(BANNER_LINE)
-    print(f"{Fore.LIGHTYELLOW_EX}Testing ffmpeg... {Fore.LIGHTBLUE_EX}[{total-2}/{total}]{Style.RESET_ALL}")
+    The Visual Studio folders are only searched again when the location found earlier is gone.
+    """
+    cl_path = shutil.which('cl')
+    if cl_path:
+        return cl_path, True
+    cached_path = cache.get("msvc_location")
+    if cached_path and os.path.exists(cached_path):
+        return cached_path, False
+    for pattern in VS_PATTERNS:
+        matches = glob.glob(pattern)
+        if matches:
+            cache["msvc_location"] = matches[0]
+            return matches[0], False
+    cache.pop("msvc_location", None)
+    return None, False
+
+def test_module(mod, pause_seconds):
+    """Import a required package and run its functional test; returns (passed, message)."""
+    m = importlib.import_module(mod)
+    if mod == "colorama":
+        _ = m.Fore.GREEN + m.Style.RESET_ALL
+        return True, "colorama functional test passed"
+    elif mod == "platformdirs":
+        _ = m.user_config_dir("SubservientTest")
+        return True, "platformdirs functional test passed"
+    elif mod == "requests":
+        for i in range(5):
+            try:
+                r = m.get("https://httpbin.org/get", timeout=3)
+                if r.status_code == 200:
+                    return True, "requests functional test passed"
+            except Exception as e:
+                log_requirements_event(f"Requests attempt {i+1}: {e}")
+            if i < 4:
+                time.sleep(pause_seconds)
+        return False, "requests functional test failed"
+    elif mod == "tqdm":
+        for _ in m.tqdm(range(1), disable=True):
+            pass
+        return True, "tqdm functional test passed"
+    elif mod == "pycountry":
+        lang = m.languages.get(alpha_2="en")
+        passed = lang is not None and hasattr(lang, "alpha_3")
+        return passed, "pycountry functional test passed" if passed else "pycountry lookup failed"
+    elif mod == "ffsubsync":
+        result = subprocess.run(["ffsubsync", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=10)
+        output = result.stdout.decode(errors="ignore") + result.stderr.decode(errors="ignore")
+        version_match = re.search(r"\d+\.\d+(\.\d+)?", output)
+        passed = result.returncode == 0 and version_match is not None
+        return passed, "ffsubsync version check passed" if passed else "ffsubsync version check failed"
+    elif mod == "langdetect":
+        detected = m.detect("This is an English sentence.")
+        passed = detected == "en"
+        return passed, "langdetect functional test passed" if passed else f"langdetect returned '{detected}'"
+    return True, f"{mod} imported"
+
+def check_module(mod, cache, pause_seconds):
+    """Test one required package, reusing an earlier pass while the package is unchanged; returns (installed, passed, message).
     
+    The requests test checks the internet connection as well, so it is never taken from the cache.
+    """
+    fingerprint = package_fingerprint(mod)
+    if fingerprint is None:
+        return False, False, "import failed: not installed"
+    if mod == "ffsubsync":
+        fingerprint += f"|{tool_fingerprint('ffsubsync')}"
     try:
-        subprocess.run(["ffmpeg", "-version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-        ffmpeg_status = f"{Fore.WHITE}[{Fore.GREEN}working{Fore.WHITE}]{Style.RESET_ALL}"
-        log_requirements_event("ffmpeg working")
+        if mod == "requests":
+            passed, message = test_module(mod, pause_seconds)
+        else:
+            passed, message, from_cache = cached_check(cache, mod, fingerprint, lambda: test_module(mod, pause_seconds))
+            if from_cache:
+                message += " (cached)"
     except Exception as e:
-        ffmpeg_status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not installed{Fore.WHITE}]{Style.RESET_ALL}"
-        log_requirements_event(f"ffmpeg not installed: {e}")
-    
-    status_lines.append(f"{Fore.YELLOW}ffmpeg       {Style.RESET_ALL} : {ffmpeg_status}")
-    
-    utils.clear_and_print_ascii(BANNER_LINE)
-    print(f"{Fore.LIGHTYELLOW_EX}Testing MKVToolNix (mkvmerge)... {Fore.LIGHTBLUE_EX}[{total-1}/{total}]{Style.RESET_ALL}")
-    
+        return False, False, f"import failed: {e}"
+    return True, passed, message
+
+def check_tool(tool, cache):
+    """Run '<tool> -version' unless it passed before for the same executable; returns (passed, message)."""
+    fingerprint = tool_fingerprint(tool)
+    if fingerprint is None:
+        return False, f"{tool} not found on PATH"
+    def run_version():
+        try:
+            subprocess.run([tool, "-version" if tool == "ffmpeg" else "--version"],
+                           stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, timeout=30)
+            return True, "working"
+        except Exception as e:
+            return False, str(e)
+    passed, message, from_cache = cached_check(cache, tool, fingerprint, run_version)
+    return passed, f"{message} (cached)" if from_cache else message
+
+def check_build_tools(cache):
+    """Check the Microsoft Visual C++ Build Tools on Windows; returns (status, log message)."""
+    if os.name != 'nt':
+        return (f"{Fore.WHITE}[{Fore.CYAN}not needed (non-Windows){Fore.WHITE}]{Style.RESET_ALL}",
+                "Microsoft Visual C++ Build Tools - not needed on non-Windows system")
     try:
-        result = subprocess.run(["mkvmerge", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-        mkvmerge_status = f"{Fore.WHITE}[{Fore.GREEN}working{Fore.WHITE}]{Style.RESET_ALL}"
-        log_requirements_event("MKVToolNix (mkvmerge) working")
+        cl_path, in_path = find_build_tools(cache)
+        if not cl_path:
+            return (f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not installed{Fore.WHITE}]{Style.RESET_ALL}",
+                    "Microsoft Visual C++ Build Tools not found")
+        if not in_path:
+            return (f"{Fore.WHITE}[{Fore.YELLOW}found but not in PATH{Fore.WHITE}]{Style.RESET_ALL}",
+                    "Microsoft Visual C++ Build Tools - found but not in PATH")
+        try:
+            result = subprocess.run(['cl'], capture_output=True, text=True, timeout=5)
+            version_info = result.stderr
+            if 'Microsoft' not in version_info:
+                return (f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not working{Fore.WHITE}]{Style.RESET_ALL}",
+                        "Microsoft Visual C++ Build Tools - cl.exe found but not working")
+            if any(v in version_info for v in ['19.', '18.', '17.', '16.', '15.', '14.']):
+                return (f"{Fore.WHITE}[{Fore.GREEN}working{Fore.WHITE}]{Style.RESET_ALL}",
+                        "Microsoft Visual C++ Build Tools working")
+            return (f"{Fore.WHITE}[{Fore.YELLOW}old version{Fore.WHITE}]{Style.RESET_ALL}",
+                    "Microsoft Visual C++ Build Tools - old version detected")
+        except Exception as e:
+            return (f"{Fore.WHITE}[{Fore.YELLOW}found but error{Fore.WHITE}]{Style.RESET_ALL}",
+                    f"Microsoft Visual C++ Build Tools - found but error: {e}")
     except Exception as e:
-        mkvmerge_status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not installed{Fore.WHITE}]{Style.RESET_ALL}"
-        log_requirements_event(f"MKVToolNix (mkvmerge) not installed: {e}")
+        return (f"{Fore.WHITE}[{Fore.LIGHTRED_EX}check failed{Fore.WHITE}]{Style.RESET_ALL}",
+                f"Microsoft Visual C++ Build Tools check failed: {e}")
+
+def check_requirements_status():
+    """Comprehensive check and installation of all required packages and tools.
     
-    status_lines.append(f"{Fore.YELLOW}MKVToolNix    {Style.RESET_ALL} : {mkvmerge_status}")
+    Tests all Python packages, external tools like ffmpeg and MKVToolNix, and Windows-specific
+    build tools in parallel. Checks that passed before are reused from the requirements cache
+    while the package version or tool binary is unchanged. Displays detailed status information
+    and logs all results to file for troubleshooting.
+    """
+    config, pause_seconds = get_config_and_pause_seconds()
+    cache = load_requirements_cache()
+    status_lines = []
+    log_requirements_event("--- REQUIREMENTS VERIFICATION START ---")
     
+    total = len(REQUIRED_MODULES) + 3
     utils.clear_and_print_ascii(BANNER_LINE)
-    print(f"{Fore.LIGHTYELLOW_EX}Testing Microsoft Visual C++ Build Tools... {Fore.LIGHTBLUE_EX}[{total}/{total}]{Style.RESET_ALL}")
-    
-    if os.name == 'nt':
-        try:
-            import shutil
-            cl_path = shutil.which('cl')
-            
-            if cl_path:
-                try:
-                    result = subprocess.run(['cl'], capture_output=True, text=True, timeout=5)
-                    version_info = result.stderr
-                    
-                    if 'Microsoft' in version_info:
-                        if any(v in version_info for v in ['19.', '18.', '17.', '16.', '15.', '14.']):
-                            msvc_status = f"{Fore.WHITE}[{Fore.GREEN}working{Fore.WHITE}]{Style.RESET_ALL}"
-                            log_requirements_event("Microsoft Visual C++ Build Tools working")
-                        else:
-                            msvc_status = f"{Fore.WHITE}[{Fore.YELLOW}old version{Fore.WHITE}]{Style.RESET_ALL}"
-                            log_requirements_event("Microsoft Visual C++ Build Tools - old version detected")
-                    else:
-                        msvc_status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not working{Fore.WHITE}]{Style.RESET_ALL}"
-                        log_requirements_event("Microsoft Visual C++ Build Tools - cl.exe found but not working")
-                except Exception as e:
-                    msvc_status = f"{Fore.WHITE}[{Fore.YELLOW}found but error{Fore.WHITE}]{Style.RESET_ALL}"
-                    log_requirements_event(f"Microsoft Visual C++ Build Tools - found but error: {e}")
+    print(f"{Fore.LIGHTYELLOW_EX}Subservient is currently testing all requirements and the internet connection... {Fore.LIGHTBLUE_EX}[{total} checks]{Style.RESET_ALL}")
+    with ThreadPoolExecutor(max_workers=total) as pool:
+        module_checks = [(display, pool.submit(check_module, mod, cache, pause_seconds)) for mod, display in REQUIRED_MODULES]
+        ffmpeg_check = pool.submit(check_tool, "ffmpeg", cache)
+        mkvmerge_check = pool.submit(check_tool, "mkvmerge", cache)
+        msvc_check = pool.submit(check_build_tools, cache)
+        
+        for display, future in module_checks:
+            installed, test_passed, test_msg = future.result()
+            if not installed:
+                status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not installed{Fore.WHITE}]{Style.RESET_ALL}"
+                log_requirements_event(f"{display:<13} : not installed | {test_msg}")
             else:
-                import glob
-                vs_patterns = [
-                    r"C:\Program Files\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                    r"C:\Program Files (x86)\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                    r"C:\Program Files\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                    r"C:\Program Files (x86)\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                    r"C:\Program Files (x86)\Microsoft Visual Studio\*\BuildTools\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                    r"C:\Program Files (x86)\Microsoft Visual Studio\*\BuildTools\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                    r"C:\Program Files (x86)\Microsoft Visual Studio 14.0\VC\bin\cl.exe",
-                    r"C:\Program Files (x86)\Microsoft Visual Studio\2017\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                    r"C:\Program Files (x86)\Microsoft Visual Studio\2017\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe"
-                ]
-                
-                found_cl = False
-                for pattern in vs_patterns:
-                    matches = glob.glob(pattern)
-                    if matches:
-                        found_cl = True
-                        break
-                
-                if found_cl:
-                    msvc_status = f"{Fore.WHITE}[{Fore.YELLOW}found but not in PATH{Fore.WHITE}]{Style.RESET_ALL}"
-                    log_requirements_event("Microsoft Visual C++ Build Tools - found but not in PATH")
-                else:
-                    msvc_status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not installed{Fore.WHITE}]{Style.RESET_ALL}"
-                    log_requirements_event("Microsoft Visual C++ Build Tools not found")
-        except Exception as e:
-            msvc_status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}check failed{Fore.WHITE}]{Style.RESET_ALL}"
-            log_requirements_event(f"Microsoft Visual C++ Build Tools check failed: {e}")
-    else:
-        msvc_status = f"{Fore.WHITE}[{Fore.CYAN}not needed (non-Windows){Fore.WHITE}]{Style.RESET_ALL}"
-        log_requirements_event("Microsoft Visual C++ Build Tools - not needed on non-Windows system")
-    
-    status_lines.append(f"{Fore.YELLOW}MSVC Build Tools{Style.RESET_ALL} : {msvc_status}")
+                log_requirements_event(f"{display:<13} : {'working' if test_passed else 'installed, but not working'} | {test_msg}")
+                status = f"{Fore.WHITE}[{Fore.GREEN}working{Fore.WHITE}]{Style.RESET_ALL}" if test_passed else f"{Fore.WHITE}[{Fore.YELLOW}installed, but not working{Fore.WHITE}]{Style.RESET_ALL}"
+            status_lines.append(f"{Fore.YELLOW}{display:<13}{Style.RESET_ALL} : {status}")
+        
+        ffmpeg_ok, ffmpeg_msg = ffmpeg_check.result()
+        if ffmpeg_ok:
+            ffmpeg_status = f"{Fore.WHITE}[{Fore.GREEN}working{Fore.WHITE}]{Style.RESET_ALL}"
+            log_requirements_event(f"ffmpeg {ffmpeg_msg}")
+        else:
+            ffmpeg_status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not installed{Fore.WHITE}]{Style.RESET_ALL}"
+            log_requirements_event(f"ffmpeg not installed: {ffmpeg_msg}")
+        status_lines.append(f"{Fore.YELLOW}ffmpeg       {Style.RESET_ALL} : {ffmpeg_status}")
+        
+        mkvmerge_ok, mkvmerge_msg = mkvmerge_check.result()
+        if mkvmerge_ok:
+            mkvmerge_status = f"{Fore.WHITE}[{Fore.GREEN}working{Fore.WHITE}]{Style.RESET_ALL}"
+            log_requirements_event(f"MKVToolNix (mkvmerge) {mkvmerge_msg}")
+        else:
+            mkvmerge_status = f"{Fore.WHITE}[{Fore.LIGHTRED_EX}not installed{Fore.WHITE}]{Style.RESET_ALL}"
+            log_requirements_event(f"MKVToolNix (mkvmerge) not installed: {mkvmerge_msg}")
+        status_lines.append(f"{Fore.YELLOW}MKVToolNix    {Style.RESET_ALL} : {mkvmerge_status}")
+        
+        msvc_status, msvc_msg = msvc_check.result()
+        log_requirements_event(msvc_msg)
+        status_lines.append(f"{Fore.YELLOW}MSVC Build Tools{Style.RESET_ALL} : {msvc_status}")
+    save_requirements_cache(cache)
     
     utils.clear_and_print_ascii(BANNER_LINE)
     print(f"{Style.BRIGHT}{Fore.CYAN}Subservient Requirements Status{Style.RESET_ALL}\n")
@@ -1021,9 +1101,6 @@ def quick_requirements_check():
     
     Returns True if all essential tools are available, False otherwise.
     """
-    import shutil
-    import glob
-    
     essential_tools = {
         'ffmpeg': 'ffmpeg',
         'mkvmerge': 'MKVToolNix',
@@ -1040,27 +1117,15 @@ def quick_requirements_check():
             tool_status.append(f"{Fore.GREEN}{display_name} found!{Style.RESET_ALL}")
     
     if os.name == 'nt':
-        cl_path = shutil.which('cl')
-        if cl_path:
+        cache = load_requirements_cache()
+        cl_path, in_path = find_build_tools(cache)
+        save_requirements_cache(cache)
+        if in_path:
             tool_status.append(f"{Fore.GREEN}Microsoft Visual C++ Build Tools found!{Style.RESET_ALL}")
+        elif cl_path:
+            tool_status.append(f"{Fore.GREEN}Microsoft Visual C++ Build Tools found!{Style.RESET_ALL} {Fore.WHITE}(not in PATH){Style.RESET_ALL}")
         else:
-            vs_patterns = [
-                r"C:\Program Files\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                r"C:\Program Files\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\*\BuildTools\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\*\BuildTools\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio 14.0\VC\bin\cl.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\2017\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                r"C:\Program Files (x86)\Microsoft Visual Studio\2017\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe"
-            ]
-            found_cl = any(glob.glob(pattern) for pattern in vs_patterns)
-            
-            if found_cl:
-                tool_status.append(f"{Fore.GREEN}Microsoft Visual C++ Build Tools found!{Style.RESET_ALL} {Fore.WHITE}(not in PATH){Style.RESET_ALL}")
-            else:
-                missing_tools.append("Microsoft Visual C++ Build Tools")
+            missing_tools.append("Microsoft Visual C++ Build Tools")
     
     if tool_status:
         print(f"{Fore.LIGHTYELLOW_EX}Checking for external tools...{Style.RESET_ALL}")
@@ -1077,12 +1142,95 @@ def quick_requirements_check():
         print(f"{Fore.WHITE}For detailed installation instructions, please see the README file.{Style.RESET_ALL}")
         print(f"{Fore.WHITE}Look for section: {Fore.CYAN}'1. Installing and Configuring Subservient', step 4{Style.RESET_ALL}")
         print(f"{Fore.WHITE}You can open the README from the main menu (option 6) or simply double click the readme in the main folder.{Style.RESET_ALL}")
-        input(f"\n{Fore.YELLOW}Press Enter to exit Subservient...{Style.RESET_ALL} ")
+        if not import_decisions().headless():
+            input(f"\n{Fore.YELLOW}Press Enter to exit Subservient...{Style.RESET_ALL} ")
         sys.exit(1)
         return False
     
     return True
 
+def launch_pipeline(pause_seconds):
+    """Run all phases in this process, starting with extraction; returns only when extraction.py cannot be found."""
+    config_dir = Path(user_config_dir()) / "Subservient"
+    pathfile = config_dir / "Subservient_pathfiles"
+    extraction_path = None
+    if pathfile.exists():
+        lines = pathfile.read_text(encoding="utf-8").splitlines()
+        for l in lines:
+            if l.startswith("extraction_path="):
+                extraction_path = l.split("=", 1)[1].strip()
+                break
+    if extraction_path and Path(extraction_path).exists():
+        utils.clear_and_print_ascii(BANNER_LINE)
+        print(f"{Style.BRIGHT}{Fore.GREEN}[PRE-FLIGHT CHECK PASSED]{Style.RESET_ALL}")
+        print(f"{Style.BRIGHT}{Fore.BLUE}[Subordinate]{Style.RESET_ALL} Launching extraction.py at: {Fore.YELLOW}{extraction_path}{Style.RESET_ALL}")
+        print(f"\n{Style.BRIGHT}{Fore.GREEN}Extraction will start in {int(pause_seconds)} seconds...{Style.RESET_ALL}")
+        time.sleep(pause_seconds)
+        script_dir = str(Path(extraction_path).parent)
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        sys.modules.setdefault("utils", utils)
+        import pipeline
+        sys.exit(pipeline.run())
+    else:
+        print(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Could not find extraction.py path in the universal pathfile or the file does not exist.")
+
+def import_decisions():
+    """Import the decision queue from the main Subservient folder, next to utils.py."""
+    sys.modules.setdefault("utils", utils)
+    import decisions
+    return decisions
+
+def run_headless():
+    """Start a run without menus or questions; every question the phases meet is deferred to the review queue."""
+    decisions = import_decisions()
+    os.environ[decisions.ENV_VAR] = "true"
+    if quick_requirements_check():
+        launch_pipeline(0)
+
+def review_deferred_decisions():
+    """Go through the questions headless runs deferred, one at a time.
+    
+    Answers are kept in the review queue and applied the next time a run reaches the same video,
+    so a question can be answered here without Subservient running.
+    """
+    decisions = import_decisions()
+    pending = decisions.pending()
+    utils.clear_and_print_ascii(BANNER_LINE)
+    if not pending:
+        print(f"{Fore.GREEN}No deferred decisions are waiting for review.{Style.RESET_ALL}")
+        input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL} ")
+        return
+    answered = 0
+    for idx, decision in enumerate(pending, 1):
+        utils.clear_and_print_ascii(BANNER_LINE)
+        language = f" {Fore.YELLOW}[{decision['language'].upper()}]{Style.RESET_ALL}" if decision['language'] else ""
+        print(f"{Style.BRIGHT}{Fore.CYAN}Deferred decision [{idx}/{len(pending)}]{Style.RESET_ALL}{language}  {Style.DIM}{decision['phase']}, {decision['created']}{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}File: {Fore.CYAN}{decision['video']}{Style.RESET_ALL}\n")
+        print(f"{Fore.LIGHTYELLOW_EX}{decision['question']}{Style.RESET_ALL}")
+        for key, description in decision['choices'].items():
+            default = f" {Fore.LIGHTBLACK_EX}(used by the headless run){Style.RESET_ALL}" if key == decision['default'] else ""
+            print(f"  {Fore.GREEN}{key}{Style.RESET_ALL} = {description}{default}")
+        print(f"  {Fore.YELLOW}S{Style.RESET_ALL} = Leave it for later")
+        print(f"  {Fore.RED}Q{Style.RESET_ALL} = Stop reviewing\n")
+        while True:
+            choice = input(f"{Fore.LIGHTYELLOW_EX}Make a choice:{Style.RESET_ALL} ").strip().upper()
+            if choice in decision['choices']:
+                decisions.answer(decision['id'], choice)
+                answered += 1
+                break
+            elif choice in ("S", "Q"):
+                break
+            print(f"{Fore.RED}Invalid choice. Try again.{Style.RESET_ALL}")
+        if choice == "Q":
+            break
+    utils.clear_and_print_ascii(BANNER_LINE)
+    print(f"{Fore.GREEN}{answered} decision(s) answered.{Style.RESET_ALL} They are applied the next time Subservient reaches these videos.")
+    remaining = len(decisions.pending())
+    if remaining:
+        print(f"{Fore.YELLOW}{remaining} decision(s) are still waiting for review.{Style.RESET_ALL}")
+    input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL} ")
+
 def print_full_main_menu():
     """Display complete main menu with all available options."""
     """Display the banner and full main menu with location information."""
@@ -1110,27 +1258,7 @@ def main():
                     if not quick_requirements_check():
                         print_full_main_menu()
                         continue
-                    
-                    from platformdirs import user_config_dir
-                    config_dir = Path(user_config_dir()) / "Subservient"
-                    pathfile = config_dir / "Subservient_pathfiles"
-                    extraction_path = None
-                    if pathfile.exists():
-                        lines = pathfile.read_text(encoding="utf-8").splitlines()
-                        for l in lines:
-                            if l.startswith("extraction_path="):
-                                extraction_path = l.split("=", 1)[1].strip()
-                                break
-                    if extraction_path and Path(extraction_path).exists():
-                        utils.clear_and_print_ascii(BANNER_LINE)
-                        print(f"{Style.BRIGHT}{Fore.GREEN}[PRE-FLIGHT CHECK PASSED]{Style.RESET_ALL}")
-                        print(f"{Style.BRIGHT}{Fore.BLUE}[Subordinate]{Style.RESET_ALL} Launching extraction.py at: {Fore.YELLOW}{extraction_path}{Style.RESET_ALL}")
-                        print(f"\n{Style.BRIGHT}{Fore.GREEN}Extraction will start in {int(pause_seconds)} seconds...{Style.RESET_ALL}")
-                        time.sleep(pause_seconds)
-                        subprocess.run([sys.executable, extraction_path])
-                        sys.exit(0)
-                    else:
-                        print(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Could not find extraction.py path in the universal pathfile or the file does not exist.")
+                    launch_pipeline(pause_seconds)
                     return
                 elif start_choice == "2":
                     print(f"{Style.BRIGHT}{Fore.BLUE}[Subservient]{Style.RESET_ALL} Exiting. Please complete your setup and try again.")
@@ -1179,26 +1307,14 @@ def main():
                 print(f"{Fore.WHITE}You can also use option '7' from the main menu to open the README directly.{Style.RESET_ALL}")
             
             if os.name == 'nt':
-                import glob
-                cl_path = shutil.which('cl')
+                cache = load_requirements_cache()
+                cl_path, in_path = find_build_tools(cache)
+                save_requirements_cache(cache)
                 
-                if cl_path:
+                if in_path:
                     print(f"{Fore.GREEN}Microsoft Visual C++ Build Tools found!{Style.RESET_ALL}")
                 else:
-                    vs_patterns = [
-                        r"C:\Program Files\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                        r"C:\Program Files (x86)\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                        r"C:\Program Files\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                        r"C:\Program Files (x86)\Microsoft Visual Studio\*\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                        r"C:\Program Files (x86)\Microsoft Visual Studio\*\BuildTools\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                        r"C:\Program Files (x86)\Microsoft Visual Studio\*\BuildTools\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe",
-                        r"C:\Program Files (x86)\Microsoft Visual Studio 14.0\VC\bin\cl.exe",
-                        r"C:\Program Files (x86)\Microsoft Visual Studio\2017\*\VC\Tools\MSVC\*\bin\Hostx64\x64\cl.exe",
-                        r"C:\Program Files (x86)\Microsoft Visual Studio\2017\*\VC\Tools\MSVC\*\bin\Hostx86\x86\cl.exe"
-                    ]
-                    found_cl = any(glob.glob(pattern) for pattern in vs_patterns)
-                    
-                    if found_cl:
+                    if cl_path:
                         print(f"{Fore.GREEN}Microsoft Visual C++ Build Tools found!{Style.RESET_ALL} {Fore.WHITE}(not in PATH){Style.RESET_ALL}")
                     else:
                         print(f"\n{Fore.LIGHTRED_EX}Microsoft Visual C++ Build Tools are not installed.{Style.RESET_ALL}")
@@ -1248,6 +1364,10 @@ def main():
             print_full_main_menu()
             continue
         elif choice == "8":
+            review_deferred_decisions()
+            print_full_main_menu()
+            continue
+        elif choice == "9":
             print(f"{Style.BRIGHT}{Fore.BLUE}[Subservient]{Style.RESET_ALL} Exiting.")
             return
 
@@ -1308,4 +1428,9 @@ write_anchor_to_pathfile()
 write_subordinate_path_to_pathfile()
 
 if __name__ == "__main__":
-    main()
+    if "--review" in sys.argv:
+        review_deferred_decisions()
+    elif "--headless" in sys.argv:
+        run_headless()
+    else:
+        main()
@@ -14,29 +14,7 @@ def is_running_in_docker():
 def calculate_subtitle_offset(original_path, synchronized_path):
     """Calculate time offset between original and synchronized subtitle files."""
     try:
-        def parse_srt_first_timestamp(file_path):
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            for line in lines:
-                if '-->' in line:
-                    start_time = line.split('-->')[0].strip()
-                    time_parts = start_time.split(':')
-                    if len(time_parts) == 3:
-                        hours = int(time_parts[0])
-                        minutes = int(time_parts[1])
-                        seconds_ms = time_parts[2].split(',')
-                        seconds = int(seconds_ms[0])
-                        milliseconds = int(seconds_ms[1]) if len(seconds_ms) > 1 else 0
-                        total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
-                        return total_seconds
-            return 0.0
-        if not os.path.exists(original_path) or not os.path.exists(synchronized_path):
-            return 0.0
-        
-        original_time = parse_srt_first_timestamp(original_path)
-        synchronized_time = parse_srt_first_timestamp(synchronized_path)
-        offset = abs(original_time - synchronized_time)
-        return offset
+        return get_subtitle_offset(original_path, synchronized_path)
     except Exception as e:
         print_and_log(f"{sync_tag()} {Fore.YELLOW}Warning: Could not calculate subtitle offset: {str(e)}{Style.RESET_ALL}", log_only=True)
         return 0.0
@@ -57,7 +35,7 @@ def synchronize_subtitle_with_ffsubsync(video_path, subtitle_path, output_path):
             '-o', output_path,
         ]
         try:
-            result = subprocess.run(cmd, timeout=600)
+            result = metrics.run(cmd, timeout=600)
             if result.returncode == 0 and os.path.exists(output_path):
                 offset_seconds = calculate_subtitle_offset(subtitle_path, output_path)
                 print_and_log(f"{sync_tag()} {Fore.GREEN}Synchronization successful! Offset: {offset_seconds:.3f}s{Style.RESET_ALL}")
@@ -111,73 +89,67 @@ from platformdirs import user_config_dir
 from pathlib import Path
 from utils import (ASCII_ART, clear_and_print_ascii, map_lang_3to2, 
                    trim_movie_name, scan_subtitle_coverage, display_coverage_results, 
-                   get_skip_dirs_from_config)
-
-init(autoreset=True)
+                   get_skip_dirs_from_config, get_config, get_subtitle_offset, walk_library)
+import pipeline
+import runlog
+import metrics
+import profiling
+import decisions
 
 BANNER_LINE = f"                   {Style.BRIGHT}{Fore.RED}[Phase 4/4]{Style.RESET_ALL} Subtitle Synchronisation"
 script_dir = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(script_dir, '.config')
-ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m|\033\[[0-9;]*m')
 
-run_counter = 1
-if os.path.exists(CONFIG_PATH):
-    with open(CONFIG_PATH, encoding='utf-8') as f:
-        run_counter = next((int(line.split('=', 1)[1].strip()) for line in f 
-                           if line.strip().lower().startswith('run_counter') and '=' in line), 1)
+def open_run_log():
+    """Open this run's synchronisation log and start collecting metrics into the same logs folder."""
+    global RUN_LOG
+    run_counter = int(get_config(CONFIG_PATH).get('run_counter', 1))
 
-LOGS_DIR = os.path.join(script_dir, 'logs', f'Subservient-run-{run_counter}')
-os.makedirs(LOGS_DIR, exist_ok=True)
+    LOGS_DIR = os.path.join(script_dir, 'logs', f'Subservient-run-{run_counter}')
+    os.makedirs(LOGS_DIR, exist_ok=True)
 
-existing_log = next((os.path.join(LOGS_DIR, f) for f in os.listdir(LOGS_DIR) 
-                    if f.startswith('synchronisation_log') and f.endswith('.txt')), None)
-
-if existing_log:
-    LOG_FILE = existing_log
-    with open(LOG_FILE, 'r+', encoding='utf-8') as f:
-        content = f.read()
-        part_count = content.count('Synchronisation - part') + 1
-        f.seek(0, 2)
-        if f.tell() > 0:
-            f.write('\n')
-        f.write(f'Synchronisation - part {part_count}\n')
-else:
-    log_time = datetime.datetime.now().strftime('%d-%m-%Y_%H.%M.%S')
-    LOG_FILE = os.path.join(LOGS_DIR, f"synchronisation_log_{log_time}.txt")
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        f.write('Synchronisation - part 1\n')
+    RUN_LOG = runlog.open_phase_log(LOGS_DIR, "synchronisation", structured=get_config(CONFIG_PATH).get_bool('json_log'))
+    metrics.configure(LOGS_DIR, get_config(CONFIG_PATH).get('prometheus_textfile_dir', ''))
+    RUN_LOG.write(ASCII_ART + '\n')
+    RUN_LOG.write(BANNER_LINE + '\n\n')
 
 def read_config_as_dict(config_path):
     """Read config file and return key-value pairs as dictionary."""
-    if not os.path.exists(config_path):
-        return {}
-    with open(config_path, encoding='utf-8') as f:
-        return {m.group(1).strip().lower(): m.group(2).strip() 
-                for line in f if (m := re.match(r'^([a-zA-Z0-9_]+)\s*=\s*(.+)$', line.strip()))}
-
-def strip_ansi(text):
-    """Remove ANSI color codes from text."""
-    return ANSI_ESCAPE.sub('', text)
+    return dict(get_config(config_path).settings)
 
 def sync_tag():
     """Return formatted synchronisation tag for console output."""
     return f"{Style.BRIGHT}{Fore.BLUE}[Synchronisation]{Style.RESET_ALL}"
 
-def print_and_log(msg, end='\n', log_only=False):
+def print_and_log(msg, end='\n', log_only=False, **fields):
     """Print message to console and write to log file."""
     if not log_only:
         print(msg, end=end)
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        f.write(strip_ansi(msg) + ('' if end == '' else end))
+    RUN_LOG.event(msg, end=end, **fields)
 
 def input_and_log(prompt):
-    """Get user input and log it to file."""
+    """Get user input and log it to file; in headless mode nothing is asked and the answer is empty."""
     print_and_log(prompt, end='')
+    if decisions.headless():
+        print_and_log('')
+        return ''
     answer = input('')
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        f.write(f'[USER INPUT] {strip_ansi(answer)}\n')
+    RUN_LOG.user_input(answer)
     return answer
 
+def ask_or_defer(kind, video, question, choices, default, language=''):
+    """Return the answer given to a question in the review queue, or in headless mode defer the question and return its default.
+    
+    Returns None when the question has to be asked now.
+    """
+    choice = decisions.take_answer(kind, video, language)
+    if choice is not None:
+        print_and_log(f"{sync_tag()} {Fore.CYAN}Answer from the review queue:{Style.RESET_ALL} {choices.get(choice, choice)}", kind='decision')
+    elif decisions.headless():
+        choice = decisions.defer("synchronisation", kind, video, question, choices, default, language)
+        print_and_log(f"{sync_tag()} {Fore.YELLOW}Deferred to the review queue:{Style.RESET_ALL} {question} Using: {choices[default]}", kind='decision')
+    return choice
+
 def ensure_initial_setup():
     """Check if Subservient initial setup is complete."""
     config_dir = Path(user_config_dir()) / "Subservient"
@@ -199,39 +171,46 @@ def show_setup_error():
                 f"{Fore.CYAN}3.{Style.RESET_ALL} After setup, move subordinate.py to process movies\n\n"
                 f"{Fore.YELLOW}See README for more details.{Style.RESET_ALL}\n")
     print_and_log(error_msg)
-    input("Press Enter to exit...")
+    if not decisions.headless():
+        input("Press Enter to exit...")
     sys.exit(1)
 
-with open(LOG_FILE, 'a+', encoding='utf-8') as f:
-    f.write(strip_ansi(ASCII_ART) + '\n')
-    f.write(strip_ansi(BANNER_LINE) + '\n\n')
-clear_and_print_ascii(BANNER_LINE)
-ensure_initial_setup()
-
-pathfile = os.path.join(user_config_dir(), "Subservient", "Subservient_pathfiles")
-anchor_path = script_dir
-
-if os.path.exists(pathfile):
-    with open(pathfile, "r", encoding="utf-8") as f:
-        anchor_path = next((line.strip().split("=", 1)[1] for line in f 
-                           if line.startswith("subservient_anchor=")), anchor_path)
-
-os.chdir(anchor_path)
-
-skip_dirs = get_skip_dirs_from_config()
-videos = []
-for root, dirs, files in os.walk(anchor_path):
-    dirs[:] = [d for d in dirs if d.lower() not in skip_dirs]
-    if any(f.endswith((".mkv", ".mp4")) for f in files):
-        videos.extend(os.path.join(root, f) for f in files if f.endswith((".mkv", ".mp4")))
-        dirs[:] = []
-
-config_values = read_config_as_dict(CONFIG_PATH)
-pause_seconds = int(float(config_values.get('pause_seconds', 3)))
-ACCEPT_OFFSET_THRESHOLD = float(config_values.get('accept_offset_threshold', 0.05))
-REJECT_OFFSET_THRESHOLD = float(config_values.get('reject_offset_threshold', 2.5))
-PRESERVE_FORCED_SUBTITLES = config_values.get('preserve_forced_subtitles', 'false').lower() in ('true', '1', 'yes', 'on')
-PRESERVE_UNWANTED_SUBTITLES = config_values.get('preserve_unwanted_subtitles', 'false').lower() in ('true', '1', 'yes', 'on')
+def load_library():
+    """Change to the anchor folder and list the videos of the library, or take the ones extraction found."""
+    global anchor_path, skip_dirs, videos
+    pathfile = os.path.join(user_config_dir(), "Subservient", "Subservient_pathfiles")
+    anchor_path = script_dir
+
+    if os.path.exists(pathfile):
+        with open(pathfile, "r", encoding="utf-8") as f:
+            anchor_path = next((line.strip().split("=", 1)[1] for line in f 
+                               if line.startswith("subservient_anchor=")), anchor_path)
+
+    os.chdir(anchor_path)
+
+    skip_dirs = get_skip_dirs_from_config()
+    videos = pipeline.library_videos()
+    if videos is None:
+        videos = []
+        for root, dirs, files in walk_library(anchor_path):
+            dirs[:] = [d for d in dirs if d.lower() not in skip_dirs]
+            if any(f.endswith((".mkv", ".mp4")) for f in files):
+                videos.extend(os.path.join(root, f) for f in files if f.endswith((".mkv", ".mp4")))
+                dirs[:] = []
+
+def read_settings():
+    """Read the offsets, languages and other settings synchronisation uses from .config."""
+    global ACCEPT_OFFSET_THRESHOLD, LANGUAGES, PRESERVE_UNWANTED_SUBTITLES, REJECT_OFFSET_THRESHOLD
+    global PRESERVE_FORCED_SUBTITLES, SERIES_MODE, pause_seconds
+    config_values = read_config_as_dict(CONFIG_PATH)
+    pause_seconds = int(float(config_values.get('pause_seconds', 3)))
+    ACCEPT_OFFSET_THRESHOLD = float(config_values.get('accept_offset_threshold', 0.05))
+    REJECT_OFFSET_THRESHOLD = float(config_values.get('reject_offset_threshold', 2.5))
+    PRESERVE_FORCED_SUBTITLES = config_values.get('preserve_forced_subtitles', 'false').lower() in ('true', '1', 'yes', 'on')
+    PRESERVE_UNWANTED_SUBTITLES = config_values.get('preserve_unwanted_subtitles', 'false').lower() in ('true', '1', 'yes', 'on')
+    LANGUAGES = read_languages_from_config(CONFIG_PATH)
+    SERIES_MODE = read_series_mode_from_config(CONFIG_PATH)
+
 drift_marked = False
 
 def read_languages_from_config(config_path):
@@ -240,15 +219,9 @@ def read_languages_from_config(config_path):
         print_and_log(f"{sync_tag()} {Fore.RED}Config file not found. Defaulting to English.{Style.RESET_ALL}")
         return handle_language_default_warning()
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip().lower().startswith('languages'):
-                parts = line.split('=', 1)
-                if len(parts) == 2:
-                    langs = [l.strip() for l in parts[1].split(',') if l.strip()]
-                    if langs:
-                        return langs
-                break
+    langs = [l.strip() for l in get_config(config_path).get('languages', '').split(',') if l.strip()]
+    if langs:
+        return langs
     
     print_and_log(f"{sync_tag()} {Fore.RED}{Style.BRIGHT}No valid languages found in config!{Style.RESET_ALL}")
     print_and_log(f"{sync_tag()} {Fore.YELLOW}Defaulting to English.{Style.RESET_ALL}")
@@ -262,7 +235,7 @@ def handle_language_default_warning():
         print_and_log(f"\n{Fore.CYAN}1{Style.RESET_ALL} = Continue with English only")
         print_and_log(f"{Fore.RED}2{Style.RESET_ALL} = Exit and fix config file")
         
-        choice = input(f"Make a choice [{Fore.CYAN}1{Style.RESET_ALL}/{Fore.RED}2{Style.RESET_ALL}]: ").strip()
+        choice = "1" if decisions.headless() else input(f"Make a choice [{Fore.CYAN}1{Style.RESET_ALL}/{Fore.RED}2{Style.RESET_ALL}]: ").strip()
         if choice == "1":
             print_and_log(f"{Fore.YELLOW}Continuing with English only.{Style.RESET_ALL}\n")
             return ['en']
@@ -278,20 +251,16 @@ def read_series_mode_from_config(config_path):
         print_and_log(f"{sync_tag()} {Fore.YELLOW}Config file not found. Defaulting to film mode.{Style.RESET_ALL}")
         return False
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip().lower().startswith('series_mode'):
-                parts = line.split('=', 1)
-                if len(parts) == 2:
-                    val = parts[1].strip().lower()
-                    return val in ['1', 'true', 'yes', 'on']
+    series_mode = get_config(config_path).get('series_mode')
+    if series_mode is not None:
+        return series_mode.lower() in ['1', 'true', 'yes', 'on']
     
     print_and_log(f"{sync_tag()} {Fore.YELLOW}series_mode not found in config. Defaulting to film mode.{Style.RESET_ALL}")
     return False
 
 def run_ffmpeg_with_progress(cmd, output_path, orig_size):
     """Run ffmpeg command with progress bar based on output file size."""
-    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    process = metrics.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
     stop_flag = threading.Event()
     
     def show_progress():
@@ -314,11 +283,8 @@ def run_ffmpeg_with_progress(cmd, output_path, orig_size):
     t.join()
     return stdout, stderr
 
-clear_and_print_ascii(BANNER_LINE)
 successful_syncs = 0
 successful_syncs_per_lang = {}
-LANGUAGES = read_languages_from_config(CONFIG_PATH)
-SERIES_MODE = read_series_mode_from_config(CONFIG_PATH)
 
 def extract_sxxexx(filename):
     """Extract season/episode code (SxxExx) from filename."""
@@ -326,27 +292,26 @@ def extract_sxxexx(filename):
     return match.group(1).upper() if match else None
 
 sxxexx_to_video = {}
-if SERIES_MODE:
-    for video in videos:
-        if code := extract_sxxexx(os.path.basename(video)):
-            sxxexx_to_video[code] = video
-
-FAILED_SUBS = set()
-FAILED_DETAILS = {}
-for f in os.listdir():
-    if f.endswith('.FAILED.srt'):
-        for pattern in [r"(?P<basename>.+)\.(?P<lang>[a-z]{2})\.number\d+\.FAILED\.srt$",
-                       r"(?P<basename>.+)\.(?P<lang>[a-z]{2})\.FAILED\.srt$"]:
-            if m := re.match(pattern, f):
-                base, lang = m.group('basename'), m.group('lang')
-                FAILED_SUBS.add((base, lang))
-                FAILED_DETAILS[(base, lang)] = f
-                break
 
-if FAILED_SUBS:
-    print_and_log(f"{sync_tag()} {Fore.RED}{Style.BRIGHT}Detected subtitles marked as FAILED (will be skipped):{Style.RESET_ALL}")
-    for (base, lang) in sorted(FAILED_SUBS):
-        print_and_log(f"    {Fore.LIGHTRED_EX}* {base} [{lang.upper()}] ({FAILED_DETAILS[(base, lang)]}){Style.RESET_ALL}")
+def find_failed_subtitles():
+    """Collect the subtitles marked as FAILED in the anchor folder, which synchronisation skips."""
+    FAILED_SUBS = set()
+    FAILED_DETAILS = {}
+    for f in os.listdir():
+        if f.endswith('.FAILED.srt'):
+            for pattern in [r"(?P<basename>.+)\.(?P<lang>[a-z]{2})\.number\d+\.FAILED\.srt$",
+                           r"(?P<basename>.+)\.(?P<lang>[a-z]{2})\.FAILED\.srt$"]:
+                if m := re.match(pattern, f):
+                    base, lang = m.group('basename'), m.group('lang')
+                    FAILED_SUBS.add((base, lang))
+                    FAILED_DETAILS[(base, lang)] = f
+                    break
+
+    if FAILED_SUBS:
+        print_and_log(f"{sync_tag()} {Fore.RED}{Style.BRIGHT}Detected subtitles marked as FAILED (will be skipped):{Style.RESET_ALL}")
+        for (base, lang) in sorted(FAILED_SUBS):
+            print_and_log(f"    {Fore.LIGHTRED_EX}* {base} [{lang.upper()}] ({FAILED_DETAILS[(base, lang)]}){Style.RESET_ALL}")
+
 def print_video_header(video_name, idx, total):
     """Print formatted header for current video being processed."""
     bar = f"{Fore.CYAN}[{idx}/{total}]{Style.RESET_ALL}  {Fore.LIGHTYELLOW_EX}{os.path.basename(video_name).upper()}{Style.RESET_ALL}"
@@ -384,7 +349,7 @@ def final_cleanup_prompt_and_cleanup():
     all_dirs = []
     all_dirs.append(anchor_path)
     
-    for root, dirs, files in os.walk(anchor_path):
+    for root, dirs, files in walk_library(anchor_path):
         dirs[:] = [d for d in dirs if d.lower() not in skip_dirs]
         for d in dirs:
             dir_path = os.path.join(root, d)
@@ -407,7 +372,7 @@ def final_cleanup_prompt_and_cleanup():
     processed_dirs += 1
     update_progress()
     
-    for root, dirs, files in os.walk(anchor_path):
+    for root, dirs, files in walk_library(anchor_path):
         dirs[:] = [d for d in dirs if d.lower() not in skip_dirs]
         for d in dirs:
             time.sleep(0.25) 
@@ -426,7 +391,7 @@ def has_internal_subs(video_path):
     """Check if video file contains internal subtitle streams."""
     cmd = ["ffprobe", "-v", "error", "-select_streams", "s",
            "-show_entries", "stream=index", "-of", "csv=p=0", video_path]
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    result = metrics.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     return bool(result.stdout.strip())
 
 def remove_internal_subs(video_path):
@@ -435,7 +400,7 @@ def remove_internal_subs(video_path):
     cmd = ["ffmpeg", "-hide_banner", "-y", "-i", video_path,
            "-map", "0:v", "-map", "0:a", "-c", "copy", "-sn", temp_path]
     
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    result = metrics.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     if result.returncode == 0 and os.path.exists(temp_path):
         os.replace(temp_path, video_path)
         return True
@@ -496,7 +461,7 @@ def prompt_and_cleanup_internal_subs():
                     "-of", "csv=p=0", video
                 ]
                 try:
-                    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8')
+                    result = metrics.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8')
                     lines = [l for l in result.stdout.strip().split('\n') if l.strip()]
                 except Exception:
                     lines = []
@@ -549,9 +514,17 @@ def prompt_and_cleanup_internal_subs():
                     print_and_log(f"{Fore.CYAN}2{Style.RESET_ALL} = Remove internal subtitles only for languages with external subtitles present {Fore.LIGHTYELLOW_EX}(recommended){Style.RESET_ALL}")
                     print_and_log(f"{Fore.YELLOW}3{Style.RESET_ALL} = Remove all internal subtitles completely {Fore.LIGHTYELLOW_EX}(Will cause missing subtitles, not recommended){Style.RESET_ALL}\n")
                     valid_choices = ['1', '2', '3', '']
+                if all_present and not duplicates:
+                    choices = {'1': 'Keep internal subtitles', '2': 'Remove all internal subtitles'}
+                else:
+                    choices = {'1': 'Keep internal subtitles', '2': 'Remove internal subtitles only for languages with external subtitles',
+                               '3': 'Remove all internal subtitles'}
+                decided = ask_or_defer('internal_subtitles', video, f"What to do with the internal subtitles of {os.path.basename(video)}?", choices, '1')
+                if decided not in valid_choices:
+                    decided = None
                 while True:
                     if all_present and not duplicates:
-                        choice = input_and_log(f"Make a choice [{Fore.CYAN}1{Style.RESET_ALL}/{Fore.YELLOW}2{Style.RESET_ALL}]: ").strip()
+                        choice = decided or input_and_log(f"Make a choice [{Fore.CYAN}1{Style.RESET_ALL}/{Fore.YELLOW}2{Style.RESET_ALL}]: ").strip()
                         if choice == "1" or choice == "":
                             print_and_log(f"{Fore.GREEN}Internal subtitles kept for this video.{Style.RESET_ALL}\n")
                             not_cleaned_internal_subs += 1
@@ -584,7 +557,7 @@ def prompt_and_cleanup_internal_subs():
                         else:
                             print_and_log(f"{Fore.RED}Invalid choice. Please enter 1 or 2.{Style.RESET_ALL}")
                     else:
-                        choice = input_and_log(f"Make a choice [{Fore.CYAN}1{Style.RESET_ALL}/{Fore.CYAN}2{Style.RESET_ALL}/{Fore.YELLOW}3{Style.RESET_ALL}]: ").strip()
+                        choice = decided or input_and_log(f"Make a choice [{Fore.CYAN}1{Style.RESET_ALL}/{Fore.CYAN}2{Style.RESET_ALL}/{Fore.YELLOW}3{Style.RESET_ALL}]: ").strip()
                         if choice == "1" or choice == "":
                             print_and_log(f"{Fore.GREEN}Internal subtitles kept for this video.{Style.RESET_ALL}\n")
                             not_cleaned_internal_subs += 1
@@ -597,7 +570,7 @@ def prompt_and_cleanup_internal_subs():
                                 "ffprobe", "-v", "error", "-select_streams", "s", "-show_entries",
                                 "stream=index:stream_tags=language", "-of", "csv=p=0", video
                             ]
-                            result = subprocess.run(probe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8')
+                            result = metrics.run(probe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8')
                             probe_lines = [l for l in result.stdout.strip().split('\n') if l.strip()]
                             subtitle_streams = []
                             ffmpeg_sub_idx = 0
@@ -914,165 +887,184 @@ def cleanup_drift_and_failed(video_dir, lang, keep_file=None, clean_drifts=True)
                 print_and_log(f"{sync_tag()} {Fore.YELLOW}Cleanup: removed DRIFT: {f}{Style.RESET_ALL}")
             except Exception as e:
                 print_and_log(f"{sync_tag()} {Fore.RED}Could not remove {f}: {e}{Style.RESET_ALL}")
-processed_subs = set()
-total_videos = len(videos)
-acquisition_needed = False  
-
-for idx, video in enumerate(videos, 1):
-    clear_and_print_ascii(BANNER_LINE)
-    print_video_header(video, idx, total_videos)
-    video_dir = os.path.dirname(video)
-    video_basename, _ = os.path.splitext(video)
-    
-    all_subs_exist = True
-    for lang in LANGUAGES:
-        expected = f"{video_basename}.{lang}.srt"
-        if not os.path.exists(expected):
-            all_subs_exist = False
-            break
-    
-    if all_subs_exist:
-        print_and_log(f"{sync_tag()} {Fore.GREEN}All required subtitles already exist for this video - skipping{Style.RESET_ALL}")
-        continue
-    
-    candidate_subs = defaultdict(list)
-    for f in os.listdir(video_dir):
-        f_path = os.path.join(video_dir, f)
-        match = re.match(r".*\.(?P<lang>[a-z]{2})\.number\d+\.srt$", f)
-        if match:
-            lang = match.group("lang")
-            if lang in LANGUAGES:
-                candidate_subs[lang].append(f_path)
-    
-    for lang in LANGUAGES:
-        subs = candidate_subs.get(lang, [])
-        found_good = False
-        drift_subs = []  
-        
-        subs_sorted = sorted(subs, key=lambda x: int(re.search(r"number(\d+)", x).group(1)))
-        logged_video_context = False
-        
-        for sub in subs_sorted:
-            if sub.endswith('.DRIFT.srt') or sub.endswith('.FAILED.srt'):
-                continue
-                
-            ext = os.path.splitext(sub)[1].lower()
-            output_ext = f".{lang}{ext}"
-            output_sub = video_basename + output_ext
-            
-            if os.path.exists(output_sub):
-                found_good = True
-                break
-            
-            if not logged_video_context:
-                print_and_log(f"➤ {os.path.basename(video)}", log_only=True)
-                logged_video_context = True
-            
-            print_and_log(f"{Fore.YELLOW}Synchronizing {os.path.basename(sub)} {Fore.LIGHTYELLOW_EX}[{lang.upper()}]{Style.RESET_ALL}")
-            
-            sync_success, offset_seconds = synchronize_subtitle_with_ffsubsync(video, sub, output_sub)
-            
-            if sync_success:
-                if offset_seconds > REJECT_OFFSET_THRESHOLD:
-                    print_and_log(f"{sync_tag()} {Fore.RED}⚠ High offset detected ({offset_seconds:.3f}s > {REJECT_OFFSET_THRESHOLD}s) - marking as DRIFT{Style.RESET_ALL}")
-                    
-                    try:
-                        os.remove(output_sub)
-                        mark_subtitle_as_drift(sub, lang, create_copies=False)  
-                        drift_subs.append(sub)
-                        
-                        continue
-                    except Exception as e:
-                        print_and_log(f"{sync_tag()} {Fore.RED}Error handling high offset: {str(e)}{Style.RESET_ALL}")
-                        continue
-                        
-                elif offset_seconds > ACCEPT_OFFSET_THRESHOLD:
-                    print_and_log(f"{sync_tag()} {Fore.YELLOW}✓ Synchronized with moderate offset ({offset_seconds:.3f}s) - added to manual verification{Style.RESET_ALL}")
-                    
-                    try:
-                        add_offset_entry(video, video_dir, lang, output_sub, [offset_seconds], anchor_path, [os.path.basename(sub)])
-                    except Exception as e:
-                        print_and_log(f"{sync_tag()} {Fore.RED}Error adding offset entry: {str(e)}{Style.RESET_ALL}")
-                        
-                else:
-                    print_and_log(f"{sync_tag()} {Fore.GREEN}✓ Synchronized with excellent precision ({offset_seconds:.3f}s ≤ {ACCEPT_OFFSET_THRESHOLD}s){Style.RESET_ALL}")
-                
-                found_good = True
-                successful_syncs += 1
-                successful_syncs_per_lang[lang] = successful_syncs_per_lang.get(lang, 0) + 1
-                processed_subs.add(sub)
-                
-                cleanup_drift_and_failed(video_dir, lang, keep_file=output_sub, clean_drifts=True)
-                
-                break
-            else:
-                print_and_log(f"{sync_tag()} {Fore.RED}✗ Synchronization failed for {os.path.basename(sub)}{Style.RESET_ALL}")
-                
-                base_name = os.path.splitext(sub)[0]
-                failed_name = f"{base_name}.FAILED{ext}"
-                
-                try:
-                    os.rename(sub, failed_name)
-                    print_and_log(f"{sync_tag()} {Fore.YELLOW}Marked as FAILED: {os.path.basename(failed_name)}{Style.RESET_ALL}")
-                except Exception as e:
-                    print_and_log(f"{sync_tag()} {Fore.RED}Could not rename to FAILED: {str(e)}{Style.RESET_ALL}")
-        
-        if not found_good:
-            all_current_drifted = all(f.endswith('.DRIFT.srt') or f.endswith('.FAILED.srt') 
-                                    for f in [os.path.basename(s) for s in subs_sorted])
-            
-            existing_drifts = [f for f in os.listdir(video_dir) 
-                             if f.endswith('.DRIFT.srt') and f'.{lang}.' in f]
-            
-            if (all_current_drifted and subs_sorted) or existing_drifts:
-                print_and_log(f"{sync_tag()} {Fore.YELLOW}No good sync found for {lang.upper()} - will check for acquisition at end{Style.RESET_ALL}")
-                acquisition_needed = True
+def synchronise_videos():
+    """Synchronise the candidates of every video, handing over to acquisition when only DRIFTs are left."""
+    global successful_syncs
+    processed_subs = set()
+    sync_videos = pipeline.take("synchronisation")
+    if sync_videos is None:
+        sync_videos = videos
+    total_videos = len(sync_videos)
+    acquisition_needed = False  
 
-if acquisition_needed:
-    os.system('cls' if os.name == 'nt' else 'clear')
-    clear_and_print_ascii(BANNER_LINE)
-    print_and_log(f"{sync_tag()} {Style.BRIGHT}{Fore.RED}Some videos/languages only have DRIFTs! Acquisition will be started.{Style.RESET_ALL}\n")
-    print_and_log(f"{sync_tag()} {Fore.YELLOW}This window will close automatically in {pause_seconds} seconds...{Style.RESET_ALL}")
-    time.sleep(pause_seconds)
-    os.system(f'python "{os.path.join(script_dir, "acquisition.py")}"')
-    sys.exit(0)
-else:
-    print_and_log(f"{sync_tag()} {Fore.GREEN}Synchronization completed successfully - cleaning up remaining DRIFT files{Style.RESET_ALL}")
-    for video in videos:
+    for idx, video in enumerate(sync_videos, 1):
+        clear_and_print_ascii(BANNER_LINE)
+        print_video_header(video, idx, total_videos)
+        RUN_LOG.set_context(video=os.path.basename(video), language=None)
+        metrics.set_context(video=os.path.basename(video), language=None)
         video_dir = os.path.dirname(video)
-        for lang in LANGUAGES:
-            for f in os.listdir(video_dir):
-                if re.match(rf".*\.{lang}\.number\d+\.DRIFT\.srt$", f, re.IGNORECASE):
-                    try:
-                        drift_path = os.path.join(video_dir, f)
-                        os.remove(drift_path)
-                        print_and_log(f"{sync_tag()} {Fore.YELLOW}Final cleanup: removed DRIFT: {f}{Style.RESET_ALL}")
-                    except Exception as e:
-                        print_and_log(f"{sync_tag()} {Fore.RED}Could not remove DRIFT {f}: {e}{Style.RESET_ALL}")
-all_subs_present = True
-missing_langs = set()
-missing_details = {}
-missing_per_video = {}
-if SERIES_MODE:
-    for code, video in sxxexx_to_video.items():
         video_basename, _ = os.path.splitext(video)
+
+        all_subs_exist = True
         for lang in LANGUAGES:
             expected = f"{video_basename}.{lang}.srt"
             if not os.path.exists(expected):
-                all_subs_present = False
-                missing_langs.add(lang)
-                missing_details.setdefault(lang, []).append(video)
-                missing_per_video.setdefault(video, []).append(lang)
-else:
-    for video in videos:
-        video_basename, _ = os.path.splitext(video)
+                all_subs_exist = False
+                break
+
+        if all_subs_exist:
+            print_and_log(f"{sync_tag()} {Fore.GREEN}All required subtitles already exist for this video - skipping{Style.RESET_ALL}")
+            continue
+
+        candidate_subs = defaultdict(list)
+        for f in os.listdir(video_dir):
+            f_path = os.path.join(video_dir, f)
+            match = re.match(r".*\.(?P<lang>[a-z]{2})\.number\d+\.srt$", f)
+            if match:
+                lang = match.group("lang")
+                if lang in LANGUAGES:
+                    candidate_subs[lang].append(f_path)
+
         for lang in LANGUAGES:
-            expected = f"{video_basename}.{lang}.srt"
-            if not os.path.exists(expected):
-                all_subs_present = False
-                missing_langs.add(lang)
-                missing_details.setdefault(lang, []).append(video)
-                missing_per_video.setdefault(video, []).append(lang)
+            RUN_LOG.set_context(language=lang)
+            metrics.set_context(language=lang)
+            subs = candidate_subs.get(lang, [])
+            found_good = False
+            drift_subs = []  
+
+            subs_sorted = sorted(subs, key=lambda x: int(re.search(r"number(\d+)", x).group(1)))
+            logged_video_context = False
+
+            for sub in subs_sorted:
+                if sub.endswith('.DRIFT.srt') or sub.endswith('.FAILED.srt'):
+                    continue
+
+                ext = os.path.splitext(sub)[1].lower()
+                output_ext = f".{lang}{ext}"
+                output_sub = video_basename + output_ext
+
+                if os.path.exists(output_sub):
+                    found_good = True
+                    break
+
+                if not logged_video_context:
+                    print_and_log(f"➤ {os.path.basename(video)}", log_only=True)
+                    logged_video_context = True
+
+                print_and_log(f"{Fore.YELLOW}Synchronizing {os.path.basename(sub)} {Fore.LIGHTYELLOW_EX}[{lang.upper()}]{Style.RESET_ALL}")
+
+                sync_started = time.monotonic()
+                presynced = pipeline.take_presynced(video, lang, sub, output_sub)
+                if presynced is not None:
+                    sync_success, offset_seconds = presynced
+                    if sync_success:
+                        print_and_log(f"{sync_tag()} {Fore.GREEN}Synchronized in the background during acquisition. Offset: {offset_seconds:.3f}s{Style.RESET_ALL}")
+                else:
+                    sync_success, offset_seconds = synchronize_subtitle_with_ffsubsync(video, sub, output_sub)
+                sync_fields = {'candidate': os.path.basename(sub), 'duration': round(time.monotonic() - sync_started, 3)}
+
+                if sync_success:
+                    if offset_seconds > REJECT_OFFSET_THRESHOLD:
+                        print_and_log(f"{sync_tag()} {Fore.RED}⚠ High offset detected ({offset_seconds:.3f}s > {REJECT_OFFSET_THRESHOLD}s) - marking as DRIFT{Style.RESET_ALL}", outcome='drift', offset=offset_seconds, **sync_fields)
+
+                        try:
+                            os.remove(output_sub)
+                            mark_subtitle_as_drift(sub, lang, create_copies=False)  
+                            drift_subs.append(sub)
+
+                            continue
+                        except Exception as e:
+                            print_and_log(f"{sync_tag()} {Fore.RED}Error handling high offset: {str(e)}{Style.RESET_ALL}")
+                            continue
+
+                    elif offset_seconds > ACCEPT_OFFSET_THRESHOLD:
+                        print_and_log(f"{sync_tag()} {Fore.YELLOW}✓ Synchronized with moderate offset ({offset_seconds:.3f}s) - added to manual verification{Style.RESET_ALL}", outcome='verify', offset=offset_seconds, **sync_fields)
+
+                        try:
+                            add_offset_entry(video, video_dir, lang, output_sub, [offset_seconds], anchor_path, [os.path.basename(sub)])
+                        except Exception as e:
+                            print_and_log(f"{sync_tag()} {Fore.RED}Error adding offset entry: {str(e)}{Style.RESET_ALL}")
+
+                    else:
+                        print_and_log(f"{sync_tag()} {Fore.GREEN}✓ Synchronized with excellent precision ({offset_seconds:.3f}s ≤ {ACCEPT_OFFSET_THRESHOLD}s){Style.RESET_ALL}", outcome='accepted', offset=offset_seconds, **sync_fields)
+
+                    found_good = True
+                    successful_syncs += 1
+                    successful_syncs_per_lang[lang] = successful_syncs_per_lang.get(lang, 0) + 1
+                    processed_subs.add(sub)
+
+                    cleanup_drift_and_failed(video_dir, lang, keep_file=output_sub, clean_drifts=True)
+
+                    break
+                else:
+                    print_and_log(f"{sync_tag()} {Fore.RED}✗ Synchronization failed for {os.path.basename(sub)}{Style.RESET_ALL}", outcome='failed', **sync_fields)
+
+                    base_name = os.path.splitext(sub)[0]
+                    failed_name = f"{base_name}.FAILED{ext}"
+
+                    try:
+                        os.rename(sub, failed_name)
+                        print_and_log(f"{sync_tag()} {Fore.YELLOW}Marked as FAILED: {os.path.basename(failed_name)}{Style.RESET_ALL}")
+                    except Exception as e:
+                        print_and_log(f"{sync_tag()} {Fore.RED}Could not rename to FAILED: {str(e)}{Style.RESET_ALL}")
+
+            if not found_good:
+                all_current_drifted = all(f.endswith('.DRIFT.srt') or f.endswith('.FAILED.srt') 
+                                        for f in [os.path.basename(s) for s in subs_sorted])
+
+                existing_drifts = [f for f in os.listdir(video_dir) 
+                                 if f.endswith('.DRIFT.srt') and f'.{lang}.' in f]
+
+                if (all_current_drifted and subs_sorted) or existing_drifts:
+                    print_and_log(f"{sync_tag()} {Fore.YELLOW}No good sync found for {lang.upper()} - will check for acquisition at end{Style.RESET_ALL}")
+                    acquisition_needed = True
+                    pipeline.queue("acquisition", video)
+
+    if acquisition_needed:
+        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_and_print_ascii(BANNER_LINE)
+        print_and_log(f"{sync_tag()} {Style.BRIGHT}{Fore.RED}Some videos/languages only have DRIFTs! Acquisition will be started.{Style.RESET_ALL}\n")
+        print_and_log(f"{sync_tag()} {Fore.YELLOW}This window will close automatically in {pause_seconds} seconds...{Style.RESET_ALL}")
+        time.sleep(pause_seconds)
+        pipeline.hand_off("acquisition")
+        sys.exit(0)
+    else:
+        print_and_log(f"{sync_tag()} {Fore.GREEN}Synchronization completed successfully - cleaning up remaining DRIFT files{Style.RESET_ALL}")
+        for video in videos:
+            video_dir = os.path.dirname(video)
+            for lang in LANGUAGES:
+                for f in os.listdir(video_dir):
+                    if re.match(rf".*\.{lang}\.number\d+\.DRIFT\.srt$", f, re.IGNORECASE):
+                        try:
+                            drift_path = os.path.join(video_dir, f)
+                            os.remove(drift_path)
+                            print_and_log(f"{sync_tag()} {Fore.YELLOW}Final cleanup: removed DRIFT: {f}{Style.RESET_ALL}")
+                        except Exception as e:
+                            print_and_log(f"{sync_tag()} {Fore.RED}Could not remove DRIFT {f}: {e}{Style.RESET_ALL}")
+    all_subs_present = True
+    missing_langs = set()
+    missing_details = {}
+    missing_per_video = {}
+    if SERIES_MODE:
+        for code, video in sxxexx_to_video.items():
+            video_basename, _ = os.path.splitext(video)
+            for lang in LANGUAGES:
+                expected = f"{video_basename}.{lang}.srt"
+                if not os.path.exists(expected):
+                    all_subs_present = False
+                    missing_langs.add(lang)
+                    missing_details.setdefault(lang, []).append(video)
+                    missing_per_video.setdefault(video, []).append(lang)
+    else:
+        for video in videos:
+            video_basename, _ = os.path.splitext(video)
+            for lang in LANGUAGES:
+                expected = f"{video_basename}.{lang}.srt"
+                if not os.path.exists(expected):
+                    all_subs_present = False
+                    missing_langs.add(lang)
+                    missing_details.setdefault(lang, []).append(video)
+                    missing_per_video.setdefault(video, []).append(lang)
 
 def show_offset_verification_menu():
     """Display menu for manual verification of subtitle offset corrections."""
@@ -1088,7 +1080,20 @@ def show_offset_verification_menu():
             lines = entry.splitlines()
             if len(lines) >= 3 and any(line.endswith(('.mkv', '.mp4', '.avi')) for line in lines):
                 entries.append(entry)
-    if not entries:
+    remaining = []
+    for entry in entries:
+        title, folder, video = entry.splitlines()[:3]
+        lang_match = re.search(r'\[([A-Z]{2})\]', title)
+        lang = lang_match.group(1).lower() if lang_match else 'en'
+        choices = {'1': 'The subtitle is well synced', '2': 'Check it in the next interactive run'}
+        choice = ask_or_defer('offset_verification', os.path.join(folder, video),
+                              f"Does the offset-corrected {lang.upper()} subtitle of {video} match the audio?", choices, '2', lang)
+        if choice == '1':
+            remove_completed_entry_from_offset_file(title, folder, video)
+        else:
+            remaining.append(entry)
+    entries = remaining
+    if not entries or decisions.headless():
         return
     clear_and_print_ascii(BANNER_LINE)
     print_and_log(f"{Style.BRIGHT}{Fore.CYAN}Offset Correction Verification Menu{Style.RESET_ALL}\n")
@@ -1440,6 +1445,7 @@ def show_manual_correction_menu(idx, total, title, subtitle_name, offset, timest
                     
                     drift_marked = True
                     drift_marked_in_menu = True
+                    pipeline.queue("acquisition", os.path.join(folder, video))
                     print_and_log(f"{Fore.LIGHTGREEN_EX}Drift marking completed successfully. Moving to next video.{Style.RESET_ALL}")
                     return
                 elif confirm == "n":
@@ -1452,50 +1458,77 @@ def show_manual_correction_menu(idx, total, title, subtitle_name, offset, timest
             break
         else:
             logs.append(f"{sync_tag()} {Fore.RED}Invalid choice. Please enter 1-6.{Style.RESET_ALL}")
+def finish_run():
+    """Offer the manual offset checks, clean up internal and redundant subtitles and show the final coverage."""
+    if os.path.exists(MOVIES_WITH_LINEAR_OFFSET_FILE):
+        print_and_log(f"\n{Fore.YELLOW}Manual verification file exists - some subtitles may need review{Style.RESET_ALL}")
+        show_offset_verification_menu()
+
+    if drift_marked:
+        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_and_print_ascii(BANNER_LINE)
+        print_and_log(f"{sync_tag()} {Style.BRIGHT}{Fore.RED}DRIFT subtitles detected during manual verification! Acquisition will be started.{Style.RESET_ALL}\n")
+        print_and_log(f"{sync_tag()} {Fore.YELLOW}This window will close automatically in {pause_seconds} seconds...{Style.RESET_ALL}")
+        time.sleep(pause_seconds)
+        pipeline.hand_off("acquisition")
+        sys.exit(0)
+
+    print_and_log(f"\n{sync_tag()} {Fore.CYAN}Checking internal subtitle cleanup requirements...{Style.RESET_ALL}")
+
+    if PRESERVE_UNWANTED_SUBTITLES:
+        print_and_log(f"{sync_tag()} {Fore.GREEN}Skipping internal subtitle cleanup - preserve_unwanted_subtitles is enabled{Style.RESET_ALL}")
+        print_and_log(f"{sync_tag()} {Fore.CYAN}preserve_unwanted_subtitles: {PRESERVE_UNWANTED_SUBTITLES}{Style.RESET_ALL}")
+    else:
+        print_and_log(f"{sync_tag()} {Fore.YELLOW}Internal subtitle cleanup enabled - preserve_unwanted_subtitles is false{Style.RESET_ALL}")
+        print_and_log(f"{sync_tag()} {Fore.CYAN}Going through internal subtitle cleanup. This can take a while with many videos..{Style.RESET_ALL}")
+        prompt_and_cleanup_internal_subs()
+
+    print_and_log(f"\n{sync_tag()} {Fore.CYAN}Performing final cleanup...{Style.RESET_ALL}")
+    final_cleanup_prompt_and_cleanup()
+
+    print_and_log(f"\n{sync_tag()} {Fore.CYAN}Performing final subtitle coverage scan...{Style.RESET_ALL}")
+    coverage_results = scan_subtitle_coverage(videos, LANGUAGES, show_progress=True, logger_func=print_and_log, sync_tag_func=sync_tag)
+    display_coverage_results(coverage_results, LANGUAGES, banner_line=BANNER_LINE, return_to_menu=not decisions.headless(), logger_func=print_and_log, sync_tag_func=sync_tag)
 
-if os.path.exists(MOVIES_WITH_LINEAR_OFFSET_FILE):
-    print_and_log(f"\n{Fore.YELLOW}Manual verification file exists - some subtitles may need review{Style.RESET_ALL}")
-    show_offset_verification_menu()
+    clear_and_print_ascii(BANNER_LINE)
+    print_and_log(f"\n{Style.BRIGHT}{Fore.GREEN}✓ Subservient run COMPLETE!{Style.RESET_ALL}\n")
+
+    print_and_log(f"{Fore.LIGHTYELLOW_EX}Finishing touch:{Style.RESET_ALL}\nWant to rename internal subtitles, clean ads, promotional text, and unwanted content from your subtitles?")
+    print_and_log(f"Check out the main menu → option {Fore.GREEN}5{Style.RESET_ALL} '{Fore.CYAN}Extra tools{Style.RESET_ALL}' for a final polish!\n")
+
+    print_and_log(f"{Style.BRIGHT}Thank you so much for using Subservient!{Style.RESET_ALL}")
+    print_and_log(f"I hope this tool has made managing your subtitle collection a bit easier.")
+    print_and_log(f"If Subservient has been helpful to you, I'd be incredibly grateful for any support:")
+    print_and_log(f"{Fore.CYAN}https://buymeacoffee.com/nexigen{Style.RESET_ALL}")
+    print_and_log(f"\nEven the smallest contribution helps me keep improving this tool and provide")
+    print_and_log(f"better support for the community. But please, only if you can spare it!")
+    print_and_log(f"\n{Fore.GREEN}Thank you for being part of the Subservient community!{Style.RESET_ALL}")
+
+    pending = len(decisions.pending())
+    if pending:
+        print_and_log(f"\n{Fore.LIGHTYELLOW_EX}{pending} decision(s) are waiting in the review queue.{Style.RESET_ALL} "
+                      f"Run {Fore.CYAN}subordinate.py --review{Style.RESET_ALL} or use the main menu to go through them.")
+    if decisions.headless():
+        return
+    print_and_log(f"\n{Fore.YELLOW}Press any key to exit...{Style.RESET_ALL}")
+    input()
 
-if drift_marked:
-    os.system('cls' if os.name == 'nt' else 'clear')
+def main():
+    """Synchronise the downloaded subtitles of every video, then clean up and show the final coverage."""
+    init(autoreset=True)
+    open_run_log()
     clear_and_print_ascii(BANNER_LINE)
-    print_and_log(f"{sync_tag()} {Style.BRIGHT}{Fore.RED}DRIFT subtitles detected during manual verification! Acquisition will be started.{Style.RESET_ALL}\n")
-    print_and_log(f"{sync_tag()} {Fore.YELLOW}This window will close automatically in {pause_seconds} seconds...{Style.RESET_ALL}")
-    time.sleep(pause_seconds)
-    os.system(f'python "{os.path.join(script_dir, "acquisition.py")}"')
-    sys.exit(0)
-
-print_and_log(f"\n{sync_tag()} {Fore.CYAN}Checking internal subtitle cleanup requirements...{Style.RESET_ALL}")
-
-if PRESERVE_UNWANTED_SUBTITLES:
-    print_and_log(f"{sync_tag()} {Fore.GREEN}Skipping internal subtitle cleanup - preserve_unwanted_subtitles is enabled{Style.RESET_ALL}")
-    print_and_log(f"{sync_tag()} {Fore.CYAN}preserve_unwanted_subtitles: {PRESERVE_UNWANTED_SUBTITLES}{Style.RESET_ALL}")
-else:
-    print_and_log(f"{sync_tag()} {Fore.YELLOW}Internal subtitle cleanup enabled - preserve_unwanted_subtitles is false{Style.RESET_ALL}")
-    print_and_log(f"{sync_tag()} {Fore.CYAN}Going through internal subtitle cleanup. This can take a while with many videos..{Style.RESET_ALL}")
-    prompt_and_cleanup_internal_subs()
-
-print_and_log(f"\n{sync_tag()} {Fore.CYAN}Performing final cleanup...{Style.RESET_ALL}")
-final_cleanup_prompt_and_cleanup()
-
-print_and_log(f"\n{sync_tag()} {Fore.CYAN}Performing final subtitle coverage scan...{Style.RESET_ALL}")
-coverage_results = scan_subtitle_coverage(videos, LANGUAGES, show_progress=True, logger_func=print_and_log, sync_tag_func=sync_tag)
-display_coverage_results(coverage_results, LANGUAGES, banner_line=BANNER_LINE, return_to_menu=True, logger_func=print_and_log, sync_tag_func=sync_tag)
-
-clear_and_print_ascii(BANNER_LINE)
-print_and_log(f"\n{Style.BRIGHT}{Fore.GREEN}✓ Subservient run COMPLETE!{Style.RESET_ALL}\n")
-
-print_and_log(f"{Fore.LIGHTYELLOW_EX}Finishing touch:{Style.RESET_ALL}\nWant to rename internal subtitles, clean ads, promotional text, and unwanted content from your subtitles?")
-print_and_log(f"Check out the main menu → option {Fore.GREEN}5{Style.RESET_ALL} '{Fore.CYAN}Extra tools{Style.RESET_ALL}' for a final polish!\n")
-
-print_and_log(f"{Style.BRIGHT}Thank you so much for using Subservient!{Style.RESET_ALL}")
-print_and_log(f"I hope this tool has made managing your subtitle collection a bit easier.")
-print_and_log(f"If Subservient has been helpful to you, I'd be incredibly grateful for any support:")
-print_and_log(f"{Fore.CYAN}https://buymeacoffee.com/nexigen{Style.RESET_ALL}")
-print_and_log(f"\nEven the smallest contribution helps me keep improving this tool and provide")
-print_and_log(f"better support for the community. But please, only if you can spare it!")
-print_and_log(f"\n{Fore.GREEN}Thank you for being part of the Subservient community!{Style.RESET_ALL}")
-
-print_and_log(f"\n{Fore.YELLOW}Press any key to exit...{Style.RESET_ALL}")
-input()
\ No newline at end of file
+    ensure_initial_setup()
+    load_library()
+    read_settings()
+    clear_and_print_ascii(BANNER_LINE)
+    if SERIES_MODE:
+        for video in videos:
+            if code := extract_sxxexx(os.path.basename(video)):
+                sxxexx_to_video[code] = video
+    find_failed_subtitles()
+    synchronise_videos()
+    finish_run()
+
+if __name__ == "__main__":
+    profiling.run_phase("synchronisation", main)
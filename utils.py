@@ -4,8 +4,8 @@ from colorama import Fore, Style
 import os
 import subprocess
 import time
+import metrics
 import re
-import shutil
 
 def clean_display_name(filename, config_path=None):
     """Clean video/subtitle filename for display by removing unwanted terms."""
@@ -14,16 +14,7 @@ def clean_display_name(filename, config_path=None):
     
     unwanted_terms = []
     if config_path and config_path.exists():
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('UNWANTED_TERMS='):
-                        terms_str = line.split('=', 1)[1].strip()
-                        unwanted_terms = [term.strip() for term in terms_str.split(',') if term.strip()]
-                        break
-        except Exception:
-            pass
+        unwanted_terms = get_config(config_path).unwanted_terms
     
     if not unwanted_terms:
         unwanted_terms = [
@@ -219,12 +210,18 @@ def lang_in_list(target_lang, lang_list):
 
 def get_internal_subtitle_languages(video_path):
     """Extract internal subtitle languages from video file using ffprobe."""
+    return probe_internal_subtitle_languages(video_path) or []
+
+def probe_internal_subtitle_languages(video_path):
+    """Run ffprobe for the internal subtitle languages of a video; returns None when the video could not be probed."""
     cmd = [
         "ffprobe", "-v", "error", "-select_streams", "s", "-show_entries",
         "stream=index:stream_tags=language", "-of", "csv=p=0", video_path
     ]
     try:
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8')
+        result = metrics.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf-8')
+        if result.returncode != 0:
+            return None
         lines = [l for l in result.stdout.strip().split('\n') if l.strip()]
         languages = set()
         for line in lines:
@@ -237,7 +234,8 @@ def get_internal_subtitle_languages(video_path):
                     languages.add(lang_code.lower())
         return sorted(list(languages))
     except Exception:
-        return []
+        return None
+
 def trim_movie_name(filename):
     """Extract clean movie name by removing year and extension patterns."""
     m = re.search(r'^(.*?)(\(|\.|\s)(19|20)\d{2}(\)|\.|\s)', filename)
@@ -247,45 +245,99 @@ def trim_movie_name(filename):
         return base
     return filename
 
+def get_first_cue_seconds(subtitle_path):
+    """Return the start of the first cue of an SRT file in seconds, or 0.0 when it has none."""
+    with open(subtitle_path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            if '-->' in line:
+                time_parts = line.split('-->')[0].strip().split(':')
+                if len(time_parts) == 3:
+                    seconds_ms = time_parts[2].split(',')
+                    milliseconds = int(seconds_ms[1]) if len(seconds_ms) > 1 else 0
+                    return int(time_parts[0]) * 3600 + int(time_parts[1]) * 60 + int(seconds_ms[0]) + milliseconds / 1000.0
+    return 0.0
+
+def get_subtitle_offset(original_path, synchronized_path):
+    """Return how far synchronisation moved the first cue of a subtitle, in seconds."""
+    if not os.path.exists(original_path) or not os.path.exists(synchronized_path):
+        return 0.0
+    return abs(get_first_cue_seconds(original_path) - get_first_cue_seconds(synchronized_path))
+
+COVERAGE_PROBE_WORKERS = 8
+PROGRESS_REFRESH_SECONDS = 0.5
+
+def iter_cached_subtitle_languages(videos, index=None):
+    """Yield each video with its internal subtitle languages, first the videos unchanged since their last probe and
+    then the others as their parallel probes finish; a video that could not be probed comes with an empty list."""
+    import json
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    index = index or get_library_index()
+    to_probe = {}
+    for video in videos:
+        try:
+            st = os.stat(video)
+        except OSError:
+            index.execute("DELETE FROM probes WHERE path = ?", (video,))
+            yield video, []
+            continue
+        row = index.execute("SELECT size, mtime_ns, languages FROM probes WHERE path = ?", (video,)).fetchone()
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            yield video, json.loads(row[2])
+        else:
+            to_probe[video] = st
+    if to_probe:
+        with ThreadPoolExecutor(max_workers=COVERAGE_PROBE_WORKERS) as pool:
+            futures = {pool.submit(probe_internal_subtitle_languages, video): video for video in to_probe}
+            for future in as_completed(futures):
+                video, languages = futures[future], future.result()
+                if languages is not None:
+                    st = to_probe[video]
+                    index.execute("INSERT OR REPLACE INTO probes (path, size, mtime_ns, languages) VALUES (?, ?, ?, ?)",
+                                  (video, st.st_size, st.st_mtime_ns, json.dumps(languages)))
+                yield video, languages or []
+    index.commit()
+
 def scan_subtitle_coverage(videos, languages, show_progress=True, logger_func=None, sync_tag_func=None):
-    """Scan video files and analyze subtitle coverage for specified languages."""
+    """Scan video files and analyze subtitle coverage for specified languages.
+    
+    Internal languages come from the probe cache, with changed videos probed in parallel, and sidecar subtitles
+    from one listing per folder; progress follows the probes as they finish and is redrawn at a fixed rate rather
+    than for every video. Results keep the order of the videos.
+    """
     if not videos:
         return []
     log_func = logger_func if logger_func else print
     tag_func = sync_tag_func if sync_tag_func else lambda: ""
+    banner = "                   [Phase 4/4] Subtitle Synchronisation" if sync_tag_func else "                   Subtitle Coverage Scan"
     if show_progress:
-        if sync_tag_func:
-            clear_and_print_ascii("                   [Phase 4/4] Subtitle Synchronisation")
-            log_func(f"{Fore.CYAN}Checking subtitle availability for all movies..{Style.RESET_ALL}\n")
-        else:
-            clear_and_print_ascii("                   Subtitle Coverage Scan")
-            log_func(f"{Fore.CYAN}Checking subtitle availability for all movies..{Style.RESET_ALL}\n")
-    coverage_results = []
-    total_videos = len(videos)
-    for idx, video in enumerate(videos, 1):
+        clear_and_print_ascii(banner)
+        log_func(f"{Fore.CYAN}Checking subtitle availability for all movies..{Style.RESET_ALL}\n")
+    
+    video_paths = [str(Path(video)) for video in videos]
+    index = get_library_index()
+    folder_files = {}
+    coverage_by_video = {}
+    total_videos = len(video_paths)
+    last_refresh = 0.0
+    for idx, (video, internal_langs) in enumerate(iter_cached_subtitle_languages(video_paths, index), 1):
         video_path = Path(video)
         video_name = trim_movie_name(video_path.name)
-        if show_progress:
-            if sync_tag_func:
-                clear_and_print_ascii("                   [Phase 4/4] Subtitle Synchronisation")
-                log_func(f"{Fore.CYAN}[{idx}/{total_videos}]{Style.RESET_ALL}  {Fore.LIGHTYELLOW_EX}{video_name.upper()}{Style.RESET_ALL}")
-                log_func(f"{tag_func()} {Fore.YELLOW}Scanning subtitle coverage...{Style.RESET_ALL}")
-            else:
-                clear_and_print_ascii("                   Subtitle Coverage Scan")
-                log_func(f"{Fore.CYAN}[{idx}/{total_videos}]{Style.RESET_ALL}  {Fore.LIGHTYELLOW_EX}{video_name.upper()}{Style.RESET_ALL}")
-                log_func(f"{Fore.YELLOW}Scanning subtitle coverage...{Style.RESET_ALL}")
+        if show_progress and (time.monotonic() - last_refresh >= PROGRESS_REFRESH_SECONDS or idx == total_videos):
+            last_refresh = time.monotonic()
+            clear_and_print_ascii(banner)
+            log_func(f"{Fore.CYAN}[{idx}/{total_videos}]{Style.RESET_ALL}  {Fore.LIGHTYELLOW_EX}{video_name.upper()}{Style.RESET_ALL}")
+            log_func(f"{tag_func()} {Fore.YELLOW}Scanning subtitle coverage...{Style.RESET_ALL}" if sync_tag_func
+                     else f"{Fore.YELLOW}Scanning subtitle coverage...{Style.RESET_ALL}")
         video_basename = video_path.stem
-        video_dir = video_path.parent
+        video_dir = str(video_path.parent)
+        if video_dir not in folder_files:
+            listing = list_library_folder(video_dir, index)
+            folder_files[video_dir] = {os.path.normcase(name) for name in listing[1]} if listing else set()
         coverage = {}
-        internal_langs = get_internal_subtitle_languages(str(video_path))
         for lang in languages:
-            external_found = False
+            external_found = any(os.path.normcase(f"{video_basename}.{lang}{ext}") in folder_files[video_dir] for ext in ('.srt', '.ass'))
             internal_found = lang.lower() in internal_langs
-            for ext in ('.srt', '.ass'):
-                expected_path = video_dir / f"{video_basename}.{lang}{ext}"
-                if expected_path.exists():
-                    external_found = True
-                    break
             if external_found:
                 coverage[lang] = 'external'
             elif internal_found:
@@ -293,11 +345,10 @@ def scan_subtitle_coverage(videos, languages, show_progress=True, logger_func=No
             else:
                 coverage[lang] = 'missing'
         
-        coverage_results.append((str(video_path), video_name, coverage))
-        if show_progress:
-            time.sleep(0.1)
+        coverage_by_video[video] = (video, video_name, coverage)
+    index.commit()
     
-    return coverage_results
+    return [coverage_by_video[video] for video in video_paths]
 
 def display_coverage_results(coverage_results, languages, banner_line=None, return_to_menu=True, logger_func=None, sync_tag_func=None):
     """Display formatted subtitle coverage report with statistics."""
@@ -317,7 +368,6 @@ def display_coverage_results(coverage_results, languages, banner_line=None, retu
         status_parts = []
         
         for lang in languages:
-            time.sleep(0.1)
             status = coverage.get(lang, 'missing')
             lang_upper = lang.upper()
             if status == 'external':
@@ -373,65 +423,244 @@ def display_coverage_results(coverage_results, languages, banner_line=None, retu
     if return_to_menu:
         input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL} ")
 
+DEFAULT_SKIP_DIRS = frozenset({
+    "new folder", "nieuwe map", "extra", "extra's", "extras", "featurettes", "bonus", "bonusmaterial", "bonus_material",
+    "behindthescenes", "behind_the_scenes", "deletedscenes", "deleted_scenes",
+    "interviews", "makingof", "making_of", "scenes", "trailer", "trailers",
+    "sample", "samples", "other", "misc", "specials", "special_features",
+    "documentary", "docs", "docu", "promo", "promos", "bloopers", "outtakes"
+})
+CONFIG_SETTING_RE = re.compile(r'^([a-zA-Z0-9_]+)\s*=\s*(.+)$')
+_config_cache = {}
+
+class SubservientConfig:
+    """The .config parsed once into lookup structures, shared by every phase through get_config()."""
+    
+    def __init__(self, path, text, signature=None):
+        self.path = Path(path)
+        self.signature = signature
+        self.lines = text.splitlines()
+        self.settings = {}
+        for line in self.lines:
+            m = CONFIG_SETTING_RE.match(line.strip())
+            if m:
+                self.settings[m.group(1).strip().lower()] = m.group(2).strip()
+        self.setup = self._parse_setup()
+        self.token = self._parse_token()
+        self.skipped_movies = self._parse_skipped_movies()
+        
+        self.languages = [lang.strip() for lang in self.settings.get('languages', '').split(',') if lang.strip()] or ['en']
+        self.unwanted_terms = [term.strip().strip('"') for term in self.settings.get('unwanted_terms', '').split(',') if term.strip()]
+        self.unwanted_terms_regex = re.compile(r"\\b(" + "|".join(re.escape(term) for term in self.unwanted_terms) + r")\\b", re.IGNORECASE)
+        
+        self.skip_dirs = {d.strip().lower() for d in self.settings.get('skip_dirs', '').split(',') if d.strip()} or set(DEFAULT_SKIP_DIRS)
+        extras_folder_name = self.settings.get('extras_folder_name', '').lower()
+        self.skip_dirs.add(extras_folder_name or 'extras')
+    
+    def _parse_setup(self):
+        """Read the [SETUP] section with the case of its keys kept and quotes stripped from values."""
+        setup = {}
+        in_setup = False
+        for line in self.lines:
+            if line.strip().lower() == '[setup]':
+                in_setup = True
+                continue
+            if in_setup:
+                if line.strip().startswith('['):
+                    break
+                if line.strip() and not line.strip().startswith('#') and '=' in line:
+                    key, value = line.split('=', 1)
+                    setup[key.strip()] = value.strip().strip('"')
+        return setup
+    
+    def _parse_token(self):
+        """Read the JWT token stored below [token], or in an old style 'token =' line."""
+        lines = self.lines
+        for i, line in enumerate(lines):
+            if line.strip() == '[token]':
+                for value in (following.strip() for following in lines[i + 1:]):
+                    if value.startswith('[') or value.startswith('--'):
+                        break
+                    if value and not value.startswith('#'):
+                        return value
+            elif line.strip().startswith('token ='):
+                return line.split('=', 1)[1].strip()
+        return None
+    
+    def _parse_skipped_movies(self):
+        """Read [skipped_movies] into a dict of movie path to the set of skipped languages."""
+        skipped = {}
+        in_skipped = False
+        for line in self.lines:
+            entry = line.strip()
+            if entry == '[skipped_movies]':
+                in_skipped = True
+                continue
+            if in_skipped:
+                if entry.startswith('['):
+                    break
+                if '[' in entry and entry.endswith(']'):
+                    parts = entry.rsplit(' [', 1)
+                    if len(parts) == 2:
+                        skipped[parts[0]] = {lang.strip().lower() for lang in parts[1][:-1].split(',') if lang.strip()}
+        return skipped
+    
+    def get(self, key, default=None):
+        return self.settings.get(key.lower(), default)
+    
+    def get_bool(self, key, default=False):
+        value = self.settings.get(key.lower())
+        if value is None:
+            return default
+        return value.lower() in ('true', '1', 'yes', 'on')
+    
+    def is_movie_language_skipped(self, movie_key, language):
+        return language.lower() in self.skipped_movies.get(movie_key, ())
+
+def get_config(config_path=None):
+    """Get the parsed .config; it is read again only after the file's modification time or size changed."""
+    if config_path is None:
+        config_path = get_subservient_folder() / '.config'
+    config_path = Path(config_path)
+    try:
+        stat = config_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    
+    config = _config_cache.get(str(config_path))
+    if config is None or config.signature != signature:
+        text = ''
+        if signature is not None:
+            try:
+                text = config_path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                signature = None
+        config = _config_cache[str(config_path)] = SubservientConfig(config_path, text, signature)
+    return config
+
+def write_config_text(config_path, text):
+    """Write the whole .config at once and keep the parsed copy in step without reading it back."""
+    config_path = Path(config_path)
+    config_path.write_text(text, encoding='utf-8')
+    stat = config_path.stat()
+    _config_cache[str(config_path)] = SubservientConfig(config_path, text, (stat.st_mtime_ns, stat.st_size))
+
+def update_config_values(values, config_path=None):
+    """Set several 'key= value' settings of the .config in a single rewrite; returns the keys that were found."""
+    config = get_config(config_path)
+    remaining = {key.lower(): value for key, value in values.items()}
+    updated = set()
+    lines = []
+    for line in config.lines:
+        m = CONFIG_SETTING_RE.match(line.strip()) or re.match(r'^([a-zA-Z0-9_]+)\s*=\s*$', line.strip())
+        key = m.group(1).lower() if m else None
+        if key in remaining:
+            lines.append(f"{m.group(1)}= {remaining[key]}")
+            updated.add(key)
+        else:
+            lines.append(line)
+    if updated:
+        write_config_text(config.path, '\n'.join(lines) + '\n')
+    return updated
+
 def get_languages_from_config(config_path=None):
     """Read languages setting from config file."""
-    if config_path is None:
-        subservient_folder = get_subservient_folder()
-        config_path = subservient_folder / '.config'
-    languages = ['en']
-    if config_path and Path(config_path).exists():
-        try:
-            with open(config_path, encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('languages='):
-                        lang_str = line.split('=', 1)[1].strip()
-                        if lang_str:
-                            languages = [lang.strip() for lang in lang_str.split(',') if lang.strip()]
-                        break
-        except Exception:
-            pass
-    return languages
+    return list(get_config(config_path).languages)
 
 def get_skip_dirs_from_config(config_path=None):
     """Read skip_dirs setting from config file and return as lowercase set."""
-    if config_path is None:
-        subservient_folder = get_subservient_folder()
-        config_path = subservient_folder / '.config'
-    skip_dirs = set()
-    extras_folder_name = None
+    return set(get_config(config_path).skip_dirs)
+
+_library_index = None
+
+def get_library_index():
+    """Open the library index once per session; it keeps the subfolders and files of every folder walked before,
+    together with the folder's modification time, and the internal subtitle languages of every video probed before."""
+    global _library_index
+    if _library_index is None:
+        import sqlite3
+        data_dir = get_subservient_folder() / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        index = sqlite3.connect(str(data_dir / "library_index.db"))
+        index.execute("CREATE TABLE IF NOT EXISTS folders (path TEXT PRIMARY KEY, mtime_ns INTEGER, dirs TEXT, files TEXT)")
+        index.execute("CREATE TABLE IF NOT EXISTS probes (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, languages TEXT)")
+        index.commit()
+        _library_index = index
+    return _library_index
+
+def forget_library_folder(folder, index):
+    """Forget the listing of a folder that disappeared, together with the listings and probes of everything under it.
+    
+    Paths are matched on their exact prefix rather than with LIKE, whose wildcards '_' and '%' are common in folder
+    names and which ignores case.
+    """
+    prefix = os.path.join(folder, '')
+    index.execute("DELETE FROM folders WHERE path = ? OR substr(path, 1, ?) = ?", (folder, len(prefix), prefix))
+    index.execute("DELETE FROM probes WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))
+
+def list_library_folder(folder, index=None):
+    """Return the subfolder and file names of a folder, listing it again only when its modification time changed;
+    the probes of videos that disappeared from it are forgotten then."""
+    import json
+    index = index or get_library_index()
+    try:
+        mtime_ns = os.stat(folder).st_mtime_ns
+    except OSError:
+        forget_library_folder(folder, index)
+        return None
     
-    if config_path and Path(config_path).exists():
-        try:
-            with open(config_path, encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('skip_dirs='):
-                        skip_str = line.split('=', 1)[1].strip()
-                        if skip_str:
-                            skip_dirs = {dir.strip().lower() for dir in skip_str.split(',') if dir.strip()}
-                    elif line.startswith('extras_folder_name='):
-                        value = line.split('=', 1)[1].strip()
-                        if value:
-                            extras_folder_name = value.lower()
-        except Exception:
-            pass
-    
-    if not skip_dirs:
-        skip_dirs = {
-            "new folder", "nieuwe map", "extra", "extra's", "extras", "featurettes", "bonus", "bonusmaterial", "bonus_material",
-            "behindthescenes", "behind_the_scenes", "deletedscenes", "deleted_scenes",
-            "interviews", "makingof", "making_of", "scenes", "trailer", "trailers",
-            "sample", "samples", "other", "misc", "specials", "special_features",
-            "documentary", "docs", "docu", "promo", "promos", "bloopers", "outtakes"
-        }
-    
-    if extras_folder_name:
-        skip_dirs.add(extras_folder_name)
-    elif 'extras' not in skip_dirs:
-        skip_dirs.add('extras')
-    
-    return skip_dirs
+    row = index.execute("SELECT mtime_ns, dirs, files FROM folders WHERE path = ?", (folder,)).fetchone()
+    if row and row[0] == mtime_ns:
+        return json.loads(row[1]), json.loads(row[2])
+    
+    dirnames, filenames = [], []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                (dirnames if is_dir else filenames).append(entry.name)
+    except OSError:
+        return None
+    
+    if row:
+        for name in set(json.loads(row[1])) - set(dirnames):
+            forget_library_folder(os.path.join(folder, name), index)
+        index.executemany("DELETE FROM probes WHERE path = ?",
+                          [(os.path.join(folder, name),) for name in set(json.loads(row[2])) - set(filenames)])
+    # A folder changed within the last few seconds could change again without its modification time moving on,
+    # so its listing is stored without a time and read from disk again next walk.
+    if time.time_ns() - mtime_ns < 2_000_000_000:
+        mtime_ns = None
+    index.execute("INSERT OR REPLACE INTO folders (path, mtime_ns, dirs, files) VALUES (?, ?, ?, ?)",
+                  (folder, mtime_ns, json.dumps(dirnames), json.dumps(filenames)))
+    return dirnames, filenames
+
+def walk_library(directory):
+    """Walk a directory top-down like os.walk, taking the listing of unchanged folders from the library index.
+    
+    Every folder is still stat'ed to see whether it changed, but only changed folders are listed again.
+    Like with os.walk, the yielded dirnames can be pruned in place to skip subfolders.
+    """
+    index = get_library_index()
+    stack = [str(directory)]
+    try:
+        while stack:
+            folder = stack.pop()
+            listing = list_library_folder(folder, index)
+            if listing is None:
+                continue
+            dirnames, filenames = listing
+            yield folder, dirnames, filenames
+            for name in reversed(dirnames):
+                path = os.path.join(folder, name)
+                if not os.path.islink(path):
+                    stack.append(path)
+    finally:
+        index.commit()
 
 def find_videos_in_directory(directory, config_path=None):
     """Find all video files in directory while respecting skip_dirs config."""
@@ -444,8 +673,7 @@ def find_videos_in_directory(directory, config_path=None):
     if direct_videos:
         videos = [str(f) for f in direct_videos]
     else:
-        import os
-        for dirpath, dirnames, filenames in os.walk(directory):
+        for dirpath, dirnames, filenames in walk_library(directory):
             dirnames[:] = [d for d in dirnames if d.lower() not in skip_dirs]
             
             for filename in filenames:
@@ -494,25 +722,37 @@ def scan_subtitle_files_for_cleaning(directory=None, show_progress=True):
     return results
 
 def clean_up_backup_directory():
-    """Clean up empty backup subdirectories and provide backup management."""
+    """Forget the backups of subtitles that were deleted or renamed, then remove the backup blobs no subtitle refers to
+    anymore, the blob folders they leave empty and empty folders of the old backup layout."""
     backup_dir = get_centralized_backup_directory()
-    
-    if not backup_dir.exists():
-        return 0, 0
-    
-    total_backups = 0
-    empty_dirs_removed = 0
+    index = get_backup_index()
+    
+    gone = [(path,) for (path,) in index.execute("SELECT path FROM backups UNION SELECT path FROM cleaning_manifest")
+            if not os.path.exists(path)]
+    index.executemany("DELETE FROM backups WHERE path = ?", gone)
+    index.executemany("DELETE FROM cleaning_manifest WHERE path = ?", gone)
+    index.commit()
+    
+    referenced = {row[0] for row in index.execute("SELECT blob FROM backups")}
+    removed = 0
+    
+    objects_dir = backup_dir / "objects"
+    if objects_dir.exists():
+        for blob_path in objects_dir.glob("*/*.xz"):
+            if blob_path.name[:-len(".xz")] not in referenced:
+                blob_path.unlink()
+                removed += 1
+        for shard in objects_dir.iterdir():
+            if shard.is_dir() and not any(shard.iterdir()):
+                shard.rmdir()
+                removed += 1
     
     for subfolder in backup_dir.iterdir():
-        if subfolder.is_dir():
-            backup_files = list(subfolder.glob("*"))
-            if not backup_files:
-                subfolder.rmdir()
-                empty_dirs_removed += 1
-            else:
-                total_backups += len([f for f in backup_files if f.suffix in ('.srt', '.json')])
+        if subfolder.is_dir() and not any(subfolder.iterdir()):
+            subfolder.rmdir()
+            removed += 1
     
-    return total_backups, empty_dirs_removed
+    return len(referenced), removed
 
 def get_centralized_backup_directory():
     """Get the centralized backup directory in the Subservient data folder."""
@@ -521,133 +761,251 @@ def get_centralized_backup_directory():
     backup_dir.mkdir(parents=True, exist_ok=True)
     return backup_dir
 
-def get_backup_file_path(subtitle_file_path, file_type="original"):
-    """Get the path for a backup file in the centralized backup directory."""
-    subtitle_file = Path(subtitle_file_path)
-    backup_dir = get_centralized_backup_directory()
-    
+CHANGE_JOURNAL_VERSION = 2
+_backup_index = None
+_legacy_backup_folders = None
+
+def get_backup_index():
+    """Open the backup index once per session; it maps each subtitle path to its original's blob and change journal,
+    and to how it was last cleaned."""
+    global _backup_index
+    if _backup_index is None:
+        import sqlite3
+        index = sqlite3.connect(str(get_centralized_backup_directory() / "index.db"))
+        index.execute("CREATE TABLE IF NOT EXISTS backups (path TEXT PRIMARY KEY, blob TEXT NOT NULL, changes TEXT)")
+        index.execute("CREATE TABLE IF NOT EXISTS cleaning_manifest (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+                      "content_hash TEXT, profile_hash TEXT, config_hash TEXT, success INTEGER, message TEXT)")
+        index.commit()
+        _backup_index = index
+    return _backup_index
+
+def get_backup_blob_path(digest):
+    """Get the path of a compressed backup blob from the SHA-256 of its content."""
+    return get_centralized_backup_directory() / "objects" / digest[:2] / f"{digest}.xz"
+
+def store_backup_blob(data):
+    """Store subtitle bytes compressed under their SHA-256, once no matter how many subtitles share them."""
     import hashlib
-    absolute_parent = subtitle_file.parent.resolve()
-    video_dir_hash = hashlib.md5(str(absolute_parent).encode()).hexdigest()[-8:]
-    video_dir_name = absolute_parent.name
-    subfolder_name = f"{video_dir_name}_{video_dir_hash}"
-    
-    subfolder = backup_dir / subfolder_name
-    subfolder.mkdir(exist_ok=True)
-    
-    if file_type == "original":
-        return subfolder / f"{subtitle_file.stem}_original.srt"
-    elif file_type == "changes":
-        return subfolder / f"{subtitle_file.stem}_changes.json"
-    else:
-        return subfolder / f"{subtitle_file.stem}_{file_type}"
+    import lzma
+    
+    digest = hashlib.sha256(data).hexdigest()
+    blob_path = get_backup_blob_path(digest)
+    if not blob_path.exists():
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = blob_path.with_suffix(".tmp")
+        temp_path.write_bytes(lzma.compress(data))
+        os.replace(temp_path, blob_path)
+    return digest
 
-def find_backup_file_with_fallback(subtitle_file_path, file_type="original"):
-    """Find backup file, checking both new and old backup folder naming schemes."""
-    subtitle_file = Path(subtitle_file_path)
-    backup_dir = get_centralized_backup_directory()
-    
-    primary_path = get_backup_file_path(subtitle_file_path, file_type)
-    if primary_path.exists():
-        return primary_path
+def read_backup_blob(digest):
+    """Read the subtitle bytes stored under a SHA-256."""
+    import lzma
+    return lzma.decompress(get_backup_blob_path(digest).read_bytes())
+
+def get_backup_record(subtitle_file_path):
+    """Get (blob, changes) of a subtitle's backup or None, moving backups of the old folder layout into the store on first use."""
+    key = str(Path(subtitle_file_path).resolve())
+    record = get_backup_index().execute("SELECT blob, changes FROM backups WHERE path = ?", (key,)).fetchone()
+    if record is None:
+        record = import_legacy_backup(subtitle_file_path)
+    return record
+
+def has_subtitle_changes(subtitle_file_path):
+    """Check if a subtitle file has a change journal that can be undone."""
+    record = get_backup_record(subtitle_file_path)
+    return bool(record and record[1])
+
+def backup_original_subtitle(subtitle_file_path):
+    """Keep the current content of a subtitle file as its original, unless an original was kept before."""
+    if get_backup_record(subtitle_file_path) is not None:
+        return
+    digest = store_backup_blob(Path(subtitle_file_path).read_bytes())
+    index = get_backup_index()
+    index.execute("INSERT INTO backups (path, blob) VALUES (?, ?)", (str(Path(subtitle_file_path).resolve()), digest))
+    index.commit()
+
+def set_subtitle_changes(subtitle_file_path, changes):
+    """Replace the change journal text of a backed up subtitle, None clears it."""
+    index = get_backup_index()
+    index.execute("UPDATE backups SET changes = ? WHERE path = ?", (changes, str(Path(subtitle_file_path).resolve())))
+    index.commit()
+
+def import_legacy_backup(subtitle_file_path):
+    """Move a backup made in the old one-folder-per-video-directory layout into the store."""
+    global _legacy_backup_folders
+    if _legacy_backup_folders is None:
+        _legacy_backup_folders = {}
+        for folder in get_centralized_backup_directory().iterdir():
+            if folder.is_dir() and folder.name != "objects":
+                _legacy_backup_folders.setdefault(folder.name.rsplit('_', 1)[0], []).append(folder)
     
     import hashlib
+    subtitle_file = Path(subtitle_file_path)
     absolute_parent = subtitle_file.parent.resolve()
-    video_dir_name = absolute_parent.name
-    
-    for folder in backup_dir.iterdir():
-        if folder.is_dir() and folder.name.startswith(f"{video_dir_name}_"):
-            if file_type == "original":
-                fallback_file = folder / f"{subtitle_file.stem}_original.srt"
-            elif file_type == "changes":
-                fallback_file = folder / f"{subtitle_file.stem}_changes.json"
-            else:
-                fallback_file = folder / f"{subtitle_file.stem}_{file_type}"
-            
-            if fallback_file.exists():
-                return fallback_file
-
-    return primary_path
+    primary_name = f"{absolute_parent.name}_{hashlib.md5(str(absolute_parent).encode()).hexdigest()[-8:]}"
+    folders = sorted(_legacy_backup_folders.get(absolute_parent.name, []), key=lambda folder: folder.name != primary_name)
+    
+    for folder in folders:
+        original_file = folder / f"{subtitle_file.stem}_original.srt"
+        if not original_file.exists():
+            continue
+        changes_file = folder / f"{subtitle_file.stem}_changes.json"
+        changes = changes_file.read_text(encoding='utf-8') if changes_file.exists() else None
+        record = (store_backup_blob(original_file.read_bytes()), changes)
+        index = get_backup_index()
+        index.execute("INSERT INTO backups (path, blob, changes) VALUES (?, ?, ?)", (str(subtitle_file.resolve()),) + record)
+        index.commit()
+        original_file.unlink()
+        if changes_file.exists():
+            changes_file.unlink()
+        return record
+    return None
 
 def restore_subtitle_file_completely(subtitle_file_path):
     """Restore a subtitle file completely from backup."""
     subtitle_file = Path(subtitle_file_path)
-    backup_file = find_backup_file_with_fallback(subtitle_file_path, "original")
-    changes_file = find_backup_file_with_fallback(subtitle_file_path, "changes")
+    record = get_backup_record(subtitle_file_path)
     
-    if not backup_file.exists():
+    if record is None:
         return False, f"No backup found for {subtitle_file.name}"
     
     try:
-        shutil.copy2(backup_file, subtitle_file)
-
-        if changes_file.exists():
-            changes_file.unlink()
+        subtitle_file.write_bytes(read_backup_blob(record[0]))
+        # the subtitle is its original again, so the backup is no longer needed; cleaning it again makes a new one.
+        key = str(subtitle_file.resolve())
+        index = get_backup_index()
+        index.execute("DELETE FROM backups WHERE path = ?", (key,))
+        index.execute("DELETE FROM cleaning_manifest WHERE path = ?", (key,))
+        index.commit()
         
         return True, f"Successfully restored original: {subtitle_file.name}"
     except Exception as e:
         return False, f"Error restoring {subtitle_file.name}: {str(e)}"
 
 def undo_specific_subtitle_changes(subtitle_file_path, change_ids):
-    """Undo specific changes by restoring specific lines."""
+    """Undo specific changes by splicing the journaled blocks back into the subtitle file."""
     subtitle_file = Path(subtitle_file_path)
-    backup_file = find_backup_file_with_fallback(subtitle_file_path, "original")
-    changes_file = find_backup_file_with_fallback(subtitle_file_path, "changes")
     
-    if not backup_file.exists() or not changes_file.exists():
+    if not has_subtitle_changes(subtitle_file_path):
         return False, f"No backup or change log found for {subtitle_file.name}"
     
     try:
-        import json
-        
-        with open(changes_file, 'r', encoding='utf-8') as f:
-            changes_data = json.load(f)
-        
-        with open(backup_file, 'r', encoding='utf-8') as f:
-            original_lines = f.read().strip().split('\n')
-        
-        with open(subtitle_file, 'r', encoding='utf-8') as f:
-            current_lines = f.read().strip().split('\n')
-        
-        lines_to_restore = []
-        for change in changes_data:
-            if change['id'] in change_ids:
-                lines_to_restore.append({
-                    'line_number': change['line_number'],
-                    'content': change['content'],
-                    'context_before': change['context_before'],
-                    'context_after': change['context_after']
-                })
-        
-        if not lines_to_restore:
-            return False, f"No matching changes found to restore"
-        
-        restored_lines = current_lines.copy()
-        
-        for restore_info in sorted(lines_to_restore, key=lambda x: x['line_number']):
-            original_line = restore_info['content']
-            context_before = restore_info['context_before']
-            context_after = restore_info['context_after']
-            
-            best_position = find_best_insertion_point(restored_lines, context_before, context_after)
-            if best_position is not None:
-                restored_lines.insert(best_position, original_line)
-        
-        with open(subtitle_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(restored_lines))
-        
-        remaining_changes = [change for change in changes_data if change['id'] not in change_ids]
-        if remaining_changes:
-            with open(changes_file, 'w', encoding='utf-8') as f:
-                json.dump(remaining_changes, f, ensure_ascii=False, indent=2)
-        else:
-            changes_file.unlink()
-        
-        return True, f"Successfully restored {len(lines_to_restore)} line(s) in {subtitle_file.name}"
-        
+        entries, is_block_journal = load_change_journal(subtitle_file_path)
+        if is_block_journal:
+            return undo_block_changes(subtitle_file, entries, change_ids)
+        return undo_line_changes(subtitle_file, entries, change_ids)
     except Exception as e:
         return False, f"Error restoring changes in {subtitle_file.name}: {str(e)}"
 
+def load_change_journal(subtitle_file_path):
+    """Read a change log, returning (entries, is_block_journal); older logs are a plain list of removed lines."""
+    import json
+    
+    record = get_backup_record(subtitle_file_path)
+    if not record or not record[1]:
+        return [], False
+    data = json.loads(record[1])
+    if isinstance(data, dict) and data.get('version') == CHANGE_JOURNAL_VERSION:
+        return data['entries'], True
+    return data, False
+
+def save_change_journal(subtitle_file_path, entries):
+    """Write the block journal of a cleaned subtitle, or clear it once every change was undone."""
+    import json
+    
+    if all(entry['restored'] for entry in entries):
+        set_subtitle_changes(subtitle_file_path, None)
+        return
+    set_subtitle_changes(subtitle_file_path, json.dumps({'version': CHANGE_JOURNAL_VERSION, 'entries': entries}, ensure_ascii=False))
+
+def split_srt_blocks(content):
+    """Split cleaned .srt content into the text before the first block and a list of [timeframe, text] blocks."""
+    lines = content.split('\n')
+    starts = [i for i in range(len(lines) - 1) if lines[i].strip().isdigit() and '-->' in lines[i + 1]]
+    if not starts:
+        return content, []
+    preamble = ''.join(line + '\n' for line in lines[:starts[0]])
+    blocks = []
+    for start, end in zip(starts, starts[1:] + [len(lines)]):
+        blocks.append([lines[start + 1].strip(), '\n'.join(lines[start + 2:end]).strip()])
+    return preamble, blocks
+
+def join_srt_blocks(preamble, blocks):
+    """Number [timeframe, text] blocks from 1 again and join them the way Subcleaner writes them."""
+    return preamble + ''.join(f"{index}\n{timeframe}\n{text}\n\n" for index, (timeframe, text) in enumerate(blocks, 1))[:-1]
+
+def undo_block_changes(subtitle_file, entries, change_ids):
+    """Put removed blocks back after their kept neighbour and give retimed blocks their old timing back."""
+    with open(subtitle_file, 'r', encoding='utf-8') as f:
+        preamble, blocks = split_srt_blocks(f.read())
+    
+    selected = sorted((entry for entry in entries if entry['id'] in change_ids and not entry['restored']),
+                      key=lambda entry: entry['position'])
+    if not selected:
+        return False, f"No matching changes found to restore"
+    restored_positions = [entry['position'] for entry in entries if entry['restored'] and entry['kind'] == 'removed']
+    
+    for entry in selected:
+        # blocks are numbered as the cleaner left them, shifted by the removed blocks already put back before them.
+        shift = sum(1 for position in restored_positions if position < entry['position'])
+        if entry['kind'] == 'removed':
+            index = entry['previous_index'] + shift
+            if index > len(blocks):
+                return False, f"{subtitle_file.name} changed since it was cleaned, restore the complete original instead"
+            blocks.insert(index, [entry['timeframe'], entry['content']])
+            restored_positions.append(entry['position'])
+        else:
+            index = entry['current_index'] - 1 + shift
+            if index >= len(blocks) or blocks[index][0] != entry['new_timeframe']:
+                return False, f"{subtitle_file.name} changed since it was cleaned, restore the complete original instead"
+            blocks[index][0] = entry['timeframe']
+        entry['restored'] = True
+    
+    with open(subtitle_file, 'w', encoding='utf-8') as f:
+        f.write(join_srt_blocks(preamble, blocks))
+    save_change_journal(subtitle_file, entries)
+    
+    return True, f"Successfully restored {len(selected)} block(s) in {subtitle_file.name}"
+
+def undo_line_changes(subtitle_file, changes_data, change_ids):
+    """Undo changes from a line based change log written by older versions."""
+    import json
+    
+    with open(subtitle_file, 'r', encoding='utf-8') as f:
+        current_lines = f.read().strip().split('\n')
+    
+    lines_to_restore = []
+    for change in changes_data:
+        if change['id'] in change_ids:
+            lines_to_restore.append({
+                'line_number': change['line_number'],
+                'content': change['content'],
+                'context_before': change['context_before'],
+                'context_after': change['context_after']
+            })
+    
+    if not lines_to_restore:
+        return False, f"No matching changes found to restore"
+    
+    restored_lines = current_lines.copy()
+    
+    for restore_info in sorted(lines_to_restore, key=lambda x: x['line_number']):
+        original_line = restore_info['content']
+        context_before = restore_info['context_before']
+        context_after = restore_info['context_after']
+        
+        best_position = find_best_insertion_point(restored_lines, context_before, context_after)
+        if best_position is not None:
+            restored_lines.insert(best_position, original_line)
+    
+    with open(subtitle_file, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(restored_lines))
+    
+    remaining_changes = [change for change in changes_data if change['id'] not in change_ids]
+    set_subtitle_changes(subtitle_file, json.dumps(remaining_changes, ensure_ascii=False) if remaining_changes else None)
+    
+    return True, f"Successfully restored {len(lines_to_restore)} line(s) in {subtitle_file.name}"
+
 def find_best_insertion_point(lines, context_before, context_after):
     """Find the best position to insert a restored line based on context."""
     if not context_before and not context_after:
@@ -676,17 +1034,22 @@ def find_best_insertion_point(lines, context_before, context_after):
 
 def get_subtitle_changes_for_review(subtitle_file_path):
     """Get list of changes made to a subtitle file for review."""
-    changes_file = find_backup_file_with_fallback(subtitle_file_path, "changes")
-    
-    if not changes_file.exists():
-        return []
-    
     try:
-        import json
-        with open(changes_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        entries, is_block_journal = load_change_journal(subtitle_file_path)
     except:
         return []
+    if not is_block_journal:
+        return entries
+    
+    changes = []
+    for entry in entries:
+        if entry['restored']:
+            continue
+        content = entry['content'].replace('\n', ' / ')
+        if entry['kind'] != 'removed':
+            content = f"[timing was {entry['timeframe']}] {content}"
+        changes.append(dict(entry, content=content))
+    return changes
 
 def display_subtitle_restore_menu(subtitle_file_path, video_name):
     """Display menu for restoring subtitle changes."""
@@ -706,7 +1069,7 @@ def display_subtitle_restore_menu(subtitle_file_path, video_name):
         clear_and_print_ascii("                   Subtitle Restore Tool")
         print(f"{Style.BRIGHT}{Fore.BLUE}[Subtitle Restore]{Style.RESET_ALL} {Fore.CYAN}› {clean_video_name} › {subtitle_file.name}{Style.RESET_ALL}\n")
         
-        print(f"{Style.BRIGHT}{Fore.LIGHTCYAN_EX}Removed Content (select to restore):{Style.RESET_ALL}")
+        print(f"{Style.BRIGHT}{Fore.LIGHTCYAN_EX}Removed Content and Timing Changes (select to restore):{Style.RESET_ALL}")
         for change in changes:
             content = change['content']
             if len(content) > 80:
@@ -851,6 +1214,25 @@ def display_subtitle_list_for_video(video_path, video_name, subtitle_files):
         except ValueError:
             print(f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}")
 
+_subcleaner_api = None
+
+def get_subcleaner_api():
+    """Import the integrated Subcleaner once per session so its regex and language profiles stay loaded."""
+    global _subcleaner_api
+    if _subcleaner_api is None:
+        import sys
+        subcleaner_path = get_subservient_folder() / "data" / "subcleaner-master"
+        if not (subcleaner_path / "subcleaner.py").exists():
+            raise FileNotFoundError(f"Subcleaner script not found at: {subcleaner_path / 'subcleaner.py'}")
+        if str(subcleaner_path) not in sys.path:
+            sys.path.insert(0, str(subcleaner_path))
+        try:
+            from libs.subcleaner import api
+        except SystemExit:
+            raise RuntimeError("Subcleaner could not load its configuration or regex profiles")
+        _subcleaner_api = api
+    return _subcleaner_api
+
 def clean_subtitle_file_with_subcleaner(subtitle_file_path):
     """Clean a single subtitle file using the integrated Subcleaner."""
     subtitle_file = Path(subtitle_file_path)
@@ -862,73 +1244,36 @@ def clean_subtitle_file_with_subcleaner(subtitle_file_path):
         return False, f"Only .srt files are supported for cleaning. File: {subtitle_file.name}"
     
     try:
-        import subprocess
-        import sys
-        import tempfile
-        import shutil
-        import json
-        
-        subservient_folder = get_subservient_folder()
-        subcleaner_path = subservient_folder / "data" / "subcleaner-master"
-        subcleaner_script = subcleaner_path / "subcleaner.py"
-        
-        if not subcleaner_script.exists():
-            return False, f"Subcleaner script not found at: {subcleaner_script}"
-        
-        backup_file = get_backup_file_path(subtitle_file_path, "original")
-        changes_file = get_backup_file_path(subtitle_file_path, "changes")
-        
-        if not backup_file.exists():
-            shutil.copy2(subtitle_file, backup_file)
-        
-        with open(subtitle_file, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        try:
+            subcleaner = get_subcleaner_api()
+        except (FileNotFoundError, RuntimeError) as e:
+            return False, str(e)
         
-        cmd = [sys.executable, str(subcleaner_script), str(subtitle_file)]
+        backup_original_subtitle(subtitle_file)
         
-        result = subprocess.run(
-            cmd,
-            cwd=str(subcleaner_path),
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        start = time.perf_counter()
+        result = subcleaner.clean_subtitle(subtitle_file)
+        metrics.record("subcleaner", time.perf_counter() - start, 0 if result.success else 1, subtitle_file.stat().st_size)
         
-        if result.returncode == 0:
-            with open(subtitle_file, 'r', encoding='utf-8') as f:
-                cleaned_content = f.read()
-            
-            original_lines = original_content.strip().split('\n')
-            cleaned_lines = cleaned_content.strip().split('\n')
-            
+        if result.success:
             removed_lines = []
-            changes_data = []
-            original_set = set(original_lines)
-            cleaned_set = set(cleaned_lines)
-            
-            for i, line in enumerate(original_lines):
-                line_stripped = line.strip()
-                if line_stripped and line_stripped not in cleaned_set:
-                    if not line_stripped.isdigit() and '-->' not in line_stripped:
-                        change_info = {
-                            "id": len(changes_data) + 1,
-                            "line_number": i + 1,
-                            "content": line_stripped,
-                            "context_before": original_lines[max(0, i-1):i] if i > 0 else [],
-                            "context_after": original_lines[i+1:min(len(original_lines), i+2)] if i < len(original_lines)-1 else []
-                        }
-                        changes_data.append(change_info)
-                        
-                        display_content = line_stripped
+            if result.changed and result.journal:
+                entries = [dict(entry.to_json(), id=change_id, restored=False)
+                           for change_id, entry in enumerate(result.journal, 1)]
+                save_change_journal(subtitle_file, entries)
+                
+                for entry in result.journal:
+                    if entry.kind != 'removed':
+                        continue
+                    for line in entry.content.split('\n'):
+                        display_content = line.strip()
+                        if not display_content:
+                            continue
                         if len(display_content) > 60:
                             display_content = display_content[:57] + "..."
                         if display_content not in removed_lines:
                             removed_lines.append(display_content)
             
-            if changes_data:
-                with open(changes_file, 'w', encoding='utf-8') as f:
-                    json.dump(changes_data, f, ensure_ascii=False, indent=2)
-            
             base_message = f"Successfully cleaned: {subtitle_file.name}"
             if removed_lines:
                 removed_text = f"\n{Fore.LIGHTBLACK_EX}  Removed content:{Style.RESET_ALL}"
@@ -941,14 +1286,53 @@ def clean_subtitle_file_with_subcleaner(subtitle_file_path):
             else:
                 return True, base_message + f"\n{Fore.LIGHTBLACK_EX}  No unwanted content found to remove{Style.RESET_ALL}"
         else:
-            error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-            return False, f"Failed to clean {subtitle_file.name}: {error_msg}"
+            return False, f"Failed to clean {subtitle_file.name}: {result.error}"
             
-    except subprocess.TimeoutExpired:
-        return False, f"Timeout while cleaning {subtitle_file.name}"
     except Exception as e:
         return False, f"Error cleaning {subtitle_file.name}: {str(e)}"
 
+def get_cleaning_fingerprint():
+    """Hash Subcleaner's regex profiles and config, which together decide what cleaning a subtitle does."""
+    import hashlib
+    
+    config = get_subcleaner_api().config
+    regex_dir = Path(config.regex_dir)
+    profiles = hashlib.sha256()
+    if regex_dir.exists():
+        for profile_file in sorted(regex_dir.rglob("*.conf")):
+            profiles.update(str(profile_file.relative_to(regex_dir)).encode())
+            profiles.update(profile_file.read_bytes())
+    config_file = Path(config.config_file)
+    config_hash = hashlib.sha256(config_file.read_bytes() if config_file.exists() else b"").hexdigest()
+    return profiles.hexdigest(), config_hash
+
+def get_current_cleaning_result(subtitle_file, fingerprint):
+    """Return the result message of a subtitle cleaned successfully before with the same content, regex profiles and config,
+    or None when it has to be cleaned (again)."""
+    import hashlib
+    
+    subtitle_file = Path(subtitle_file)
+    record = get_backup_index().execute(
+        "SELECT size, mtime_ns, content_hash, profile_hash, config_hash, success, message FROM cleaning_manifest WHERE path = ?",
+        (str(subtitle_file.resolve()),)).fetchone()
+    if record is None or not record[5] or (record[3], record[4]) != fingerprint:
+        return None
+    stat = subtitle_file.stat()
+    if (stat.st_size, stat.st_mtime_ns) == (record[0], record[1]):
+        return record[6]
+    return record[6] if hashlib.sha256(subtitle_file.read_bytes()).hexdigest() == record[2] else None
+
+def record_subtitle_cleaning(subtitle_file, fingerprint, success, message):
+    """Remember the content a subtitle was left with by cleaning; committed by the caller in batches."""
+    import hashlib
+    
+    subtitle_file = Path(subtitle_file)
+    stat = subtitle_file.stat()
+    content_hash = hashlib.sha256(subtitle_file.read_bytes()).hexdigest()
+    get_backup_index().execute(
+        "INSERT OR REPLACE INTO cleaning_manifest VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (str(subtitle_file.resolve()), stat.st_size, stat.st_mtime_ns, content_hash) + tuple(fingerprint) + (int(success), message))
+
 def run_subtitle_cleaning_interface():
     """Main interface for subtitle cleaning functionality."""
     while True:
@@ -980,11 +1364,33 @@ def run_subtitle_cleaning_interface():
             processed = 0
             successful = 0
             failed = 0
+            unchanged = 0
+            
+            try:
+                fingerprint = get_cleaning_fingerprint()
+            except (FileNotFoundError, RuntimeError) as e:
+                print(f"{Fore.RED}✗ {e}{Style.RESET_ALL}")
+                input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL} ")
+                continue
             
             for video_path, video_name, subtitle_files in scan_results:
+                # files cleaned before with the same content, regex profiles and config would come out the same.
+                pending_files = []
+                unchanged_files = []
+                for subtitle_file in subtitle_files:
+                    last_result = get_current_cleaning_result(subtitle_file, fingerprint)
+                    if last_result is None:
+                        pending_files.append(subtitle_file)
+                    else:
+                        unchanged_files.append((subtitle_file, last_result))
+                unchanged += len(unchanged_files)
+                processed += len(unchanged_files)
+                
                 clean_video_name = clean_display_name(video_name)
                 print(f"{Fore.CYAN}Processing: {clean_video_name}{Style.RESET_ALL}")
-                for subtitle_file in subtitle_files:
+                for subtitle_file, last_result in unchanged_files:
+                    print(f"  {Fore.LIGHTBLACK_EX}Unchanged since last cleaned: {subtitle_file.name} ({last_result}){Style.RESET_ALL}")
+                for subtitle_file in pending_files:
                     processed += 1
                     print(f"  [{processed}/{total_files}] Cleaning {subtitle_file.name}...")
                     success, message = clean_subtitle_file_with_subcleaner(subtitle_file)
@@ -994,10 +1400,13 @@ def run_subtitle_cleaning_interface():
                     else:
                         failed += 1
                         print(f"    {Fore.RED}✗ {message}{Style.RESET_ALL}")
-                    time.sleep(0.1)
+                    if subtitle_file.exists():
+                        record_subtitle_cleaning(subtitle_file, fingerprint, success, message)
+                get_backup_index().commit()
             
             print(f"\n{Style.BRIGHT}{Fore.CYAN}Cleaning completed!{Style.RESET_ALL}")
             print(f"Total files processed: {processed}")
+            print(f"{Fore.LIGHTBLACK_EX}Unchanged since they were last cleaned: {unchanged}{Style.RESET_ALL}")
             print(f"{Fore.GREEN}Successfully cleaned: {successful}{Style.RESET_ALL}")
             print(f"{Fore.RED}Failed: {failed}{Style.RESET_ALL}")
             input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL} ")
@@ -1027,7 +1436,6 @@ def run_subtitle_cleaning_interface():
                         else:
                             failed += 1
                             print(f"    {Fore.RED}✗ {message}{Style.RESET_ALL}")
-                        time.sleep(0.1)
                     
                     clean_video_name = clean_display_name(video_name)
                     print(f"\n{Style.BRIGHT}{Fore.CYAN}Cleaning completed for {clean_video_name}!{Style.RESET_ALL}")
@@ -1071,6 +1479,13 @@ def run_subtitle_restore_interface():
         
         if choice == 'back':
             return
+        elif choice == 'cleanup':
+            clear_and_print_ascii("                   Subtitle Restore Tool")
+            kept, removed = clean_up_backup_directory()
+            print(f"{Fore.GREEN}Backups cleaned up.{Style.RESET_ALL}")
+            print(f"Backups kept: {kept}")
+            print(f"{Fore.LIGHTBLACK_EX}Unused backup files and folders removed: {removed}{Style.RESET_ALL}")
+            input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL} ")
         elif isinstance(choice, int):
             video_path, video_name, subtitle_files = scan_results[choice]
             
@@ -1114,13 +1529,7 @@ def display_video_list_for_restore(scan_results, scan_directory=None):
     
     def has_backups(subtitle_files):
         """Check if any subtitle files have backups."""
-        for subtitle_file in subtitle_files:
-            changes_file = find_backup_file_with_fallback(str(subtitle_file), "changes")
-            backup_file = find_backup_file_with_fallback(str(subtitle_file), "original")
-            
-            if changes_file.exists() or backup_file.exists():
-                return True
-        return False
+        return any(get_backup_record(subtitle_file) is not None for subtitle_file in subtitle_files)
     
     print(f"{Style.BRIGHT}{Fore.LIGHTCYAN_EX}Videos:{Style.RESET_ALL}")
     for idx, (video_path, video_name, subtitle_files) in enumerate(scan_results, 1):
@@ -1135,19 +1544,22 @@ def display_video_list_for_restore(scan_results, scan_directory=None):
         print(f"  {Fore.BLUE}{idx:2}{Style.RESET_ALL} = {Fore.GREEN}{highlighted_name}{Style.RESET_ALL} {Fore.WHITE}({subtitle_count} subtitle file{'s' if subtitle_count != 1 else ''}){Fore.LIGHTYELLOW_EX}{lang_info}{Style.RESET_ALL}{backup_indicator}")
     
     print(f"\n{Style.BRIGHT}{Fore.LIGHTCYAN_EX}Actions:{Style.RESET_ALL}")
-    print(f"  {Fore.BLUE}{len(scan_results) + 1:2}{Style.RESET_ALL} = {Fore.LIGHTRED_EX}Return to subtitle tools menu{Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}{len(scan_results) + 1:2}{Style.RESET_ALL} = {Fore.WHITE}Clean up backups{Style.RESET_ALL} {Fore.LIGHTBLACK_EX}(of deleted, renamed or fully restored subtitles){Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}{len(scan_results) + 2:2}{Style.RESET_ALL} = {Fore.LIGHTRED_EX}Return to subtitle tools menu{Style.RESET_ALL}")
     
     while True:
         try:
-            choice = input(f"\n{Fore.LIGHTYELLOW_EX}Select a video or action (1-{len(scan_results) + 1}):{Style.RESET_ALL} ").strip()
+            choice = input(f"\n{Fore.LIGHTYELLOW_EX}Select a video or action (1-{len(scan_results) + 2}):{Style.RESET_ALL} ").strip()
             choice_num = int(choice)
             
             if 1 <= choice_num <= len(scan_results):
                 return choice_num - 1
             elif choice_num == len(scan_results) + 1:
+                return 'cleanup'
+            elif choice_num == len(scan_results) + 2:
                 return 'back'
             else:
-                print(f"{Fore.RED}Invalid choice. Please select 1-{len(scan_results) + 1}.{Style.RESET_ALL}")
+                print(f"{Fore.RED}Invalid choice. Please select 1-{len(scan_results) + 2}.{Style.RESET_ALL}")
         except ValueError:
             print(f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}")
 
@@ -1164,8 +1576,7 @@ def display_subtitle_list_for_restore(video_path, video_name, subtitle_files):
     
     def has_changes(subtitle_file):
         """Check if a subtitle file has changes that can be restored."""
-        changes_file = find_backup_file_with_fallback(str(subtitle_file), "changes")
-        return changes_file.exists()
+        return has_subtitle_changes(subtitle_file)
     
     clean_video_name = clean_display_name(video_name)
     highlighted_video_name = highlight_languages_in_filename(clean_video_name)